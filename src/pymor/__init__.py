@@ -4,12 +4,8 @@
 
 import os
 
-# this solves sporadic mpi calls happening after finalize
-try:
-    import petsc4py
-    petsc4py.init()
-except ImportError:
-    pass
+# import first, such that all subsequent imports are profiled if PYMOR_PROFILE_STARTUP is set
+from pymor.tools import startup_profiler
 
 from pymor.core.config import config
 from pymor.core.defaults import load_defaults_from_file
@@ -18,6 +14,8 @@ from pymor.core.defaults import load_defaults_from_file
 if 'PYMOR_DEB_VERSION' in os.environ:
     revstring = os.environ['PYMOR_DEB_VERSION']
 else:
+    # in build directories and sdists, versioneer replaces version.py by a static
+    # version file, such that git is only called for source checkouts
     import pymor.version as _version
     revstring = _version.get_versions()['version']
 
@@ -117,7 +117,7 @@ def adaptive_greedy(discretization, reductor, parameter_space=None,
     if pool is None or pool is dummy_pool:
         pool = dummy_pool
     else:
-        logger.info('Using pool of {} workers for parallel greedy search'.format(len(pool)))
+        logger.info('Using pool of {} workers for parallel greedy search', len(pool))
 
     with RemoteObjectManager() as rom:
         # Push everything we need during the greedy search to the workers.
@@ -140,8 +140,8 @@ def adaptive_greedy(discretization, reductor, parameter_space=None,
             validation_set = parameter_space.sample_randomly(validation_mus)
         if visualize and sample_set.dim not in (2, 3):
             raise NotImplementedError
-        logger.info('Training set size: {}. Validation set size: {}'
-                    .format(len(sample_set.vertex_mus), len(validation_set)))
+        logger.info('Training set size: {}. Validation set size: {}',
+                    len(sample_set.vertex_mus), len(validation_set))
 
         extensions = 0
         max_errs = []
@@ -163,14 +163,14 @@ def adaptive_greedy(discretization, reductor, parameter_space=None,
                     errors = estimate(sample_set.vertex_mus)
                 max_err_ind = np.argmax(errors)
                 max_err, max_err_mu = errors[max_err_ind], sample_set.vertex_mus[max_err_ind]
-                logger.info('Maximum error after {} extensions: {} (mu = {})'.format(extensions, max_err, max_err_mu))
+                logger.info('Maximum error after {} extensions: {} (mu = {})', extensions, max_err, max_err_mu)
 
                 # estimate on validation set
                 val_errors = estimate(validation_set)
                 max_val_err_ind = np.argmax(val_errors)
                 max_val_err, max_val_err_mu = val_errors[max_val_err_ind], validation_set[max_val_err_ind]
-                logger.info('Maximum validation error: {}'.format(max_val_err))
-                logger.info('Validation error to training error ratio: {:.3e}'.format(max_val_err / max_err))
+                logger.info('Maximum validation error: {}', max_val_err)
+                logger.info('Validation error to training error ratio: {:.3e}', max_val_err / max_err)
 
                 if max_val_err >= max_err * rho:  # overfitting?
 
@@ -189,7 +189,7 @@ def adaptive_greedy(discretization, reductor, parameter_space=None,
                     # select elements
                     sorted_indicators_inds = np.argsort(indicators)[::-1]
                     refinement_elements = sorted_indicators_inds[:max(int(len(sorted_indicators_inds) * theta), 1)]
-                    logger.info('Refining {} elements: {}'.format(len(refinement_elements), refinement_elements))
+                    logger.info('Refining {} elements: {}', len(refinement_elements), refinement_elements)
 
                     # visualization
                     if visualize:
@@ -232,9 +232,9 @@ def adaptive_greedy(discretization, reductor, parameter_space=None,
                     if validation_mus <= 0:
                         validation_set = sample_set.center_mus + parameter_space.sample_randomly(-validation_mus)
 
-                    logger.info('New training set size: {}. New validation set size: {}'
-                                .format(len(sample_set.vertex_mus), len(validation_set)))
-                    logger.info('Number of refinements: {}'.format(sample_set.refinement_count))
+                    logger.info('New training set size: {}. New validation set size: {}',
+                                len(sample_set.vertex_mus), len(validation_set))
+                    logger.info('Number of refinements: {}', sample_set.refinement_count)
                     logger.info('')
                 else:
                     break  # no overfitting, leave the refinement loop
@@ -248,11 +248,11 @@ def adaptive_greedy(discretization, reductor, parameter_space=None,
 
             # break if traget error reached
             if target_error is not None and max_err <= target_error:
-                logger.info('Reached maximal error on snapshots of {} <= {}'.format(max_err, target_error))
+                logger.info('Reached maximal error on snapshots of {} <= {}', max_err, target_error)
                 break
 
             # basis extension
-            with logger.block('Computing solution snapshot for mu = {} ...'.format(max_err_mu)):
+            with logger.block('Computing solution snapshot for mu = {} ...', max_err_mu):
                 U = d.solve(max_err_mu)
             with logger.block('Extending basis with solution snapshot ...'):
                 try:
@@ -266,13 +266,13 @@ def adaptive_greedy(discretization, reductor, parameter_space=None,
 
             # break if prescribed basis size reached
             if max_extensions is not None and extensions >= max_extensions:
-                logger.info('Maximum number of {} extensions reached.'.format(max_extensions))
+                logger.info('Maximum number of {} extensions reached.', max_extensions)
                 with logger.block('Reducing once more ...'):
                     rd = reductor.reduce()
                 break
 
     tictoc = time.time() - tic
-    logger.info('Greedy search took {} seconds'.format(tictoc))
+    logger.info('Greedy search took {} seconds', tictoc)
     return {'reduced_discretization': rd,
             'max_errs': max_errs, 'max_err_mus': max_err_mus, 'extensions': extensions,
             'max_val_errs': max_val_errs, 'max_val_err_mus': max_val_err_mus,
@@ -9,6 +9,7 @@ import numpy as np
 
 from pymor.core.defaults import defaults
 from pymor.operators.constructions import induced_norm
+from pymor.vectorarrays.numpy import NumpyVectorSpace
 
 
 @defaults('rtol', 'atol')
@@ -67,3 +68,56 @@ def almost_equal(U, V, product=None, norm=None, rtol=1e-14, atol=1e-14):
     ERR_norm = norm(X)
 
     return ERR_norm <= atol + V_norm * rtol
+
+
+@defaults('block_size')
+def project_out(U, basis, product=None, block_size=64):
+    """Subtract the orthogonal projection onto the span of `basis` from `U`.
+
+    Computes `U - basis.lincomb(U.dot(basis))` (resp. with `product.apply2(U, basis)`
+    as coefficients), assuming that `basis` is orthonormal. For |NumpyVectorArrays|,
+    `U` is processed in blocks of `block_size` vectors: the coefficients of a block
+    are computed and the linear combination is subtracted while the block is still
+    in cache. For real data, the subtraction is performed in place on a copy of `U`
+    by a single BLAS call per block, and no further temporary array of the size of
+    `U` is allocated. `product` is applied only once to `basis`.
+
+    Parameters
+    ----------
+    U
+        The |VectorArray| to project.
+    basis
+        The orthonormal basis |VectorArray| of the subspace to project out.
+    product
+        The inner product |Operator| w.r.t. which `basis` is orthonormal.
+        If `None`, the Euclidean product is used.
+    block_size
+        Number of vectors of `U` processed at once.
+
+    Returns
+    -------
+    A |VectorArray| containing the projection errors.
+    """
+    assert basis in U.space
+
+    if not isinstance(U.space, NumpyVectorSpace) or len(U) == 0 or len(basis) == 0:
+        coefficients = U.dot(basis) if product is None else product.apply2(U, basis)
+        return U - basis.lincomb(coefficients)
+
+    B = basis.data
+    PB = B if product is None else product.apply(basis).data
+    PB_H = PB.conj().T if np.iscomplexobj(PB) else PB.T
+    R = np.array(U.data, dtype=np.result_type(U.data.dtype, B.dtype, PB.dtype))
+    gemm = None
+    if R.dtype in (np.float32, np.float64) and B.dtype == R.dtype:
+        from scipy.linalg.blas import get_blas_funcs
+        gemm = get_blas_funcs('gemm', (R,))
+    for i in range(0, len(R), block_size):
+        R_block = R[i:i + block_size]
+        coefficients = R_block.dot(PB_H)
+        if gemm is not None:
+            # R_block.T is Fortran-contiguous, so gemm updates R in place
+            gemm(-1., B.T, coefficients.astype(R.dtype, copy=False).T, beta=1., c=R_block.T, overwrite_c=True)
+        else:
+            R_block -= coefficients.dot(B)
+    return U.space.make_array(R)
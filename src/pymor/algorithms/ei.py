@@ -102,12 +102,12 @@ def ei_greedy(U, error_norm=None, atol=None, rtol=None, max_interpolation_dofs=N
     while True:
         if max_interpolation_dofs is not None and len(interpolation_dofs) >= max_interpolation_dofs:
             logger.info('Maximum number of interpolation DOFs reached. Stopping extension loop.')
-            logger.info('Final maximum interpolation error with {} interpolation DOFs: {}'.format(
-                len(interpolation_dofs), max_err))
+            logger.info('Final maximum interpolation error with {} interpolation DOFs: {}',
+                        len(interpolation_dofs), max_err)
             break
 
-        logger.info('Maximum interpolation error with {} interpolation DOFs: {}'
-                    .format(len(interpolation_dofs), max_err))
+        logger.info('Maximum interpolation error with {} interpolation DOFs: {}',
+                    len(interpolation_dofs), max_err)
 
         if atol is not None and max_err <= atol:
             logger.info('Absolute error tolerance reached! Stopping extension loop.')
@@ -121,12 +121,12 @@ def ei_greedy(U, error_norm=None, atol=None, rtol=None, max_interpolation_dofs=N
         new_vec = U[max_err_ind].copy()
         new_dof = new_vec.amax()[0][0]
         if new_dof in interpolation_dofs:
-            logger.info('DOF {} selected twice for interplation! Stopping extension loop.'.format(new_dof))
+            logger.info('DOF {} selected twice for interplation! Stopping extension loop.', new_dof)
             break
         new_dof_value = new_vec.components([new_dof])[0, 0]
         if new_dof_value == 0.:
-            logger.info('DOF {} selected for interpolation has zero maximum error! Stopping extension loop.'
-                        .format(new_dof))
+            logger.info('DOF {} selected for interpolation has zero maximum error! Stopping extension loop.',
+                        new_dof)
             break
         new_vec *= 1 / new_dof_value
         interpolation_dofs = np.hstack((interpolation_dofs, new_dof))
@@ -146,8 +146,8 @@ def ei_greedy(U, error_norm=None, atol=None, rtol=None, max_interpolation_dofs=N
         triangularity_errs.append(np.max(triangularity_errors[:d, :d]))
 
     if len(triangularity_errs) > 0:
-        logger.info('Interpolation matrix is not lower triangular with maximum error of {}'
-                    .format(triangularity_errs[-1]))
+        logger.info('Interpolation matrix is not lower triangular with maximum error of {}',
+                    triangularity_errs[-1])
 
     data = {'errors': max_errs, 'triangularity_errors': triangularity_errs}
 
@@ -212,13 +212,13 @@ def deim(U, modes=None, error_norm=None, product=None):
 
         err = np.max(ERR.l2_norm() if error_norm is None else error_norm(ERR))
 
-        logger.info('Interpolation error for basis vector {}: {}'.format(i, err))
+        logger.info('Interpolation error for basis vector {}: {}', i, err)
 
         # compute new interpolation dof and collateral basis vector
         new_dof = ERR.amax()[0][0]
 
         if new_dof in interpolation_dofs:
-            logger.info('DOF {} selected twice for interplation! Stopping extension loop.'.format(new_dof))
+            logger.info('DOF {} selected twice for interplation! Stopping extension loop.', new_dof)
             break
 
         interpolation_dofs = np.hstack((interpolation_dofs, new_dof))
@@ -292,7 +292,7 @@ def interpolate_operators(discretization, operator_names, parameter_sample, erro
         operators = [discretization.operators[operator_name] for operator_name in operator_names]
         with logger.block('Computing operator evaluations on solution snapshots ...'):
             if pool:
-                logger.info('Using pool of {} workers for parallel evaluation'.format(len(pool)))
+                logger.info('Using pool of {} workers for parallel evaluation', len(pool))
                 evaluations = rom.manage(pool.push(discretization.solution_space.empty()))
                 pool.map(_interpolate_operators_build_evaluations, parameter_sample,
                          d=discretization, operators=operators, evaluations=evaluations)
@@ -330,7 +330,7 @@ def _parallel_ei_greedy(U, pool, error_norm=None, atol=None, rtol=None, max_inte
 
     logger = getLogger('pymor.algorithms.ei.ei_greedy')
     logger.info('Generating Interpolation Data ...')
-    logger.info('Using pool of {} workers for parallel greedy search'.format(len(pool)))
+    logger.info('Using pool of {} workers for parallel greedy search', len(pool))
 
     interpolation_dofs = np.zeros((0,), dtype=np.int32)
     collateral_basis = pool.apply_only(_parallel_ei_greedy_get_empty, 0, U=U)
@@ -348,12 +348,12 @@ def _parallel_ei_greedy(U, pool, error_norm=None, atol=None, rtol=None, max_inte
 
             if max_interpolation_dofs is not None and len(interpolation_dofs) >= max_interpolation_dofs:
                 logger.info('Maximum number of interpolation DOFs reached. Stopping extension loop.')
-                logger.info('Final maximum interpolation error with {} interpolation DOFs: {}'
-                            .format(len(interpolation_dofs), max_err))
+                logger.info('Final maximum interpolation error with {} interpolation DOFs: {}',
+                            len(interpolation_dofs), max_err)
                 break
 
-            logger.info('Maximum interpolation error with {} interpolation DOFs: {}'
-                        .format(len(interpolation_dofs), max_err))
+            logger.info('Maximum interpolation error with {} interpolation DOFs: {}',
+                        len(interpolation_dofs), max_err)
 
             if atol is not None and max_err <= atol:
                 logger.info('Absolute error tolerance reached! Stopping extension loop.')
@@ -367,12 +367,12 @@ def _parallel_ei_greedy(U, pool, error_norm=None, atol=None, rtol=None, max_inte
             new_vec = pool.apply_only(_parallel_ei_greedy_get_vector, max_err_ind, data=distributed_data)
             new_dof = new_vec.amax()[0][0]
             if new_dof in interpolation_dofs:
-                logger.info('DOF {} selected twice for interplation! Stopping extension loop.'.format(new_dof))
+                logger.info('DOF {} selected twice for interplation! Stopping extension loop.', new_dof)
                 break
             new_dof_value = new_vec.components([new_dof])[0, 0]
             if new_dof_value == 0.:
-                logger.info('DOF {} selected for interpolation has zero maximum error! Stopping extension loop.'
-                            .format(new_dof))
+                logger.info('DOF {} selected for interpolation has zero maximum error! Stopping extension loop.',
+                            new_dof)
                 break
             new_vec *= 1 / new_dof_value
             interpolation_dofs = np.hstack((interpolation_dofs, new_dof))
@@ -389,8 +389,8 @@ def _parallel_ei_greedy(U, pool, error_norm=None, atol=None, rtol=None, max_inte
         triangularity_errs.append(np.max(triangularity_errors[:d, :d]))
 
     if len(triangularity_errs) > 0:
-        logger.info('Interpolation matrix is not lower triangular with maximum error of {}'
-                    .format(triangularity_errs[-1]))
+        logger.info('Interpolation matrix is not lower triangular with maximum error of {}',
+                    triangularity_errs[-1])
         logger.info('')
 
     data = {'errors': max_errs, 'triangularity_errors': triangularity_errs}
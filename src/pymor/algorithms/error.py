@@ -172,7 +172,7 @@ def reduction_error_analysis(reduced_discretization, discretization, reductor,
     if pool is None or pool is dummy_pool:
         pool = dummy_pool
     else:
-        logger.info('Using pool of {} workers for error analysis'.format(len(pool)))
+        logger.info('Using pool of {} workers for error analysis', len(pool))
 
     tic = time.time()
 
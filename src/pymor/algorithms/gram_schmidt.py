@@ -10,12 +10,19 @@ from pymor.core.exceptions import AccuracyError
 from pymor.core.logger import getLogger
 
 
-@defaults('atol', 'rtol', 'reiterate', 'reiteration_threshold', 'check', 'check_tol')
+@defaults('atol', 'rtol', 'reiterate', 'reiteration_threshold', 'check', 'check_tol', 'block_size')
 def gram_schmidt(A, product=None, atol=1e-13, rtol=1e-13, offset=0, find_duplicates=True,
                  reiterate=True, reiteration_threshold=1e-1, check=True, check_tol=1e-3,
-                 copy=True):
+                 copy=True, block_size=64):
     """Orthonormalize a |VectorArray| using the stabilized Gram-Schmidt algorithm.
 
+    The vectors are processed in blocks of `block_size` vectors. Each block is
+    first orthogonalized against all previous vectors at once (block classical
+    Gram-Schmidt). Then the vectors of the block are orthogonalized one after
+    the other against the preceding vectors of the block. Vectors whose norm
+    decreases strongly are orthogonalized again against all previous vectors
+    (selective reorthogonalization, CGS2).
+
     Parameters
     ----------
     A
@@ -45,6 +52,8 @@ def gram_schmidt(A, product=None, atol=1e-13, rtol=1e-13, offset=0, find_duplica
         If `True`, create a copy of `A` instead of modifying `A` in-place.
     find_duplicates
         unused
+    block_size
+        Number of vectors which are orthogonalized against the previous vectors at once.
 
 
     Returns
@@ -58,61 +67,53 @@ def gram_schmidt(A, product=None, atol=1e-13, rtol=1e-13, offset=0, find_duplica
         A = A.copy()
 
     # main loop
-    remove = []
-    for i in range(offset, len(A)):
-        # first calculate norm
-        if product is None:
-            initial_norm = A[i].l2_norm()[0]
-        else:
-            initial_norm = np.sqrt(product.pairwise_apply2(A[i], A[i]))[0]
+    remove = set()
+    kept = list(range(offset))
+    for block_start in range(offset, len(A), block_size):
+        block = range(block_start, min(block_start + block_size, len(A)))
+        initial_norms = _norms(A[block.start:block.stop], product)
+
+        # orthogonalize the block to all vectors left of it
+        if kept:
+            basis = _select(A, kept)
+            X = A[block.start:block.stop]
+            X.axpy(-1, basis.lincomb(_coefficients(basis, X, product)))
+
+        for i, initial_norm in zip(block, initial_norms):
+            if initial_norm < atol:
+                logger.info("Removing vector {} of norm {}", i, initial_norm)
+                remove.add(i)
+                continue
+
+            # orthogonalize to the vectors of the block left of it
+            block_kept = [j for j in range(block.start, i) if j not in remove]
+            if block_kept:
+                _project_out(A, i, block_kept, product)
+            old_norm, norm = initial_norm, _norms(A[i], product)[0]
 
-        if initial_norm < atol:
-            logger.info("Removing vector {} of norm {}".format(i, initial_norm))
-            remove.append(i)
-            continue
-
-        if i == 0:
-            A[0].scal(1/initial_norm)
-
-        else:
-            first_iteration = True
-            norm = initial_norm
             # If reiterate is True, reiterate as long as the norm of the vector changes
             # strongly during orthonormalization (due to Andreas Buhr).
-            while first_iteration or reiterate and norm/old_norm < reiteration_threshold:
-
-                if first_iteration:
-                    first_iteration = False
-                else:
-                    logger.info('Orthonormalizing vector {} again'.format(i))
-
-                # orthogonalize to all vectors left
-                for j in range(i):
-                    if j in remove:
-                        continue
-                    if product is None:
-                        p = A[i].pairwise_dot(A[j])[0]
-                    else:
-                        p = product.pairwise_apply2(A[i], A[j])[0]
-                    A[i].axpy(-p, A[j])
-
-                # calculate new norm
-                if product is None:
-                    old_norm, norm = norm, A[i].l2_norm()[0]
-                else:
-                    old_norm, norm = norm, np.sqrt(product.pairwise_apply2(A[i], A[i])[0])
-
+            while reiterate and norm / old_norm < reiteration_threshold:
                 # remove vector if it got too small:
                 if norm / initial_norm < rtol:
-                    logger.info("Removing linear dependent vector {}".format(i))
-                    remove.append(i)
                     break
+                logger.info('Orthonormalizing vector {} again', i)
+                _project_out(A, i, kept + block_kept, product)
+                old_norm, norm = norm, _norms(A[i], product)[0]
+
+            # remove vector if it got too small:
+            if norm / initial_norm < rtol:
+                logger.info("Removing linear dependent vector {}", i)
+                remove.add(i)
+                continue
 
             if norm > 0:
                 A[i].scal(1 / norm)
 
+        kept.extend(j for j in block if j not in remove)
+
     if remove:
-        del A[remove]
+        del A[sorted(remove)]
 
     if check:
         if product:
@@ -128,11 +129,34 @@ def gram_schmidt(A, product=None, atol=1e-13, rtol=1e-13, offset=0, find_duplica
     return A
 
 
+def _norms(U, product):
+    return U.l2_norm() if product is None else np.sqrt(product.pairwise_apply2(U, U).real)
+
+
+def _select(A, ind):
+    """A[ind], using a slice if `ind` is contiguous."""
+    return A[ind[0]:ind[-1] + 1] if ind[-1] - ind[0] == len(ind) - 1 else A[ind]
+
+
+def _coefficients(basis, U, product):
+    """Matrix of the inner products of the vectors in `U` with the vectors in `basis`.
+
+    The product is only applied to `U`.
+    """
+    return (basis.dot(U) if product is None else product.apply2(basis, U)).conj().T
+
+
+def _project_out(A, i, ind, product):
+    basis = _select(A, ind)
+    A[i].axpy(-1, basis.lincomb(_coefficients(basis, A[i], product)))
+
+
 def gram_schmidt_biorth(V, W, product=None, reiterate=True, reiteration_threshold=1e-1, check=True, check_tol=1e-3,
                         copy=True):
     """Biorthonormalize a pair of |VectorArrays| using the biorthonormal Gram-Schmidt process.
 
-    See Algorithm 1 in [BKS11]_.
+    See Algorithm 1 in [BKS11]_. Each vector is projected twice against all
+    previous vectors at once (CGS2).
 
     .. [BKS11]  P. Benner, M. Köhler, J. Saak,
                 Sparse-Dense Sylvester Equations in :math:`\mathcal{H}_2`-Model Order Reduction,
@@ -193,15 +217,15 @@ def gram_schmidt_biorth(V, W, product=None, reiterate=True, reiteration_threshol
                 if first_iteration:
                     first_iteration = False
                 else:
-                    logger.info('Projecting vector V[{}] again'.format(i))
+                    logger.info('Projecting vector V[{}] again', i)
 
-                for j in range(i):
-                    # project by (I - V[j] * W[j]^T * E)
+                # project by (I - V[:i] * W[:i]^T * E) twice (CGS2)
+                for _ in range(2):
                     if product is None:
-                        p = W[j].pairwise_dot(V[i])[0]
+                        p = W[:i].dot(V[i])
                     else:
-                        p = product.pairwise_apply2(W[j], V[i])[0]
-                    V[i].axpy(-p, V[j])
+                        p = product.apply2(W[:i], V[i])
+                    V[i].axpy(-1, V[:i].lincomb(p.T))
 
                 # calculate new norm
                 if product is None:
@@ -230,15 +254,15 @@ def gram_schmidt_biorth(V, W, product=None, reiterate=True, reiteration_threshol
                 if first_iteration:
                     first_iteration = False
                 else:
-                    logger.info('Projecting vector W[{}] again'.format(i))
+                    logger.info('Projecting vector W[{}] again', i)
 
-                for j in range(i):
-                    # project by (I - W[j] * V[j]^T * E)
+                # project by (I - W[:i] * V[:i]^T * E) twice (CGS2)
+                for _ in range(2):
                     if product is None:
-                        p = V[j].pairwise_dot(W[i])[0]
+                        p = V[:i].dot(W[i])
                     else:
-                        p = product.pairwise_apply2(V[j], W[i])[0]
-                    W[i].axpy(-p, W[j])
+                        p = product.apply2(V[:i], W[i])
+                    W[i].axpy(-1, W[:i].lincomb(p.T))
 
                 # calculate new norm
                 if product is None:
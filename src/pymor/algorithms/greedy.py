@@ -76,11 +76,11 @@ def greedy(discretization, reductor, samples, use_estimator=True, error_norm=Non
     samples = list(samples)
     sample_count = len(samples)
     extension_params = extension_params or {}
-    logger.info('Started greedy search on {} samples'.format(sample_count))
+    logger.info('Started greedy search on {} samples', sample_count)
     if pool is None or pool is dummy_pool:
         pool = dummy_pool
     else:
-        logger.info('Using pool of {} workers for parallel greedy search'.format(len(pool)))
+        logger.info('Using pool of {} workers for parallel greedy search', len(pool))
 
     with RemoteObjectManager() as rom:
         # Push everything we need during the greedy search to the workers.
@@ -118,17 +118,17 @@ def greedy(discretization, reductor, samples, use_estimator=True, error_norm=Non
 
             max_errs.append(max_err)
             max_err_mus.append(max_err_mu)
-            logger.info('Maximum error after {} extensions: {} (mu = {})'.format(extensions, max_err, max_err_mu))
+            logger.info('Maximum error after {} extensions: {} (mu = {})', extensions, max_err, max_err_mu)
 
             if atol is not None and max_err <= atol:
-                logger.info('Absolute error tolerance ({}) reached! Stoping extension loop.'.format(atol))
+                logger.info('Absolute error tolerance ({}) reached! Stoping extension loop.', atol)
                 break
 
             if rtol is not None and max_err / max_errs[0] <= rtol:
-                logger.info('Relative error tolerance ({}) reached! Stoping extension loop.'.format(rtol))
+                logger.info('Relative error tolerance ({}) reached! Stoping extension loop.', rtol)
                 break
 
-            with logger.block('Computing solution snapshot for mu = {} ...'.format(max_err_mu)):
+            with logger.block('Computing solution snapshot for mu = {} ...', max_err_mu):
                 U = discretization.solve(max_err_mu)
             with logger.block('Extending basis with solution snapshot ...'):
                 try:
@@ -141,13 +141,13 @@ def greedy(discretization, reductor, samples, use_estimator=True, error_norm=Non
             logger.info('')
 
             if max_extensions is not None and extensions >= max_extensions:
-                logger.info('Maximum number of {} extensions reached.'.format(max_extensions))
+                logger.info('Maximum number of {} extensions reached.', max_extensions)
                 with logger.block('Reducing once more ...'):
                     rd = reductor.reduce()
                 break
 
         tictoc = time.time() - tic
-        logger.info('Greedy search took {} seconds'.format(tictoc))
+        logger.info('Greedy search took {} seconds', tictoc)
         return {'reduced_discretization': rd,
                 'max_errs': max_errs, 'max_err_mus': max_err_mus, 'extensions': extensions,
                 'time': tictoc}
@@ -0,0 +1,137 @@
+# This file is part of the pyMOR project (http://www.pymor.org).
+# Copyright 2013-2017 pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (http://opensource.org/licenses/BSD-2-Clause)
+
+"""Hierarchical approximate proper orthogonal decomposition (HAPOD) of distributed snapshots.
+
+Instead of gathering all snapshots on a single process, :func:`dist_hapod`
+computes a POD of the snapshots stored on each worker of a |WorkerPool|
+and only transfers the (singular value scaled) local POD modes. These are
+merged in a tree of the given `arity` by computing PODs of the concatenated
+modes, until a single global POD is computed in the root of the tree.
+
+The tolerances of the local PODs are chosen such that the projection error
+of all snapshots onto the span of the final modes is bounded by `l2_err`:
+if `D` denotes the number of levels of the tree below the root, each of these
+levels may contribute an error of `(1 - omega) * l2_err / D` (distributed
+among the nodes of the level according to the number of snapshots
+they represent), and the root contributes an error of `omega * l2_err`.
+
+For |VectorArrays| whose vectors are distributed over MPI ranks (like
+:class:`~pymor.vectorarrays.mpi.MPIVectorArray`), all operations of
+:func:`~pymor.algorithms.pod.pod` are already parallel, so that no
+hierarchical approach is needed.
+"""
+
+import numpy as np
+
+from pymor.algorithms.pod import pod
+from pymor.core.defaults import defaults
+from pymor.core.logger import getLogger
+from pymor.operators.interfaces import OperatorInterface
+
+
+@defaults('arity', 'omega')
+def dist_hapod(U, pool, modes=None, product=None, l2_err=0., rtol=4e-8, atol=0., arity=2, omega=0.5,
+               orthonormalize=True, check=True):
+    """POD of snapshots scattered over a |WorkerPool|.
+
+    Parameters
+    ----------
+    U
+        |RemoteObject| referring to the |VectorArrays| of snapshots on the workers,
+        usually obtained by :meth:`~pymor.parallel.interfaces.WorkerPoolInterface.scatter_array`.
+    pool
+        The |WorkerPool| holding the snapshots.
+    modes
+        If not `None`, at most `modes` POD modes are returned. In this case, the
+        error bound is no longer guaranteed.
+    product
+        Inner product |Operator| w.r.t. which the POD is computed.
+    l2_err
+        The l2-approximation error of all snapshots by their orthogonal projection
+        onto the span of the returned modes is bounded by this value.
+    rtol, atol
+        Passed to all local PODs (see :func:`~pymor.algorithms.pod.pod`).
+    arity
+        Maximum number of children of each node in the merge tree.
+    omega
+        Fraction of `l2_err` which is used for the POD in the root of the tree
+        (a number between 0 and 1). Smaller values lead to larger local bases,
+        but to a smaller global basis.
+    orthonormalize, check
+        See :func:`~pymor.algorithms.pod.pod`.
+
+    Returns
+    -------
+    POD
+        |VectorArray| of POD modes.
+    SVALS
+        Sequence of singular values.
+    """
+    assert product is None or isinstance(product, OperatorInterface)
+    assert arity >= 2
+    assert 0. < omega < 1.
+
+    logger = getLogger('pymor.algorithms.hapod.dist_hapod')
+
+    counts = pool.apply(_len, U=U)
+    total_count = sum(counts)
+    assert total_count > 0
+
+    levels, nodes = 1, len(pool)
+    while nodes > arity:
+        nodes, levels = (nodes + arity - 1) // arity, levels + 1
+    # local PODs of `n` snapshots are computed with l2_err = scale * sqrt(n)
+    scale = (1. - omega) * l2_err / levels / np.sqrt(total_count)
+
+    with logger.block('Computing local PODs on {} workers ...', len(pool)):
+        results = [r for r in pool.apply(_local_pod, U=U, product=product, scale=scale, rtol=rtol, atol=atol)
+                   if r is not None and len(r[0]) > 0]
+
+    while len(results) > arity:
+        groups = [results[i:i + arity] for i in range(0, len(results), arity)]
+        with logger.block('Merging {} bases into {} bases ...', len(results), len(groups)):
+            results = [r for r in pool.map(_merge_pod, groups, product=product, scale=scale, rtol=rtol, atol=atol)
+                       if len(r[0]) > 0]
+
+    if not results:
+        logger.info('All snapshots are approximated by the empty basis.')
+        return pool.apply_only(_empty, 0, U=U), np.array([])
+
+    with logger.block('Computing global POD of {} bases ...', len(results)):
+        modes_and_svals = results[0][0].copy()
+        for r in results[1:]:
+            modes_and_svals.append(r[0])
+        if modes is not None:
+            modes = min(modes, len(modes_and_svals))
+        return pod(modes_and_svals, modes=modes, product=product, l2_err=omega * l2_err, rtol=rtol, atol=atol,
+                   orthonormalize=orthonormalize, check=check)
+
+
+def _len(U=None):
+    return len(U)
+
+
+def _empty(U=None):
+    return U.empty()
+
+
+def _local_pod(U=None, product=None, scale=None, rtol=None, atol=None):
+    if len(U) == 0:
+        return None
+    POD, SVALS = pod(U, product=product, l2_err=scale * np.sqrt(len(U)), rtol=rtol, atol=atol,
+                     orthonormalize=False, check=False)
+    POD.scal(SVALS)
+    return POD, len(U)
+
+
+def _merge_pod(results, product=None, scale=None, rtol=None, atol=None):
+    U = results[0][0].copy()
+    for r in results[1:]:
+        U.append(r[0])
+    count = sum(r[1] for r in results)
+    POD, SVALS = pod(U, product=product, l2_err=scale * np.sqrt(count), rtol=rtol, atol=atol,
+                     orthonormalize=False, check=False)
+    POD.scal(SVALS)
+    return POD, count
@@ -93,22 +93,22 @@ def newton(operator, rhs, initial_guess=None, mu=None, error_norm=None, least_sq
     residual = rhs - operator.apply(U, mu=mu)
 
     err = residual.l2_norm()[0] if error_norm is None else error_norm(residual)[0]
-    logger.info('      Initial Residual: {:5e}'.format(err))
+    logger.info('      Initial Residual: {:5e}', err)
 
     iteration = 0
     error_sequence = [err]
     while True:
         if iteration >= miniter:
             if err <= atol:
-                logger.info('Absolute limit of {} reached. Stopping.'.format(atol))
+                logger.info('Absolute limit of {} reached. Stopping.', atol)
                 break
             if err/error_sequence[0] <= rtol:
-                logger.info('Prescribed total reduction of {} reached. Stopping.'.format(rtol))
+                logger.info('Prescribed total reduction of {} reached. Stopping.', rtol)
                 break
             if (len(error_sequence) >= stagnation_window + 1 and
                     err/max(error_sequence[-stagnation_window - 1:]) >= stagnation_threshold):
-                logger.info('Error is stagnating (threshold: {:5e}, window: {}). Stopping.'.format(stagnation_threshold,
-                                                                                                   stagnation_window))
+                logger.info('Error is stagnating (threshold: {:5e}, window: {}). Stopping.',
+                            stagnation_threshold, stagnation_window)
                 break
             if iteration >= maxiter:
                 raise NewtonError('Failed to converge')
@@ -126,8 +126,8 @@ def newton(operator, rhs, initial_guess=None, mu=None, error_norm=None, least_sq
         residual = rhs - operator.apply(U, mu=mu)
 
         err = residual.l2_norm()[0] if error_norm is None else error_norm(residual)[0]
-        logger.info('Iteration {:2}: Residual: {:5e},  Reduction: {:5e}, Total Reduction: {:5e}'
-                    .format(iteration, err, err / error_sequence[-1], err / error_sequence[0]))
+        logger.info('Iteration {:2}: Residual: {:5e},  Reduction: {:5e}, Total Reduction: {:5e}',
+                    iteration, err, err / error_sequence[-1], err / error_sequence[0])
         error_sequence.append(err)
         if not np.isfinite(err):
             raise NewtonError('Failed to converge')
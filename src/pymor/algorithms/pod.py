@@ -3,14 +3,16 @@
 # License: BSD 2-Clause License (http://opensource.org/licenses/BSD-2-Clause)
 
 import numpy as np
-from scipy.linalg import eigh
+from scipy.linalg import eigh, svd
 
 from pymor.algorithms.gram_schmidt import gram_schmidt
 from pymor.core.defaults import defaults
 from pymor.core.exceptions import AccuracyError
+from pymor.core.interfaces import BasicInterface
 from pymor.core.logger import getLogger
 from pymor.operators.interfaces import OperatorInterface
 from pymor.tools.floatcmp import float_cmp_all
+from pymor.tools.random import new_random_state
 from pymor.vectorarrays.interfaces import VectorArrayInterface
 
 
@@ -54,7 +56,9 @@ def pod(A, modes=None, product=None, rtol=4e-8, atol=0., l2_err=0.,
     check
         If `True`, check the computed POD modes for orthonormality.
     check_tol
-        Tolerance for the orthonormality check.
+        Tolerance for the orthonormality check. If the POD modes are stored in
+        single precision, the tolerance is increased to 100 times the resolution
+        of their floating point type.
 
     Returns
     -------
@@ -71,8 +75,11 @@ def pod(A, modes=None, product=None, rtol=4e-8, atol=0., l2_err=0.,
 
     logger = getLogger('pymor.algorithms.pod.pod')
 
-    with logger.block('Computing Gramian ({} vectors) ...'.format(len(A))):
+    with logger.block('Computing Gramian ({} vectors) ...', len(A)):
         B = A.gramian() if product is None else product.apply2(A, A)
+        # compute the eigenvalue decomposition in (at least) double precision,
+        # even when the vectors are stored in single precision
+        B = B.astype(np.promote_types(B.dtype, np.float64), copy=False)
 
         if symmetrize:     # according to rbmatlab this is necessary due to rounding
             B = B + B.T
@@ -102,7 +109,7 @@ def pod(A, modes=None, product=None, rtol=4e-8, atol=0., l2_err=0.,
         SVALS = np.sqrt(EVALS[:selected_modes])
         EVECS = EVECS[:selected_modes]
 
-    with logger.block('Computing left-singular vectors ({} vectors) ...'.format(len(EVECS))):
+    with logger.block('Computing left-singular vectors ({} vectors) ...', len(EVECS)):
         POD = A.lincomb(EVECS / SVALS[:, np.newaxis])
 
     if orthonormalize:
@@ -110,16 +117,217 @@ def pod(A, modes=None, product=None, rtol=4e-8, atol=0., l2_err=0.,
             POD = gram_schmidt(POD, product=product, copy=False)
 
     if check:
-        logger.info('Checking orthonormality ...')
-        if not product and not float_cmp_all(POD.dot(POD), np.eye(len(POD)),
-                                             atol=check_tol, rtol=0.):
-            err = np.max(np.abs(POD.dot(POD) - np.eye(len(POD))))
-            raise AccuracyError('result not orthogonal (max err={})'.format(err))
-        elif product and not float_cmp_all(product.apply2(POD, POD), np.eye(len(POD)),
-                                           atol=check_tol, rtol=0.):
-            err = np.max(np.abs(product.apply2(POD, POD) - np.eye(len(POD))))
-            raise AccuracyError('result not orthogonal (max err={})'.format(err))
+        _check_orthonormality(POD, product, check_tol, logger)
         if len(POD) < len(EVECS):
             raise AccuracyError('additional orthonormalization removed basis vectors')
 
     return POD, SVALS
+
+
+@defaults('oversampling', 'power_iterations', 'rtol', 'atol', 'l2_err', 'orthonormalize', 'check', 'check_tol')
+def randomized_pod(A, modes, product=None, oversampling=10, power_iterations=2, rtol=4e-8, atol=0., l2_err=0.,
+                   orthonormalize=True, check=True, check_tol=1e-10, random_state=None, seed=None):
+    """Proper orthogonal decomposition of `A` using a randomized range finder.
+
+    Computes an approximation of the first `modes` POD modes of `A` (see :func:`pod`)
+    by projecting `A` onto the span of `modes + oversampling` random linear
+    combinations of the vectors in `A`. To improve the approximation for slowly
+    decaying singular values, `power_iterations` subspace iterations with `A A^*`
+    are performed. The singular values are then computed via a small dense SVD.
+    In contrast to :func:`pod`, no `len(A)` x `len(A)` Gramian is formed.
+
+    Parameters
+    ----------
+    A
+        The |VectorArray| for which the POD is to be computed.
+    modes
+        The maximum number of POD modes to compute.
+    product
+        Inner product |Operator| w.r.t. which the POD is computed.
+    oversampling
+        Number of additional random samples used for the range finder.
+    power_iterations
+        Number of power iterations.
+    rtol, atol, l2_err
+        See :func:`pod`. For `l2_err`, the approximation error is computed
+        from the norms of the vectors in `A` and the computed singular values.
+    orthonormalize
+        If `True`, orthonormalize the computed POD modes again using
+        the :func:`~pymor.algorithms.gram_schmidt.gram_schmidt` algorithm.
+    check
+        If `True`, check the computed POD modes for orthonormality.
+    check_tol
+        Tolerance for the orthonormality check (see :func:`pod`).
+    random_state
+        :class:`~numpy.random.RandomState` to use for drawing the random samples.
+        If `None`, a new random state is generated using `seed` as random seed.
+    seed
+        Random seed to use. If `None`, the :func:`default <pymor.tools.random.new_random_state>`
+        random seed is used.
+
+    Returns
+    -------
+    POD
+        |VectorArray| of POD modes.
+    SVALS
+        Sequence of singular values.
+    """
+
+    assert isinstance(A, VectorArrayInterface)
+    assert len(A) > 0
+    assert 0 < modes <= len(A)
+    assert product is None or isinstance(product, OperatorInterface)
+    assert not random_state or seed is None
+
+    logger = getLogger('pymor.algorithms.pod.randomized_pod')
+    random_state = random_state or new_random_state(seed)
+
+    with logger.block('Computing range approximation ({} samples) ...', min(modes + oversampling, len(A))):
+        Q = A.lincomb(random_state.normal(size=(min(modes + oversampling, len(A)), len(A))))
+        gram_schmidt(Q, product=product, check=False, copy=False)
+        for _ in range(power_iterations):
+            Q = A.lincomb(_inner(Q, A, product))
+            gram_schmidt(Q, product=product, check=False, copy=False)
+
+    with logger.block('Computing SVD of projected snapshots ...'):
+        U, SVALS, _ = svd(_inner(A, Q, product).T, full_matrices=False, lapack_driver='gesvd')
+        selected_modes = min(_select_modes(SVALS, rtol, atol, l2_err, _energy(A, product)), modes)
+        SVALS = SVALS[:selected_modes]
+        POD = Q.lincomb(U[:, :selected_modes].T)
+
+    if orthonormalize:
+        with logger.block('Re-orthonormalizing POD modes ...'):
+            POD = gram_schmidt(POD, product=product, copy=False)
+
+    if check:
+        _check_orthonormality(POD, product, check_tol, logger)
+        if len(POD) < len(SVALS):
+            raise AccuracyError('additional orthonormalization removed basis vectors')
+
+    return POD, SVALS
+
+
+class StreamingPOD(BasicInterface):
+    """Incrementally computed proper orthogonal decomposition.
+
+    Maintains a truncated POD of all vectors passed to :meth:`update` so far
+    (see :func:`pod`), such that the snapshots do not have to be stored.
+    For each batch of new vectors, the current POD modes are extended by
+    the orthonormalized components of the new vectors orthogonal to the
+    modes and a small dense SVD of the coefficients of the current
+    approximation and the new vectors w.r.t. the extended basis is computed.
+    The result is truncated after each update.
+
+    Parameters
+    ----------
+    space
+        The |VectorSpace| of the snapshots.
+    modes
+        If not `None`, at most `modes` POD modes are kept.
+    product
+        Inner product |Operator| w.r.t. which the POD is computed.
+    rtol, atol
+        See :func:`pod`.
+    l2_err
+        Do not keep more modes than needed to bound the l2-approximation error
+        of all vectors seen so far by this value. Note that the error caused
+        by previous truncations cannot be reduced by later updates.
+    orthonormalize
+        If `True`, re-orthonormalize the POD modes after each update.
+
+    Attributes
+    ----------
+    pod_modes
+        |VectorArray| of the current POD modes.
+    svals
+        The current singular values.
+    energy
+        Sum of the squared norms of all vectors seen so far.
+    l2_err_estimate
+        Upper bound for the l2-approximation error of all vectors seen so far
+        by their orthogonal projection onto the span of the current POD modes.
+    """
+
+    def __init__(self, space, modes=None, product=None, rtol=4e-8, atol=0., l2_err=0., orthonormalize=True):
+        assert modes is None or modes > 0
+        assert product is None or isinstance(product, OperatorInterface) and product.source == space
+        self.space = space
+        self.modes = modes
+        self.product = product
+        self.rtol = rtol
+        self.atol = atol
+        self.l2_err = l2_err
+        self.orthonormalize = orthonormalize
+        self.pod_modes = space.empty()
+        self.svals = np.array([])
+        self.energy = 0.
+
+    @property
+    def l2_err_estimate(self):
+        return np.sqrt(max(self.energy - np.sum(self.svals ** 2), 0.))
+
+    def update(self, U):
+        """Update the POD with the vectors in the |VectorArray| `U`."""
+        assert U in self.space
+        if len(U) == 0:
+            return
+
+        with self.logger.block('Updating POD with {} vectors ...', len(U)):
+            product = self.product
+            self.energy += _energy(U, product)
+
+            basis = self.pod_modes.copy()
+            basis.append(U)
+            gram_schmidt(basis, product=product, offset=len(self.pod_modes), check=False, copy=False)
+
+            r = len(self.svals)
+            C = _inner(U, basis, product).T
+            K = np.zeros((len(basis), r + len(U)), dtype=np.promote_types(C.dtype, np.float64))
+            K[np.arange(r), np.arange(r)] = self.svals
+            K[:, r:] = C
+            V, SVALS, _ = svd(K, full_matrices=False, lapack_driver='gesvd')
+
+            selected_modes = _select_modes(SVALS, self.rtol, self.atol, self.l2_err, self.energy)
+            if self.modes is not None:
+                selected_modes = min(selected_modes, self.modes)
+            self.svals = SVALS[:selected_modes]
+            self.pod_modes = basis.lincomb(V[:, :selected_modes].T)
+            if self.orthonormalize:
+                gram_schmidt(self.pod_modes, product=product, copy=False)
+
+
+def _inner(U, V, product):
+    return U.dot(V) if product is None else product.apply2(U, V)
+
+
+def _energy(U, product):
+    return np.sum(U.l2_norm2() if product is None else product.pairwise_apply2(U, U).real)
+
+
+def _select_modes(svals, rtol, atol, l2_err, energy):
+    """Number of the (decreasing) singular values `svals` to keep.
+
+    `energy` is the squared Frobenius norm of the approximated matrix.
+    """
+    if len(svals) == 0:
+        return 0
+    above_tol = np.where(svals >= max(rtol * svals[0], atol))[0]
+    if len(above_tol) == 0:
+        return 0
+    errs = energy - np.concatenate(([0.], np.cumsum(svals ** 2)))
+    below_err = np.where(errs <= l2_err ** 2)[0]
+    first_below_err = below_err[0] if len(below_err) else len(svals)
+    return min(first_below_err, above_tol[-1] + 1)
+
+
+def _check_orthonormality(POD, product, check_tol, logger):
+    logger.info('Checking orthonormality ...')
+    G = POD.dot(POD) if not product else product.apply2(POD, POD)
+    # the modes cannot be more accurate than the precision they are stored in
+    dtype = getattr(POD.space, 'dtype', None)
+    dtype = G.dtype if dtype is None else dtype
+    if dtype.kind in 'fc':
+        check_tol = max(check_tol, 100 * np.finfo(dtype).resolution)
+    if not float_cmp_all(G, np.eye(len(POD)), atol=check_tol, rtol=0.):
+        err = np.max(np.abs(G - np.eye(len(POD))))
+        raise AccuracyError('result not orthogonal (max err={})'.format(err))
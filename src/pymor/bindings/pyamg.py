@@ -12,9 +12,10 @@ if config.HAVE_PYAMG:
     import pyamg
 
     from pymor.algorithms.genericsolvers import _parse_options
+    from pymor.core.cache import estimate_size
     from pymor.core.defaults import defaults
     from pymor.core.exceptions import InversionError
-    from pymor.operators.numpy import NumpyMatrixOperator
+    from pymor.operators.numpy import NumpyMatrixOperator, cached_factorization
 
     @defaults('tol', 'maxiter', 'verb', 'rs_strength', 'rs_CF',
               'rs_postsmoother', 'rs_max_levels', 'rs_max_coarse', 'rs_coarse_solver',
@@ -191,25 +192,27 @@ if config.HAVE_PYAMG:
 
         if options['type'] == 'pyamg_solve':
             if len(V) > 0:
-                V_iter = iter(enumerate(V))
-                R[0], ml = pyamg.solve(matrix, next(V_iter)[1],
-                                       tol=options['tol'],
-                                       maxiter=options['maxiter'],
-                                       return_solver=True)
-                for i, VV in V_iter:
+                # same setup as performed by pyamg.solve
+                ml = _cached_hierarchy(op, ('pyamg_solve',),
+                                       lambda: pyamg.blackbox.solver(
+                                           matrix, pyamg.blackbox.solver_configuration(matrix, verb=False)))
+                for i, VV in enumerate(V):
                     R[i] = pyamg.solve(matrix, VV,
                                        tol=options['tol'],
                                        maxiter=options['maxiter'],
                                        existing_solver=ml)
         elif options['type'] == 'pyamg_rs':
-            ml = pyamg.ruge_stuben_solver(matrix,
-                                          strength=options['strength'],
-                                          CF=options['CF'],
-                                          presmoother=options['presmoother'],
-                                          postsmoother=options['postsmoother'],
-                                          max_levels=options['max_levels'],
-                                          max_coarse=options['max_coarse'],
-                                          coarse_solver=options['coarse_solver'])
+            kind = ('pyamg_rs',) + _setup_options_key(options, ('strength', 'CF', 'presmoother', 'postsmoother',
+                                                                'max_levels', 'max_coarse', 'coarse_solver'))
+            ml = _cached_hierarchy(op, kind,
+                                   lambda: pyamg.ruge_stuben_solver(matrix,
+                                                                    strength=options['strength'],
+                                                                    CF=options['CF'],
+                                                                    presmoother=options['presmoother'],
+                                                                    postsmoother=options['postsmoother'],
+                                                                    max_levels=options['max_levels'],
+                                                                    max_coarse=options['max_coarse'],
+                                                                    coarse_solver=options['coarse_solver']))
             for i, VV in enumerate(V):
                 R[i] = ml.solve(VV,
                                 tol=options['tol'],
@@ -217,17 +220,22 @@ if config.HAVE_PYAMG:
                                 cycle=options['cycle'],
                                 accel=options['accel'])
         elif options['type'] == 'pyamg_sa':
-            ml = pyamg.smoothed_aggregation_solver(matrix,
-                                                   symmetry=options['symmetry'],
-                                                   strength=options['strength'],
-                                                   aggregate=options['aggregate'],
-                                                   smooth=options['smooth'],
-                                                   presmoother=options['presmoother'],
-                                                   postsmoother=options['postsmoother'],
-                                                   improve_candidates=options['improve_candidates'],
-                                                   max_levels=options['max_levels'],
-                                                   max_coarse=options['max_coarse'],
-                                                   diagonal_dominance=options['diagonal_dominance'])
+            kind = ('pyamg_sa',) + _setup_options_key(options, ('symmetry', 'strength', 'aggregate', 'smooth',
+                                                                'presmoother', 'postsmoother', 'improve_candidates',
+                                                                'max_levels', 'max_coarse', 'diagonal_dominance'))
+            ml = _cached_hierarchy(op, kind,
+                                   lambda: pyamg.smoothed_aggregation_solver(
+                                       matrix,
+                                       symmetry=options['symmetry'],
+                                       strength=options['strength'],
+                                       aggregate=options['aggregate'],
+                                       smooth=options['smooth'],
+                                       presmoother=options['presmoother'],
+                                       postsmoother=options['postsmoother'],
+                                       improve_candidates=options['improve_candidates'],
+                                       max_levels=options['max_levels'],
+                                       max_coarse=options['max_coarse'],
+                                       diagonal_dominance=options['diagonal_dominance']))
             for i, VV in enumerate(V):
                 R[i] = ml.solve(VV,
                                 tol=options['tol'],
@@ -242,3 +250,14 @@ if config.HAVE_PYAMG:
                 raise InversionError('Result contains non-finite values')
 
         return op.source.from_data(R)
+
+    def _setup_options_key(options, names):
+        return tuple(repr(options[name]) for name in names)
+
+    def _hierarchy_nbytes(ml):
+        return sum(estimate_size(getattr(level, name)) for level in ml.levels for name in ('A', 'P', 'R')
+                   if hasattr(level, name))
+
+    def _cached_hierarchy(op, kind, setup):
+        """Return the multilevel hierarchy for `op` from the factorization cache or compute it using `setup`."""
+        return cached_factorization(op, kind, setup, _hierarchy_nbytes)
@@ -9,11 +9,12 @@ import scipy.version
 from scipy.sparse.linalg import bicgstab, spsolve, splu, spilu, lgmres, lsqr, LinearOperator
 
 from pymor.algorithms.genericsolvers import _parse_options
+from pymor.core.cache import estimate_size
 from pymor.core.config import config
 from pymor.core.defaults import defaults
 from pymor.core.exceptions import InversionError
 from pymor.core.logger import getLogger
-from pymor.operators.numpy import NumpyMatrixOperator
+from pymor.operators.numpy import NumpyMatrixOperator, cached_factorization
 
 
 @defaults('bicgstab_tol', 'bicgstab_maxiter', 'spilu_drop_tol',
@@ -68,7 +69,8 @@ def solver_options(bicgstab_tol=1e-15,
     spsolve_permc_spec
         See :func:`scipy.sparse.linalg.spsolve`.
     spsolve_keep_factorization
-        See :func:`scipy.sparse.linalg.spsolve`.
+        If `True`, compute a :func:`~scipy.sparse.linalg.splu` factorization which is
+        reused for subsequent solves (see :func:`~pymor.operators.numpy.cached_factorization`).
     lgmres_tol
         See :func:`scipy.sparse.linalg.lgmres`.
     lgmres_maxiter
@@ -133,6 +135,9 @@ def solver_options(bicgstab_tol=1e-15,
                                          'iter_lim': least_squares_lsqr_iter_lim,
                                          'show': least_squares_lsqr_show}}
 
+    if config.HAVE_SKSPARSE:
+        opts['scipy_cholmod'] = {'type': 'scipy_cholmod'}
+
     if config.HAVE_SCIPY_LSMR:
         opts['scipy_least_squares_lsmr'] = {'type': 'scipy_least_squares_lsmr',
                                             'damp': least_squares_lsmr_damp,
@@ -164,7 +169,10 @@ def apply_inverse(op, V, options=None, least_squares=False, check_finite=True,
         Test if solution only containes finite values.
     default_solver
         Default solver to use (scipy_spsolve, scipy_bicgstab, scipy_bicgstab_spilu,
-        scipy_lgmres, scipy_least_squares_lsmr, scipy_least_squares_lsqr).
+        scipy_lgmres, scipy_least_squares_lsmr, scipy_least_squares_lsqr,
+        scipy_cholmod). `scipy_cholmod` computes a sparse Cholesky factorization
+        of a symmetric positive definite matrix using scikit-sparse, which is
+        reused for subsequent solves.
     default_least_squares_solver
         Default solver to use for least squares problems (scipy_least_squares_lsmr,
         scipy_least_squares_lsqr).
@@ -215,39 +223,28 @@ def apply_inverse(op, V, options=None, least_squares=False, check_finite=True,
                                          format(info))
     elif options['type'] == 'scipy_spsolve':
         try:
-            # maybe remove unusable factorization:
-            if hasattr(matrix, 'factorization'):
-                fdtype = matrix.factorizationdtype
-                if not np.can_cast(V.dtype, fdtype, casting='safe'):
-                    del matrix.factorization
+            if options['keep_factorization']:
+                # the matrix is always converted to the promoted type.
+                # if matrix.dtype == promoted_type, this is a no_op
+                factorization = cached_factorization(
+                    op, ('scipy_splu', options['permc_spec'], promoted_type.str),
+                    lambda: splu(matrix_astype_nocopy(matrix, promoted_type), permc_spec=options['permc_spec']),
+                    # L and U are only accessible as copies, so estimate their size from the number of nonzeros
+                    lambda lu: lu.nnz * (promoted_type.itemsize + 4) + lu.perm_r.nbytes + lu.perm_c.nbytes
+                )
 
             if list(map(int, scipy.version.version.split('.'))) >= [0, 14, 0]:
-                if hasattr(matrix, 'factorization'):
-                    # we may use a complex factorization of a real matrix to
-                    # apply it to a real vector. In that case, we downcast
-                    # the result here, removing the imaginary part,
-                    # which should be zero.
-                    R = matrix.factorization.solve(V.T).T.astype(promoted_type, copy=False)
-                elif options['keep_factorization']:
-                    # the matrix is always converted to the promoted type.
-                    # if matrix.dtype == promoted_type, this is a no_op
-                    matrix.factorization = splu(matrix_astype_nocopy(matrix, promoted_type), permc_spec=options['permc_spec'])
-                    matrix.factorizationdtype = promoted_type
-                    R = matrix.factorization.solve(V.T).T
+                if options['keep_factorization']:
+                    R = factorization.solve(V.T).T
                 else:
                     # the matrix is always converted to the promoted type.
                     # if matrix.dtype == promoted_type, this is a no_op
                     R = spsolve(matrix_astype_nocopy(matrix, promoted_type), V.T, permc_spec=options['permc_spec']).T
             else:
                 # see if-part for documentation
-                if hasattr(matrix, 'factorization'):
-                    for i, VV in enumerate(V):
-                        R[i] = matrix.factorization.solve(VV).astype(promoted_type, copy=False)
-                elif options['keep_factorization']:
-                    matrix.factorization = splu(matrix_astype_nocopy(matrix, promoted_type), permc_spec=options['permc_spec'])
-                    matrix.factorizationdtype = promoted_type
+                if options['keep_factorization']:
                     for i, VV in enumerate(V):
-                        R[i] = matrix.factorization.solve(VV)
+                        R[i] = factorization.solve(VV)
                 elif len(V) > 1:
                     factorization = splu(matrix_astype_nocopy(matrix, promoted_type), permc_spec=options['permc_spec'])
                     for i, VV in enumerate(V):
@@ -256,6 +253,14 @@ def apply_inverse(op, V, options=None, least_squares=False, check_finite=True,
                     R = spsolve(matrix_astype_nocopy(matrix, promoted_type), V.T, permc_spec=options['permc_spec']).reshape((1, -1))
         except RuntimeError as e:
             raise InversionError(e)
+    elif options['type'] == 'scipy_cholmod':
+        from sksparse.cholmod import cholesky
+        factorization = cached_factorization(
+            op, ('scipy_cholmod', promoted_type.str),
+            lambda: cholesky(matrix_astype_nocopy(matrix, promoted_type).tocsc()),
+            lambda f: estimate_size(f.L())
+        )
+        R = factorization(V.T).T
     elif options['type'] == 'scipy_lgmres':
         for i, VV in enumerate(V):
             R[i], info = lgmres(matrix, VV,
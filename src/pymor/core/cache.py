@@ -23,13 +23,17 @@ the following data:
     3. the |state id| of the arguments,
     4. the |state id| of pyMOR's global |defaults|.
 
+The keys are prefixed with the names of the instance's class and of the method.
+
 Note that instances of |ImmutableInterface| are allowed to have mutable
 private attributes. It is the implementors responsibility not to break things.
 (See this :ref:`warning <ImmutableInterfaceWarning>`.)
 
 Backends for storage of cached return values derive from :class:`CacheRegion`.
 Currently two backends are provided for memory-based and disk-based caching
-(:class:`MemoryRegion` and :class:`SQLiteRegion`). The available regions
+(:class:`MemoryRegion` and :class:`SQLiteRegion`). Both can be combined
+using :class:`TieredRegion`. A region shared over the network is provided by
+:class:`~pymor.core.network_cache.NetworkCacheRegion`. The available regions
 are stored in the module level `cache_regions` dict. The user can add
 additional regions (e.g. multiple disk cache regions) as required.
 :attr:`CacheableInterface.cache_region` specifies a key of the `cache_regions` dict
@@ -37,13 +41,38 @@ to select a cache region which should be used by the instance.
 (Setting :attr:`~CacheableInterface.cache_region` to `None` or `'none'` disables caching.)
 
 By default, a 'memory', a 'disk' and a 'persistent' cache region are configured. The
-paths and maximum sizes of the disk regions, as well as the maximum number of keys of
-the memory cache region can be configured via the
+paths and maximum sizes of the disk regions, as well as the maximum number of keys and
+the maximum size of the memory cache region can be configured via the
 `pymor.core.cache.default_regions.disk_path`,
 `pymor.core.cache.default_regions.disk_max_size`,
 `pymor.core.cache.default_regions.persistent_path`,
-`pymor.core.cache.default_regions.persistent_max_size` and
-`pymor.core.cache.default_regions.memory_max_keys` |defaults|.
+`pymor.core.cache.default_regions.persistent_max_size`,
+`pymor.core.cache.default_regions.memory_max_keys` and
+`pymor.core.cache.default_regions.memory_max_bytes` |defaults|. Large |NumPy arrays|
+in values stored in the disk regions are memory-mapped in copy-on-write mode on
+cache hits (see :class:`SQLiteRegion`); the size threshold for this can be set via
+`pymor.core.cache.default_regions.disk_mmap_threshold` and
+`pymor.core.cache.default_regions.persistent_mmap_threshold`. Compression of the
+disk regions' entries can be enabled via the
+`pymor.core.cache.default_regions.disk_codec` and
+`pymor.core.cache.default_regions.persistent_codec` |defaults|. Writing of
+new entries can be moved to a background thread via the
+`pymor.core.cache.default_regions.disk_async_writes` and
+`pymor.core.cache.default_regions.persistent_async_writes` |defaults|. The
+order in which entries are evicted from the disk regions (least recently used,
+least frequently used or oldest first) is set via the
+`pymor.core.cache.default_regions.disk_eviction` and
+`pymor.core.cache.default_regions.persistent_eviction` |defaults|.
+
+Additionally, a 'factorizations' memory region holds the matrix factorizations
+which are reused by the solvers of |NumpyMatrixOperators| (see
+:func:`~pymor.operators.numpy.cached_factorization`). Its size is limited by the
+`pymor.core.cache.default_regions.factorizations_max_keys` and
+`pymor.core.cache.default_regions.factorizations_max_bytes` |defaults|.
+As cached factorizations outlive the matrices they have been computed for, both
+limits are kept small. Factorizations exceeding `factorizations_max_bytes` are
+attached to their operator instead. The reuse of factorizations is not affected
+by :func:`disable_caching`.
 
 There two ways to disable and enable caching in pyMOR:
 
@@ -60,36 +89,193 @@ any call to :func:`enable_caching`.
 
 A cache region can be emptied using :meth:`CacheRegion.clear`. The function
 :func:`clear_caches` clears each cache region registered in `cache_regions`.
+
+Entries of a cache region can be written to an archive file with :func:`export_cache`
+and imported into another region (e.g. on another machine) with :func:`import_cache`.
+:func:`prewarm_cache` copies entries between regions, e.g. from the 'persistent'
+region into the 'memory' region at program start.
+
+Usage statistics (number of hits, misses and evictions, time spent for key
+computation and for loading values, etc.) for each cache region and each cached
+method can be obtained using :func:`cache_statistics` or printed using
+:func:`print_cache_statistics`.
 """
 
 import atexit
 from collections import OrderedDict
+from contextlib import contextmanager
 import datetime
 import functools
 import getpass
 import inspect
+import io
+from numbers import Integral
 import os
+import pickle
+import queue
+import shutil
 import sqlite3
+import sys
+import tarfile
 import tempfile
+import threading
+import time
+from time import perf_counter
 from types import MethodType
 
+import numpy as np
+
 from pymor.core.config import config
 from pymor.core.defaults import defaults, defaults_sid
 from pymor.core.interfaces import ImmutableInterface, generate_sid
-from pymor.core.pickle import dump, load
+from pymor.core.pickle import PROTOCOL, dump, dumps, load, _function_pickling_handler, _function_unpickling_handler
 
 
 @atexit.register
 def cleanup_non_persisten_regions():
     for region in cache_regions.values():
-        if not region.persistent:
+        if region.persistent:
+            region.flush()
+        elif getattr(region, 'owned', True):
             region.clear()
+            if isinstance(region, SQLiteRegion):
+                region._release_ownership()
+        else:
+            region.flush()
+
+
+def _process_alive(pid):
+    if sys.platform == 'win32':
+        # os.kill would terminate the process on Windows
+        import ctypes
+        handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
 
 
 def _safe_filename(old_name):
     return ''.join(x for x in old_name if (x.isalnum() or x in '._- '))
 
 
+def estimate_size(value):
+    """Estimate the memory footprint of a cached value in bytes.
+
+    Arrays are measured by their `nbytes`, sparse matrices by the size of their
+    data and index arrays and |VectorArrays| by their length, dimension and the
+    size of their entries. For |NumpyVectorArrays|, the entry size is taken from
+    the stored data, so that complex arrays are accounted for correctly. For other
+    |VectorArrays|, the `dtype` of their space is used, if available, and double
+    precision real entries are assumed otherwise.
+    Tuples, lists and dicts are measured recursively. For all other objects,
+    :func:`sys.getsizeof` is used.
+    """
+    from pymor.vectorarrays.interfaces import VectorArrayInterface
+    from pymor.vectorarrays.numpy import NumpyVectorArray
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, Integral):
+        return nbytes
+    elif isinstance(value, NumpyVectorArray):
+        array = value.base._array if value.is_view else value._array
+        return len(value) * value.dim * array.itemsize
+    elif isinstance(value, VectorArrayInterface):
+        dtype = getattr(value.space, 'dtype', None)
+        return len(value) * value.dim * (8 if dtype is None else dtype.itemsize)
+    elif hasattr(value, 'indptr') and hasattr(value, 'indices'):
+        return value.data.nbytes + value.indices.nbytes + value.indptr.nbytes
+    elif isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    elif isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    else:
+        return sys.getsizeof(value)
+
+
+def _codec_file(f, codec, mode):
+    """Wrap the binary file object `f` for compression (`mode='wb'`) or decompression (`mode='rb'`)."""
+    assert mode in ('rb', 'wb')
+    if codec is None:
+        return f
+    elif codec == 'zlib':
+        import gzip
+        return gzip.GzipFile(fileobj=f, mode=mode, compresslevel=6)
+    elif codec == 'lzma':
+        import lzma
+        return lzma.LZMAFile(f, mode)
+    elif codec == 'lz4':
+        import lz4.frame
+        return lz4.frame.LZ4FrameFile(f, mode)
+    elif codec == 'zstd':
+        import zstandard
+        return zstandard.ZstdCompressor().stream_writer(f) if mode == 'wb' \
+            else zstandard.ZstdDecompressor().stream_reader(f)
+    else:
+        raise ValueError('Unknown codec "{}"'.format(codec))
+
+
+def _check_codec(codec):
+    if codec in (None, 'zlib', 'lzma'):
+        return
+    elif codec == 'lz4':
+        if not config.HAVE_LZ4:
+            raise ImportError('lz4 compression requires the lz4 package')
+    elif codec == 'zstd':
+        if not config.HAVE_ZSTD:
+            raise ImportError('zstd compression requires the zstandard package')
+    else:
+        raise ValueError('Unknown codec "{}"'.format(codec))
+
+
+def _dump_with_external_arrays(obj, path, threshold, codec=None):
+    """Pickle `obj` into directory `path`, storing large |NumPy arrays| as `.npy` files.
+
+    Returns the accumulated size of all written files.
+    """
+    arrays = {}
+
+    def persistent_id(o):
+        if type(o) is np.ndarray and o.dtype != object and o.nbytes >= threshold:
+            filename = arrays.get(id(o))
+            if filename is None:
+                filename = arrays[id(o)] = 'array-{}.npy'.format(len(arrays))
+                np.save(os.path.join(path, filename), o, allow_pickle=False)
+            return ('npy', filename)
+        return _function_pickling_handler(o)
+
+    with open(os.path.join(path, 'value.dat'), 'wb') as f, _codec_file(f, codec, 'wb') as cf:
+        pickler = pickle.Pickler(cf, protocol=PROTOCOL)
+        pickler.persistent_id = persistent_id
+        pickler.dump(obj)
+    return sum(os.path.getsize(os.path.join(path, fn)) for fn in os.listdir(path))
+
+
+def _load_with_external_arrays(path, codec=None):
+    """Load an object stored with :func:`_dump_with_external_arrays`.
+
+    The externally stored arrays are memory-mapped in copy-on-write mode:
+    data is only read from disk when it is accessed and modifications of
+    the returned arrays do not affect the cache entry.
+    """
+
+    def persistent_load(pid):
+        if type(pid) is tuple:
+            return np.load(os.path.join(path, pid[1]), mmap_mode='c', allow_pickle=False).view(np.ndarray)
+        return _function_unpickling_handler(pid)
+
+    with open(os.path.join(path, 'value.dat'), 'rb') as f, _codec_file(f, codec, 'rb') as cf:
+        unpickler = pickle.Unpickler(cf)
+        unpickler.persistent_load = persistent_load
+        return unpickler.load()
+
+
 class CacheRegion(object):
     """Base class for all pyMOR cache regions.
 
@@ -98,9 +284,23 @@ class CacheRegion(object):
     persistent
         If `True`, cache entries are kept between multiple
         program runs.
+    hits
+        Number of successful lookups via :meth:`get`.
+    misses
+        Number of unsuccessful lookups via :meth:`get`.
+    evictions
+        Number of entries which have been removed from the
+        region to make room for new entries.
+    bytes_stored
+        Accumulated size of all entries of the region in bytes
+        (`None` if unknown).
     """
 
     persistent = False
+    hits = 0
+    misses = 0
+    evictions = 0
+    bytes_stored = None
 
     def get(self, key):
         """Return cache entry for given key.
@@ -119,6 +319,24 @@ class CacheRegion(object):
         """
         raise NotImplementedError
 
+    def get_many(self, keys):
+        """Return cache entries for multiple keys.
+
+        The default implementation calls :meth:`get` for each key.
+        Implementations should override this method when entries can
+        be looked up more efficiently in a single batch.
+
+        Parameters
+        ----------
+        keys
+            List of keys for the cache entries.
+
+        Returns
+        -------
+        List of the return values of :meth:`get` for each key.
+        """
+        return [self.get(key) for key in keys]
+
     def set(self, key, value):
         """Set cache entry for `key` to given `value`.
 
@@ -132,92 +350,506 @@ class CacheRegion(object):
         """Clear the entire cache region."""
         raise NotImplementedError
 
+    def keys(self):
+        """Return a list of all keys stored in the cache region.
+
+        Where supported, the keys are ordered from the most recently
+        to the least recently used entry.
+        """
+        raise NotImplementedError
+
+    def flush(self):
+        """Write all pending entries to permanent storage.
+
+        This method is called at program exit for all
+        :attr:`~CacheRegion.persistent` regions. The default
+        implementation does nothing.
+        """
+        pass
+
+    def statistics(self):
+        """Return a dict of usage statistics of the cache region."""
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'bytes_stored': self.bytes_stored}
+
 
 class MemoryRegion(CacheRegion):
+    """In-memory :class:`CacheRegion` with least-recently-used eviction.
+
+    Each successful :meth:`get` marks the entry as most recently used.
+    When storing a new entry would exceed `max_keys` entries or `max_bytes`
+    bytes, the least recently used entries are evicted. The size of an entry
+    is estimated using :func:`estimate_size`.
+
+    Parameters
+    ----------
+    max_keys
+        Maximum number of entries in the region.
+    max_bytes
+        Maximum accumulated size of all entries in bytes. If `None`, only
+        the number of entries is limited. Values larger than `max_bytes`
+        are not stored at all.
+    on_evict
+        If not `None`, a callable which is called as `on_evict(key, value)`
+        for each entry which is evicted from the region or which is too
+        large to be stored in the first place.
+    """
 
     NO_VALUE = {}
 
-    def __init__(self, max_keys):
+    def __init__(self, max_keys, max_bytes=None, on_evict=None):
         self.max_keys = max_keys
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict
+        self.bytes_stored = 0
         self._cache = OrderedDict()
 
     def get(self, key):
         value = self._cache.get(key, self.NO_VALUE)
         if value is self.NO_VALUE:
+            self.misses += 1
             return False, None
         else:
-            return True, value
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return True, value[0]
 
     def set(self, key, value):
         if key in self._cache:
+            from pymor.core.logger import getLogger
             getLogger('pymor.core.cache.MemoryRegion').warn('Key already present in cache region, ignoring.')
             return
-        if len(self._cache) == self.max_keys:
-            self._cache.popitem(last=False)
-        self._cache[key] = value
+        size = estimate_size(value)
+        max_bytes = self.max_bytes
+        if max_bytes is not None and size > max_bytes:
+            from pymor.core.logger import getLogger
+            getLogger('pymor.core.cache.MemoryRegion').debug('Value of size {} exceeds max_bytes, not caching.'
+                                                             .format(size))
+            if self.on_evict:
+                self.on_evict(key, value)
+            return
+        cache = self._cache
+        while cache and (len(cache) >= self.max_keys or max_bytes is not None and self.bytes_stored + size > max_bytes):
+            evicted_key, (evicted_value, evicted_size) = cache.popitem(last=False)
+            self.bytes_stored -= evicted_size
+            self.evictions += 1
+            if self.on_evict:
+                self.on_evict(evicted_key, evicted_value)
+        cache[key] = (value, size)
+        self.bytes_stored += size
 
     def clear(self):
         self._cache = OrderedDict()
+        self.bytes_stored = 0
+
+    def keys(self):
+        return list(reversed(self._cache))
 
 
 class SQLiteRegion(CacheRegion):
+    """Disk-based :class:`CacheRegion` using an SQLite database as index.
+
+    Each cache entry is stored as a pickle file in `path`, the mapping from
+    keys to files is stored in the SQLite database `path/pymor_cache.db`.
 
-    def __init__(self, path, max_size, persistent):
+    The region can be shared by multiple threads and processes (e.g. the
+    workers of a |WorkerPool| running on the same node): the database is
+    operated in WAL journaling mode, which allows readers to proceed
+    concurrently with a writer, each thread of each process uses its own
+    database connection, and cache entries are first written to a temporary
+    file which is then atomically renamed to its final name. Thus, no
+    locks are taken by :meth:`get`, and an entry only becomes visible to
+    other processes after it has been written completely.
+
+    Parameters
+    ----------
+    path
+        The directory in which the cache entries are stored.
+    max_size
+        Maximum size of the region in bytes. When the size of all entries
+        exceeds `max_size`, entries are removed by :meth:`housekeeping`
+        according to the `eviction` policy.
+    persistent
+        If `True`, entries are kept between program runs. Otherwise, the
+        region is cleared upon initialization and at program exit by the
+        process owning it (see :attr:`owned`).
+    timeout
+        Time in seconds to wait for a database lock held by another
+        connection before giving up.
+    mmap_threshold
+        If not `None`, |NumPy arrays| (e.g. the data of a |NumpyVectorArray| or
+        the (sparse) matrix of a |NumpyMatrixOperator|) of at least `mmap_threshold`
+        bytes contained in a cached value are stored as separate `.npy` files
+        next to the pickled remainder of the value. On cache hits, these arrays
+        are memory-mapped instead of being read into memory, such that only the
+        data which is actually accessed is loaded from disk. The arrays are
+        mapped in copy-on-write mode, so that code modifying cached values in
+        place keeps working: modifications only affect the returned array and
+        are never written back to the cache entry. Values without such arrays
+        are stored as a single file.
+    codec
+        If not `None`, name of the compression codec used for new cache entries.
+        Available codecs are `'zlib'`, `'lzma'`, and, if the `lz4` or
+        `zstandard` packages are installed, `'lz4'` and `'zstd'`.
+        The codec of each entry is recorded in the database, so entries written
+        with different codecs can be read back. Memory-mapped arrays (see
+        `mmap_threshold`) are not compressed. The size limit `max_size` applies
+        to the compressed sizes of the entries.
+    async_writes
+        If `True`, :meth:`set` only puts the new entry into a queue and
+        returns immediately. Serialization of the value, writing to disk,
+        updating the database and :meth:`housekeeping` are performed by a
+        background thread. Entries which are still queued are returned by
+        :meth:`get`. Note that, in contrast to synchronous writes, modifications
+        of the value after :meth:`set` has returned may enter the cache
+        entry. Use :meth:`flush` to wait until all entries have been written.
+    max_pending
+        Maximum number of queued entries when `async_writes` is `True`.
+        If the queue is full, :meth:`set` blocks until an entry has been
+        written.
+    eviction
+        Order in which entries are removed by :meth:`housekeeping`:
+        `'lru'` removes the least recently accessed entries first, `'lfu'`
+        the least frequently accessed entries (ties are broken by access
+        time) and `'fifo'` the oldest entries. The time of the last access
+        and the number of hits of each entry are recorded in the database.
+        To keep :meth:`get` free of write transactions, these are buffered
+        and written in batches (at the latest by :meth:`flush`).
+
+    Attributes
+    ----------
+    owned
+        `True` if the calling process owns the region. The first process
+        opening a non-persistent region becomes its owner and records its
+        pid in the file `owner.pid`. Other processes (e.g. |WorkerPool|
+        workers) share the entries of the region without clearing it. When
+        the owner has exited, the next process opening the region takes
+        over. Persistent regions are always owned.
+    """
+
+    def __init__(self, path, max_size, persistent, timeout=60., mmap_threshold=None, codec=None,
+                 async_writes=False, max_pending=16, eviction='lru'):
+        _check_codec(codec)
+        assert eviction in ('lru', 'lfu', 'fifo')
         self.path = path
         self.max_size = max_size
         self.persistent = persistent
+        self.timeout = timeout
+        self.mmap_threshold = mmap_threshold
+        self.codec = codec
+        self.async_writes = async_writes
+        self.max_pending = max_pending
+        self.eviction = eviction
         self.bytes_written = 0
-        if not os.path.exists(path):
+        self._accesses = {}
+        self._accesses_lock = threading.Lock()
+        self._local = threading.local()
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._writer_lock = threading.Lock()
+        self._writer_pid = None
+        try:
             os.mkdir(path)
-
-        self.conn = conn = sqlite3.connect(os.path.join(path, 'pymor_cache.db'))
-        c = conn.cursor()
-
-        # check if table is properly initialized
-        c.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = c.fetchall()
-        if not any(t[0] == 'entries' for t in tables):
-            c.execute('''CREATE TABLE entries
-                         (id INTEGER PRIMARY KEY, key TEXT UNIQUE, filename TEXT, size INT)''')
-            conn.commit()
+        except FileExistsError:  # may have been created concurrently by another process
+            pass
+
+        with self._transaction() as c:
+            c.execute('''CREATE TABLE IF NOT EXISTS entries
+                         (id INTEGER PRIMARY KEY, key TEXT UNIQUE, filename TEXT, size INT, codec TEXT,
+                          last_access REAL DEFAULT 0, hits INT DEFAULT 0)''')
+            # upgrade tables created by older versions of pyMOR
+            c.execute('PRAGMA table_info(entries)')
+            columns = [col[1] for col in c.fetchall()]
+            if 'codec' not in columns:
+                c.execute('ALTER TABLE entries ADD COLUMN codec TEXT')
+            if 'last_access' not in columns:
+                c.execute('ALTER TABLE entries ADD COLUMN last_access REAL DEFAULT 0')
+                c.execute('ALTER TABLE entries ADD COLUMN hits INT DEFAULT 0')
+            c.execute('CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)')
+            c.execute('CREATE INDEX IF NOT EXISTS entries_hits ON entries (hits, last_access)')
+            # the total size of all entries is kept up to date by triggers, such that
+            # housekeeping does not need to scan the entire table
+            c.execute('CREATE TABLE IF NOT EXISTS info (name TEXT PRIMARY KEY, value INT)')
+            c.execute("INSERT OR IGNORE INTO info VALUES ('size', (SELECT IFNULL(SUM(size), 0) FROM entries))")
+            c.execute('''CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries
+                         BEGIN UPDATE info SET value = value + NEW.size WHERE name = 'size'; END''')
+            c.execute('''CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries
+                         BEGIN UPDATE info SET value = value - OLD.size WHERE name = 'size'; END''')
+            c.execute('''CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries
+                         BEGIN UPDATE info SET value = value - OLD.size + NEW.size WHERE name = 'size'; END''')
 
         if persistent:
+            self._owner_pid = None
             self.housekeeping()
         else:
-            self.clear()
+            self._owner_pid = os.getpid() if self._claim_ownership() else None
+            if self.owned:
+                self.clear()
+
+    @property
+    def owned(self):
+        return self.persistent or self._owner_pid == os.getpid()
+
+    def _claim_ownership(self):
+        marker = os.path.join(self.path, 'owner.pid')
+        pid = os.getpid()
+        # the marker is created by hard-linking a complete file, so that other
+        # processes never read a partially written pid
+        fd, tmp_path = tempfile.mkstemp('.tmp', 'owner-', self.path)
+        with os.fdopen(fd, 'w') as f:
+            f.write(str(pid))
+        try:
+            for _ in range(2):
+                try:
+                    os.link(tmp_path, marker)
+                    return True
+                except FileExistsError:
+                    try:
+                        with open(marker) as f:
+                            owner = int(f.read())
+                    except (OSError, ValueError):
+                        owner = None
+                    if owner == pid:
+                        return True
+                    if owner is not None and _process_alive(owner):
+                        return False
+                    try:  # left behind by a process which has exited
+                        os.unlink(marker)
+                    except FileNotFoundError:
+                        pass
+            return False
+        finally:
+            os.unlink(tmp_path)
+
+    def _release_ownership(self):
+        if self._owner_pid == os.getpid():
+            self._owner_pid = None
+            try:
+                os.unlink(os.path.join(self.path, 'owner.pid'))
+            except OSError:
+                pass
 
-    def get(self, key):
+    @property
+    def conn(self):
+        """The database connection of the calling thread.
+
+        A new connection is opened for each thread and after the process
+        has been forked, as :mod:`sqlite3` connections must not be shared.
+        """
+        local = self._local
+        pid = os.getpid()
+        if getattr(local, 'pid', None) != pid:
+            conn = sqlite3.connect(os.path.join(self.path, 'pymor_cache.db'), timeout=self.timeout,
+                                   isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            local.conn, local.pid = conn, pid
+        return local.conn
+
+    @property
+    def bytes_stored(self):
+        return self.conn.execute("SELECT value FROM info WHERE name = 'size'").fetchone()[0]
+
+    @contextmanager
+    def _transaction(self):
+        # BEGIN IMMEDIATE acquires the write lock at the start of the transaction,
+        # so that concurrent read-modify-write sequences cannot deadlock
         c = self.conn.cursor()
-        t = (key,)
-        c.execute('SELECT filename FROM entries WHERE key=?', t)
-        result = c.fetchall()
-        if len(result) == 0:
-            return False, None
-        elif len(result) == 1:
-            file_path = os.path.join(self.path, result[0][0])
-            with open(file_path, 'rb') as f:
-                value = load(f)
-            return True, value
+        c.execute('BEGIN IMMEDIATE')
+        try:
+            yield c
+        except BaseException:
+            c.execute('ROLLBACK')
+            raise
         else:
-            raise RuntimeError('Cache is corrupt!')
+            c.execute('COMMIT')
+
+    def get(self, key):
+        return self.get_many([key])[0]
+
+    def get_many(self, keys):
+        return self._get_many(keys, raw=False)
+
+    def get_raw(self, key):
+        """Like :meth:`get`, but return the pickled value without unpickling it.
+
+        Only entries which have not been stored with memory-mapped arrays
+        (see `mmap_threshold`) can be retrieved.
+        """
+        return self._get_many([key], raw=True)[0]
+
+    def _get_many(self, keys, raw):
+        results = [None] * len(keys)
+        missing = list(range(len(keys)))
+        if self._pending:
+            with self._pending_lock:
+                pending = self._pending
+                for i, key in enumerate(keys):
+                    if key in pending:
+                        results[i] = (True, dumps(pending[key]) if raw else pending[key])
+            missing = [i for i in missing if results[i] is None]
+
+        entries = {}
+        c = self.conn.cursor()
+        for j in range(0, len(missing), 500):  # stay below SQLITE_MAX_VARIABLE_NUMBER
+            chunk = [str(keys[i]) for i in missing[j:j + 500]]
+            c.execute('SELECT key, filename, codec FROM entries WHERE key IN ({})'.format(','.join('?' * len(chunk))),
+                      chunk)
+            entries.update((key, (filename, codec)) for key, filename, codec in c.fetchall())
+
+        for i in missing:
+            entry = entries.get(str(keys[i]))
+            if entry is None:
+                results[i] = (False, None)
+                continue
+            filename, codec = entry
+            file_path = os.path.join(self.path, filename)
+            try:
+                if file_path.endswith('.npd'):
+                    if raw:
+                        raise ValueError('Entry {} contains memory-mapped arrays'.format(keys[i]))
+                    value = _load_with_external_arrays(file_path, codec)
+                else:
+                    with open(file_path, 'rb') as f, _codec_file(f, codec, 'rb') as cf:
+                        value = cf.read() if raw else load(cf)
+            except FileNotFoundError:  # entry has been removed by another process in the meantime
+                results[i] = (False, None)
+                continue
+            results[i] = (True, value)
+
+        hits = sum(1 for found, _ in results if found)
+        self.hits += hits
+        self.misses += len(keys) - hits
+
+        if hits and self.eviction != 'fifo':
+            now = time.time()
+            with self._accesses_lock:
+                accesses = self._accesses
+                for i in missing:
+                    if results[i][0]:
+                        key = str(keys[i])
+                        accesses[key] = (now, accesses.get(key, (0, 0))[1] + 1)
+                record = len(accesses) >= 100
+            if record:
+                self._record_accesses(blocking=False)
+        return results
+
+    def _record_accesses(self, blocking=True):
+        # when called on the read path (blocking=False), readers must not wait for
+        # concurrent writers, so the accesses are kept for a later attempt if the
+        # database is locked
+        with self._accesses_lock:
+            accesses, self._accesses = self._accesses, {}
+        if not accesses:
+            return
+        conn = self.conn
+        if not blocking:
+            conn.execute('PRAGMA busy_timeout = 0')
+        try:
+            with self._transaction() as c:
+                c.executemany('UPDATE entries SET last_access = MAX(last_access, ?), hits = hits + ? WHERE key = ?',
+                              ((t, n, key) for key, (t, n) in accesses.items()))
+        except sqlite3.OperationalError as e:  # database is locked
+            if blocking:  # access statistics are not crucial
+                from pymor.core.logger import getLogger
+                getLogger('pymor.core.cache.SQLiteRegion').warn('Recording cache accesses failed: {}'.format(e))
+            else:
+                with self._accesses_lock:
+                    pending = self._accesses
+                    for key, (t, n) in accesses.items():
+                        t_pending, n_pending = pending.get(key, (0, 0))
+                        pending[key] = (max(t, t_pending), n + n_pending)
+        finally:
+            if not blocking:
+                conn.execute('PRAGMA busy_timeout = {}'.format(int(self.timeout * 1000)))
 
     def set(self, key, value):
-        fd, file_path = tempfile.mkstemp('.dat', _safe_filename(datetime.datetime.now().isoformat()[:-7]) + '-', self.path)
+        if not self.async_writes:
+            self._store(key, value)
+            return
+        if self._writer_pid != os.getpid():  # start writer thread lazily, also after process has been forked
+            with self._writer_lock:
+                if self._writer_pid != os.getpid():
+                    self._queue = queue.Queue(self.max_pending)
+                    self._pending = {}
+                    self._writer = threading.Thread(target=self._write_queued_entries, name='SQLiteRegion writer',
+                                                    daemon=True)
+                    self._writer.start()
+                    self._writer_pid = os.getpid()
+        with self._pending_lock:
+            if key in self._pending:
+                return
+            self._pending[key] = value
+        self._queue.put(key)
+
+    def set_raw(self, key, data):
+        """Like :meth:`set`, but store the already pickled value `data` as is.
+
+        `data` has to be the result of :func:`~pymor.core.pickle.dumps`, such that
+        the entry can also be read by :meth:`get`. The entry is always written
+        synchronously.
+        """
+        self._store(key, data, raw=True)
+
+    def _write_queued_entries(self):
+        q = self._queue
+        while True:
+            key = q.get()
+            try:
+                self._store(key, self._pending[key])
+            except Exception as e:
+                from pymor.core.logger import getLogger
+                getLogger('pymor.core.cache.SQLiteRegion').error('Writing cache entry failed: {}'.format(e))
+            finally:
+                with self._pending_lock:
+                    self._pending.pop(key, None)
+                q.task_done()
+
+    def flush(self):
+        if self._writer_pid == os.getpid():
+            self._queue.join()
+        self._record_accesses()
+
+    def _store(self, key, value, raw=False):
+        prefix = _safe_filename(datetime.datetime.now().isoformat()[:-7]) + '-'
+        if self.mmap_threshold is None or raw:
+            fd, tmp_path = tempfile.mkstemp('.tmp', prefix, self.path)
+            file_path = tmp_path[:-len('.tmp')] + '.dat'
+            try:
+                with os.fdopen(fd, 'wb') as f, _codec_file(f, self.codec, 'wb') as cf:
+                    if raw:
+                        cf.write(value)
+                    else:
+                        dump(value, cf)
+                file_size = os.path.getsize(tmp_path)
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        else:
+            tmp_path = tempfile.mkdtemp('.tmp', prefix, self.path)
+            file_path = tmp_path[:-len('.tmp')] + '.npd'
+            try:
+                file_size = _dump_with_external_arrays(value, tmp_path, self.mmap_threshold, self.codec)
+                if os.listdir(tmp_path) == ['value.dat']:  # no large arrays, store as plain file
+                    file_path = tmp_path[:-len('.tmp')] + '.dat'
+                    os.replace(os.path.join(tmp_path, 'value.dat'), file_path)
+                    os.rmdir(tmp_path)
+                else:
+                    os.replace(tmp_path, file_path)
+            except BaseException:
+                shutil.rmtree(tmp_path)
+                raise
         filename = os.path.basename(file_path)
-        with os.fdopen(fd, 'wb') as f:
-            dump(value, f)
-            file_size = f.tell()
-        conn = self.conn
-        c = conn.cursor()
         try:
-            c.execute("INSERT INTO entries(key, filename, size) VALUES ('{}', '{}', {})"
-                      .format(key, filename, file_size))
-            conn.commit()
+            with self._transaction() as c:
+                c.execute('INSERT INTO entries(key, filename, size, codec, last_access) VALUES (?, ?, ?, ?, ?)',
+                          (key, filename, file_size, self.codec, time.time()))
         except sqlite3.IntegrityError:
-            conn.commit()
             from pymor.core.logger import getLogger
             getLogger('pymor.core.cache.SQLiteRegion').warn('Key already present in cache region, ignoring.')
-            os.unlink(file_path)
+            self._remove_files([filename])
+            return
         self.bytes_written += file_size
         if self.bytes_written >= 0.1 * self.max_size:
             self.housekeeping()
@@ -225,79 +857,218 @@ class SQLiteRegion(CacheRegion):
     def clear(self):
         # Try to safely delete all cache entries, even if another process
         # accesses the same region.
+        self.flush()
         self.bytes_written = 0
-        conn = self.conn
-        c = conn.cursor()
-        c.execute('SELECT id, filename FROM entries ORDER BY id ASC')
-        entries = c.fetchall()
+        with self._accesses_lock:
+            self._accesses = {}
+        with self._transaction() as c:
+            c.execute('SELECT id, filename FROM entries ORDER BY id ASC')
+            entries = c.fetchall()
+            if entries:
+                ids_to_delete, files_to_delete = zip(*entries)
+                c.execute('DELETE FROM entries WHERE id in ({})'.format(','.join(map(str, ids_to_delete))))
         if entries:
-            ids_to_delete, files_to_delete = zip(*entries)
-            c.execute('DELETE FROM entries WHERE id in ({})'.format(','.join(map(str, ids_to_delete))))
-            conn.commit()
-            path = self.path
-            for filename in files_to_delete:
-                try:
-                    os.unlink(os.path.join(path, filename))
-                except OSError:
-                    from pymor.core.logger import getLogger
-                    getLogger('pymor.core.cache.SQLiteRegion').warn('Cannot delete cache entry ' + filename)
+            self._remove_files(files_to_delete)
+
+    def keys(self):
+        self.flush()
+        return [key for key, in self.conn.execute('SELECT key FROM entries ORDER BY last_access DESC')]
 
     def housekeeping(self):
+        """Remove entries if the size of the region exceeds `max_size`.
+
+        Entries are removed according to the `eviction` policy of the
+        region until the size of the remaining entries is at most a
+        quarter of `max_size`.
+        """
         self.bytes_written = 0
-        conn = self.conn
-        c = conn.cursor()
-        c.execute('SELECT SUM(size) FROM entries')
-        size = c.fetchone()
-        # size[0] can apparently also be None
-        try:
-            size = int(size[0]) if size is not None else 0
-        except TypeError:
-            size = 0
-        if size > self.max_size:
+        self._record_accesses()
+        with self._transaction() as c:
+            c.execute("SELECT value FROM info WHERE name = 'size'")
+            size = c.fetchone()[0]
+            if size <= self.max_size:
+                return
             bytes_to_delete = size - self.max_size + 0.75 * self.max_size
             deleted = 0
             ids_to_delete = []
             files_to_delete = []
-            c.execute('SELECT id, filename, size FROM entries ORDER BY id ASC')
+            order = {'lru': 'last_access ASC', 'lfu': 'hits ASC, last_access ASC', 'fifo': 'id ASC'}[self.eviction]
+            c.execute('SELECT id, filename, size FROM entries ORDER BY ' + order)
             while deleted < bytes_to_delete:
                 id_, filename, file_size = c.fetchone()
                 ids_to_delete.append(id_)
                 files_to_delete.append(filename)
                 deleted += file_size
             c.execute('DELETE FROM entries WHERE id in ({})'.format(','.join(map(str, ids_to_delete))))
-            conn.commit()
-            path = self.path
-            for filename in files_to_delete:
-                try:
+        self._remove_files(files_to_delete)
+        self.evictions += len(ids_to_delete)
+
+        from pymor.core.logger import getLogger
+        getLogger('pymor.core.cache.SQLiteRegion').info('Removed {} old cache entries'.format(len(ids_to_delete)))
+
+    def _remove_files(self, filenames):
+        path = self.path
+        for filename in filenames:
+            try:
+                if filename.endswith('.npd'):
+                    shutil.rmtree(os.path.join(path, filename))
+                else:
                     os.unlink(os.path.join(path, filename))
-                except OSError:
-                    from pymor.core.logger import getLogger
-                    getLogger('pymor.core.cache.SQLiteRegion').warn('Cannot delete cache entry ' + filename)
+            except OSError:
+                from pymor.core.logger import getLogger
+                getLogger('pymor.core.cache.SQLiteRegion').warn('Cannot delete cache entry ' + filename)
 
-            from pymor.core.logger import getLogger
-            getLogger('pymor.core.cache.SQLiteRegion').info('Removed {} old cache entries'.format(len(ids_to_delete)))
+
+class TieredRegion(CacheRegion):
+    """:class:`CacheRegion` combining a :class:`MemoryRegion` with a slower (disk) region.
+
+    Lookups first query the memory tier. On a miss, the disk tier is queried,
+    and values found there are promoted to the memory tier. New entries are
+    always stored in the memory tier. They are written to the disk tier either
+    immediately (`write='through'`) or only when they are evicted from the
+    memory tier or when :meth:`flush` is called (`write='behind'`).
+
+    A tiered region is usually registered in addition to the default regions,
+    e.g.::
+
+        cache_regions['tiered'] = TieredRegion(MemoryRegion(1000, 2 * 1024 ** 3),
+                                               cache_regions['persistent'])
+
+    Parameters
+    ----------
+    memory
+        The :class:`MemoryRegion` used as the first tier. Its
+        :attr:`~MemoryRegion.on_evict` callback is set by the tiered region.
+    disk
+        The :class:`CacheRegion` used as the second tier. The
+        tiered region is :attr:`~CacheRegion.persistent` if `disk` is.
+    write
+        Either `'through'` or `'behind'` (see above).
+
+    Attributes
+    ----------
+    promotions
+        Number of disk hits which have been promoted to the memory tier.
+    """
+
+    def __init__(self, memory, disk, write='through'):
+        assert isinstance(memory, MemoryRegion)
+        assert write in ('through', 'behind')
+        assert memory.on_evict is None
+        self.memory = memory
+        self.disk = disk
+        self.write = write
+        self.persistent = disk.persistent
+        self.promotions = 0
+        self._dirty = OrderedDict()
+        if write == 'behind':
+            memory.on_evict = self._write_back
+
+    def get(self, key):
+        found, value = self.memory.get(key)
+        if found:
+            self.hits += 1
+            return True, value
+        found, value = self.disk.get(key)
+        if found:
+            self.hits += 1
+            self.promotions += 1
+            self.memory.set(key, value)
+            return True, value
+        self.misses += 1
+        return False, None
+
+    def set(self, key, value):
+        if self.write == 'behind':
+            self._dirty[key] = value
+            self.memory.set(key, value)
+        else:
+            self.memory.set(key, value)
+            self.disk.set(key, value)
+
+    def _write_back(self, key, value):
+        if key in self._dirty:
+            del self._dirty[key]
+            self.disk.set(key, value)
+
+    def flush(self):
+        dirty, self._dirty = self._dirty, OrderedDict()
+        for key, value in dirty.items():
+            self.disk.set(key, value)
+        self.disk.flush()
+
+    @property
+    def owned(self):
+        return getattr(self.disk, 'owned', True)
+
+    def clear(self):
+        self._dirty = OrderedDict()
+        self.memory.clear()
+        self.disk.clear()
+
+    def keys(self):
+        keys = self.memory.keys()
+        memory_keys = set(keys)
+        return keys + [key for key in self.disk.keys() if key not in memory_keys]
+
+    @property
+    def bytes_stored(self):
+        return self.disk.bytes_stored
+
+    def statistics(self):
+        stats = super().statistics()
+        stats.update(promotions=self.promotions, memory=self.memory.statistics(), disk=self.disk.statistics())
+        return stats
 
 
 @defaults('disk_path', 'disk_max_size', 'persistent_path', 'persistent_max_size', 'memory_max_keys',
-          sid_ignore=('disk_path', 'disk_max_size', 'persistent_path', 'persistent_max_size', 'memory_max_keys'))
+          'memory_max_bytes', 'disk_mmap_threshold', 'persistent_mmap_threshold', 'disk_codec', 'persistent_codec',
+          'disk_async_writes', 'persistent_async_writes', 'disk_eviction', 'persistent_eviction',
+          'factorizations_max_keys', 'factorizations_max_bytes',
+          sid_ignore=('disk_path', 'disk_max_size', 'persistent_path', 'persistent_max_size', 'memory_max_keys',
+                      'memory_max_bytes', 'disk_mmap_threshold', 'persistent_mmap_threshold', 'disk_codec',
+                      'persistent_codec', 'disk_async_writes', 'persistent_async_writes', 'disk_eviction',
+                      'persistent_eviction', 'factorizations_max_keys', 'factorizations_max_bytes'))
 def default_regions(disk_path=os.path.join(tempfile.gettempdir(), 'pymor.cache.' + getpass.getuser()),
                     disk_max_size=1024 ** 3,
                     persistent_path=os.path.join(tempfile.gettempdir(), 'pymor.persistent.cache.' + getpass.getuser()),
                     persistent_max_size=1024 ** 3,
-                    memory_max_keys=1000):
-
-    parse_size_string = lambda size: \
-        int(size[:-1]) * 1024 if size[-1] == 'K' else \
-        int(size[:-1]) * 1024 ** 2 if size[-1] == 'M' else \
-        int(size[:-1]) * 1024 ** 3 if size[-1] == 'G' else \
-        int(size)
+                    memory_max_keys=1000,
+                    memory_max_bytes=1024 ** 3,
+                    disk_mmap_threshold=1024 ** 2,
+                    persistent_mmap_threshold=1024 ** 2,
+                    disk_codec=None,
+                    persistent_codec=None,
+                    disk_async_writes=False,
+                    persistent_async_writes=False,
+                    disk_eviction='lru',
+                    persistent_eviction='lru',
+                    factorizations_max_keys=10,
+                    factorizations_max_bytes=256 * 1024 ** 2):
+
+    def parse_size_string(size):
+        return int(size[:-1]) * 1024 if size[-1] == 'K' else \
+            int(size[:-1]) * 1024 ** 2 if size[-1] == 'M' else \
+            int(size[:-1]) * 1024 ** 3 if size[-1] == 'G' else \
+            int(size)
 
     if isinstance(disk_max_size, str):
         disk_max_size = parse_size_string(disk_max_size)
+    if isinstance(memory_max_bytes, str):
+        memory_max_bytes = parse_size_string(memory_max_bytes)
+    if isinstance(factorizations_max_bytes, str):
+        factorizations_max_bytes = parse_size_string(factorizations_max_bytes)
+
+    cache_regions['disk'] = SQLiteRegion(path=disk_path, max_size=disk_max_size, persistent=False,
+                                         mmap_threshold=disk_mmap_threshold, codec=disk_codec,
+                                         async_writes=disk_async_writes, eviction=disk_eviction)
+    cache_regions['persistent'] = SQLiteRegion(path=persistent_path, max_size=persistent_max_size, persistent=True,
+                                               mmap_threshold=persistent_mmap_threshold, codec=persistent_codec,
+                                               async_writes=persistent_async_writes,
+                                               eviction=persistent_eviction)
+    cache_regions['memory'] = MemoryRegion(memory_max_keys, memory_max_bytes)
+    cache_regions['factorizations'] = MemoryRegion(factorizations_max_keys, factorizations_max_bytes)
 
-    cache_regions['disk'] = SQLiteRegion(path=disk_path, max_size=disk_max_size, persistent=False)
-    cache_regions['persistent'] = SQLiteRegion(path=persistent_path, max_size=persistent_max_size, persistent=True)
-    cache_regions['memory'] = MemoryRegion(memory_max_keys)
 
 cache_regions = {}
 
@@ -325,6 +1096,234 @@ def clear_caches():
         r.clear()
 
 
+def _select_keys(keys, prefix=None, class_name=None, method_name=None):
+    if class_name is not None or method_name is not None:
+        keys = (key for key in keys if isinstance(key, str) and ':' in key)
+        if class_name is not None:
+            keys = (key for key in keys if key.split(':', 1)[0].rsplit('.', 1)[0] == class_name)
+        if method_name is not None:
+            keys = (key for key in keys if key.split(':', 1)[0].rsplit('.', 1)[-1] == method_name)
+    if prefix is not None:
+        keys = (key for key in keys if str(key).startswith(prefix))
+    return list(keys)
+
+
+def export_cache(region, filename, prefix=None, class_name=None, method_name=None):
+    """Export entries of a |CacheRegion| to an archive file.
+
+    Keys of entries created by cached methods start with `'<class name>.<method name>:'`,
+    so the entries of specific methods can be selected using `class_name`,
+    `method_name` or `prefix`. If no filter is given, all entries are exported.
+    The archive can be imported into another region using :func:`import_cache`.
+
+    Parameters
+    ----------
+    region
+        The name of the region in `cache_regions` or the |CacheRegion| itself.
+        The region has to support :meth:`~CacheRegion.keys`.
+    filename
+        Name of the archive file to create.
+    prefix
+        If not `None`, only export entries whose key starts with `prefix`.
+    class_name
+        If not `None`, only export entries of cached methods of classes named
+        `class_name`.
+    method_name
+        If not `None`, only export entries of cached methods named `method_name`.
+
+    Returns
+    -------
+    The number of exported entries.
+    """
+    if isinstance(region, str):
+        region = cache_regions[region]
+    keys = _select_keys(region.keys(), prefix, class_name, method_name)
+    exported = 0
+    with tarfile.open(filename, 'w') as archive:
+        for i in range(0, len(keys), 100):
+            chunk = keys[i:i + 100]
+            for key, (found, value) in zip(chunk, region.get_many(chunk)):
+                if not found:  # entry has been evicted in the meantime
+                    continue
+                data = dumps((key, value))
+                info = tarfile.TarInfo('{:0>8}.dat'.format(exported))
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+                exported += 1
+    return exported
+
+
+def import_cache(filename, region, prefix=None, class_name=None, method_name=None):
+    """Import entries from an archive created by :func:`export_cache` into a |CacheRegion|.
+
+    Entries whose keys are already present in `region` are skipped.
+    For regions supporting :meth:`~CacheRegion.keys`, this is checked
+    without loading any cached values.
+
+    Parameters
+    ----------
+    filename
+        Name of the archive file.
+    region
+        The name of the region in `cache_regions` or the |CacheRegion| itself.
+    prefix
+        If not `None`, only import entries whose key starts with `prefix`.
+    class_name
+        If not `None`, only import entries of cached methods of classes named
+        `class_name`.
+    method_name
+        If not `None`, only import entries of cached methods named `method_name`.
+
+    Returns
+    -------
+    The number of imported entries.
+    """
+    if isinstance(region, str):
+        region = cache_regions[region]
+    present = _present_keys(region)
+    imported = 0
+    with tarfile.open(filename, 'r') as archive:
+        for member in archive:
+            key, value = load(archive.extractfile(member))
+            if not _select_keys([key], prefix, class_name, method_name) or _is_present(region, present, key):
+                continue
+            region.set(key, value)
+            imported += 1
+    region.flush()
+    return imported
+
+
+def prewarm_cache(region='memory', source='persistent', prefix=None, class_name=None, method_name=None,
+                  max_entries=None):
+    """Copy entries from one |CacheRegion| to another one.
+
+    This is usually used at program start to load the entries of a disk
+    region into a memory region, e.g.::
+
+        prewarm_cache('memory', 'persistent', class_name='StationaryDiscretization')
+
+    Entries are copied in the order returned by :meth:`~CacheRegion.keys`
+    of `source`, i.e. for :class:`SQLiteRegion` the most recently used
+    entries first. Entries already present in `region` are skipped.
+
+    Parameters
+    ----------
+    region
+        The name of the target region in `cache_regions` or the |CacheRegion| itself.
+    source
+        The name of the source region in `cache_regions` or the |CacheRegion| itself.
+        The region has to support :meth:`~CacheRegion.keys`.
+    prefix
+        If not `None`, only copy entries whose key starts with `prefix`.
+    class_name
+        If not `None`, only copy entries of cached methods of classes named
+        `class_name`.
+    method_name
+        If not `None`, only copy entries of cached methods named `method_name`.
+    max_entries
+        If not `None`, copy at most `max_entries` entries. Defaults to
+        `max_keys` for a :class:`MemoryRegion`.
+
+    Returns
+    -------
+    The number of copied entries.
+    """
+    if isinstance(region, str):
+        region = cache_regions[region]
+    if isinstance(source, str):
+        source = cache_regions[source]
+    if max_entries is None and isinstance(region, MemoryRegion):
+        max_entries = region.max_keys
+    keys = _select_keys(source.keys(), prefix, class_name, method_name)
+    if max_entries is not None:
+        keys = keys[:max_entries]
+    present = _present_keys(region)
+    keys = [key for key in keys if not _is_present(region, present, key)]
+    copied = 0
+    # insert in reverse order, such that the most recently used entries are
+    # also the most recently used ones in a MemoryRegion; values are loaded
+    # one at a time to avoid holding all of them in memory at once
+    for key in reversed(keys):
+        found, value = source.get(key)
+        if found:
+            region.set(key, value)
+            copied += 1
+    return copied
+
+
+def _present_keys(region):
+    # the keys of regions supporting keys(), checking membership without loading any values
+    try:
+        return set(region.keys())
+    except NotImplementedError:
+        return None
+
+
+def _is_present(region, present, key):
+    return key in present if present is not None else region.get(key)[0]
+
+
+class _MethodStatistics(object):
+
+    __slots__ = ['hits', 'misses', 'key_time', 'lookup_time', 'compute_time', 'store_time']
+
+    def __init__(self):
+        self.hits = self.misses = 0
+        self.key_time = self.lookup_time = self.compute_time = self.store_time = 0.
+
+    def as_dict(self):
+        return {k: getattr(self, k) for k in self.__slots__}
+
+
+_method_statistics = {}
+
+
+def cache_statistics():
+    """Return usage statistics of all cache regions and cached methods.
+
+    Returns
+    -------
+    regions
+        Dict mapping the names of all regions in `cache_regions` to the
+        result of :meth:`CacheRegion.statistics`.
+    methods
+        Dict mapping tuples `(region_name, class_name, method_name)` to dicts
+        containing the number of `hits` and `misses` of the given cached method
+        as well as the accumulated time in seconds spent on computing cache
+        keys (`key_time`), on looking up and loading cached values (`lookup_time`),
+        on computing the values for cache misses (`compute_time`) and on
+        storing the computed values (`store_time`).
+    """
+    return ({name: region.statistics() for name, region in cache_regions.items()},
+            {k: v.as_dict() for k, v in _method_statistics.items()})
+
+
+def reset_cache_statistics():
+    """Reset the statistics collected for all cache regions and cached methods."""
+    for region in cache_regions.values():
+        region.hits = region.misses = region.evictions = 0
+    _method_statistics.clear()
+
+
+def print_cache_statistics():
+    """Print the statistics returned by :func:`cache_statistics` as tables."""
+    from pymor.tools.table import format_table
+    regions, methods = cache_statistics()
+
+    rows = [['region', 'hits', 'misses', 'evictions', 'bytes stored']]
+    for name, s in sorted(regions.items()):
+        rows.append([name, str(s['hits']), str(s['misses']), str(s['evictions']),
+                     'unknown' if s['bytes_stored'] is None else str(s['bytes_stored'])])
+    print(format_table(rows, title='cache regions'))
+    print()
+
+    rows = [['region', 'class', 'method', 'hits', 'misses', 'keys (s)', 'lookup (s)', 'compute (s)', 'store (s)']]
+    for (region, cls, method), s in sorted(methods.items()):
+        rows.append([region, cls, method, str(s['hits']), str(s['misses'])]
+                    + ['{:.3g}'.format(s[k]) for k in ('key_time', 'lookup_time', 'compute_time', 'store_time')])
+    print(format_table(rows, title='cached methods'))
+
+
 class CacheableInterface(ImmutableInterface):
     """Base class for anything that wants to use our built-in caching.
 
@@ -407,22 +1406,112 @@ class CacheableInterface(ImmutableInterface):
             defaults = {k: v.default for k, v in params.items() if v.default is not v.empty}
         return self._cached_method_call(method, False, argnames, defaults, args, kwargs)
 
+    def cached_method_call_many(self, method, kwargs_list, pool=None):
+        """Call a given `method` for multiple sets of arguments and cache the return values.
+
+        In contrast to calling :meth:`cached_method_call` repeatedly, all cache keys
+        are looked up at once via :meth:`CacheRegion.get_many`. Only the values which
+        are not found in the cache are computed, optionally in parallel using
+        a |WorkerPool|.
+
+        Parameters
+        ----------
+        method
+            The method that is to be called. This has to be a method
+            of `self`.
+        kwargs_list
+            List of dicts of keyword arguments for `method`.
+        pool
+            If not `None`, the |WorkerPool| used to compute the missing values.
+
+        Returns
+        -------
+        List of the (possibly cached) return values of `method(**kwargs)` for
+        each `kwargs` in `kwargs_list`.
+        """
+        assert isinstance(method, MethodType)
+
+        if _caching_disabled or self.cache_region is None:
+            return self._compute_many(method, kwargs_list, pool)
+
+        params = inspect.signature(method).parameters
+        defaults = {k: v.default for k, v in params.items() if v.default is not v.empty}
+
+        region = self._get_cache_region()
+        tic = perf_counter()
+        self_id = self._get_cache_self_id(region)
+        if defaults:
+            kwargs_list = [dict(defaults, **kwargs) for kwargs in kwargs_list]
+        d_sid = defaults_sid()
+        keys = [_cache_key(self, method, generate_sid((method.__name__, self_id, kwargs, d_sid)))
+                for kwargs in kwargs_list]
+        toc = perf_counter()
+        results = region.get_many(keys)
+        tac = perf_counter()
+
+        stats = self._get_cache_statistics(method)
+        stats.key_time += toc - tic
+        stats.lookup_time += tac - toc
+
+        # compute each missing value only once, even if its key occurs repeatedly
+        missing = OrderedDict()
+        for i, (found, _) in enumerate(results):
+            if not found:
+                missing.setdefault(keys[i], []).append(i)
+        stats.hits += len(results) - len(missing)
+        values = [value for _, value in results]
+        if missing:
+            self.logger.debug('creating {} new cache entries for {}.{}'
+                              .format(len(missing), self.__class__.__name__, method.__name__))
+            computed = self._compute_many(method, [kwargs_list[indices[0]] for indices in missing.values()], pool)
+            tic = perf_counter()
+            for (key, indices), value in zip(missing.items(), computed):
+                region.set(key, value)
+                for i in indices:
+                    values[i] = value
+            stats.misses += len(missing)
+            stats.compute_time += tic - tac
+            stats.store_time += perf_counter() - tic
+        return values
+
+    def _compute_many(self, method, kwargs_list, pool):
+        if pool is None:
+            return [method(**kwargs) for kwargs in kwargs_list]
+        else:
+            return pool.map(_call_method, kwargs_list, obj=self, method_name=method.__name__)
+
+    def _get_cache_region(self):
+        if not cache_regions:
+            default_regions()
+        try:
+            return cache_regions[self.cache_region]
+        except KeyError:
+            raise KeyError('No cache region "{}" found'.format(self.cache_region))
+
+    def _get_cache_self_id(self, region):
+        if region.persistent:
+            self_id = getattr(self, 'sid', None)
+            if not self_id:     # this can happen when cache_region is already set by the class to
+                                # a persistent region
+                self_id = self.generate_sid()
+            return self_id
+        else:
+            return self.uid
+
+    def _get_cache_statistics(self, method):
+        stats = _method_statistics.get((self.cache_region, self.__class__.__name__, method.__name__))
+        if stats is None:
+            stats = _method_statistics[(self.cache_region, self.__class__.__name__, method.__name__)] = \
+                _MethodStatistics()
+        return stats
+
     def _cached_method_call(self, method, pass_self, argnames, defaults, args, kwargs):
-            if not cache_regions:
-                default_regions()
-            try:
-                region = cache_regions[self.cache_region]
-            except KeyError:
-                raise KeyError('No cache region "{}" found'.format(self.cache_region))
+            region = self._get_cache_region()
+
+            tic = perf_counter()
 
             # compute id for self
-            if region.persistent:
-                self_id = getattr(self, 'sid')
-                if not self_id:     # this can happen when cache_region is already set by the class to
-                                    # a persistent region
-                    self_id = self.generate_sid()
-            else:
-                self_id = self.uid
+            self_id = self._get_cache_self_id(region)
 
             # ensure that passing a value as positional or keyword argument does not matter
             kwargs.update(zip(argnames, args))
@@ -431,18 +1520,40 @@ class CacheableInterface(ImmutableInterface):
             if defaults:
                 kwargs = dict(defaults, **kwargs)
 
-            key = generate_sid((method.__name__, self_id, kwargs, defaults_sid()))
+            key = _cache_key(self, method, generate_sid((method.__name__, self_id, kwargs, defaults_sid())))
+            toc = perf_counter()
             found, value = region.get(key)
+            tac = perf_counter()
+
+            stats = self._get_cache_statistics(method)
+            stats.key_time += toc - tic
+            stats.lookup_time += tac - toc
+
             if found:
+                stats.hits += 1
                 return value
             else:
                 self.logger.debug('creating new cache entry for {}.{}'
                                   .format(self.__class__.__name__, method.__name__))
                 value = method(self, **kwargs) if pass_self else method(**kwargs)
+                tic = perf_counter()
                 region.set(key, value)
+                stats.misses += 1
+                stats.compute_time += tic - tac
+                stats.store_time += perf_counter() - tic
                 return value
 
 
+def _cache_key(obj, method, sid):
+    # prefix the key with the class and method name to allow selecting the
+    # entries of specific methods (see export_cache and prewarm_cache)
+    return '{}.{}:{}'.format(obj.__class__.__name__, method.__name__, sid)
+
+
+def _call_method(kwargs, obj=None, method_name=None):
+    return getattr(obj, method_name)(**kwargs)
+
+
 def cached(function):
     """Decorator to make a method of `CacheableInterface` actually cached."""
 
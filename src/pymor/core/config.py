@@ -3,7 +3,11 @@
 # License: BSD 2-Clause License (http://opensource.org/licenses/BSD-2-Clause)
 
 from importlib import import_module
+import getpass
+import json
+import os
 import sys
+import tempfile
 
 def _can_import(module):
     try:
@@ -61,6 +65,7 @@ _PACKAGES = {
     'IPYTHON': _get_ipython_version,
     'MATPLOTLIB': lambda: import_module('matplotlib').__version__,
     'IPYWIDGETS': lambda: import_module('ipywidgets').__version__,
+    'LZ4': lambda: import_module('lz4').__version__,
     'MPI': lambda: import_module('mpi4py.MPI') and import_module('mpi4py').__version__,
     'NGSOLVE': lambda: bool(import_module('ngsolve')),
     'NUMPY': lambda: import_module('numpy').__version__,
@@ -68,19 +73,87 @@ _PACKAGES = {
     'PYTEST': lambda: import_module('pytest').__version__,
     'PYVTK': lambda: _can_import('evtk') or _can_import('pyevtk'),
     'QT': _get_qt_version,
-    'QTOPENGL': lambda: _have_qtpy_opengl,
+    'QTOPENGL': _have_qtpy_opengl,
     'SCIPY': lambda: import_module('scipy').__version__,
     'SCIPY_LSMR': lambda: hasattr(import_module('scipy.sparse.linalg'), 'lsmr'),
+    'SKSPARSE': lambda: _can_import('sksparse.cholmod'),
     'SPHINX': lambda: import_module('sphinx').__version__,
+    'XXHASH': lambda: import_module('xxhash').VERSION,
+    'ZSTD': lambda: import_module('zstandard').__version__,
 }
 
 
+class _ProbeCache:
+    """On-disk memo of the results of the package probes in `_PACKAGES`.
+
+    Probing a package requires importing it, which for some packages (Qt, FEniCS, ...)
+    takes a considerable amount of time. The results are therefore stored in a JSON
+    file, by default in the system's temp directory. The file can be set via the
+    `PYMOR_CONFIG_CACHE` environment variable, setting it to `''` or `'NONE'`
+    disables the memo. The stored results are only used when the Python interpreter,
+    `sys.path`, the modification times of all directories in `sys.path` and the
+    environment variables in `_ENVIRONMENT_VARIABLES` match, so installing or
+    removing packages or selecting different Qt bindings invalidates the memo.
+    """
+
+    # environment variables affecting the outcome of the probes
+    _ENVIRONMENT_VARIABLES = ('QT_API', 'FORCE_QT_API', 'PYOPENGL_PLATFORM', 'LD_LIBRARY_PATH', 'DYLD_LIBRARY_PATH')
+
+    def __init__(self):
+        filename = os.environ.get('PYMOR_CONFIG_CACHE',
+                                  os.path.join(tempfile.gettempdir(), 'pymor.config.' + getpass.getuser() + '.json'))
+        self.filename = None if filename in ('', 'NONE') else filename
+        self._results = None
+
+    @staticmethod
+    def _environment():
+        def mtime(path):
+            try:
+                return os.stat(path or '.').st_mtime
+            except OSError:
+                return None
+        return [sys.executable, sys.version, [[p, mtime(p)] for p in sys.path],
+                [[v, os.environ.get(v)] for v in _ProbeCache._ENVIRONMENT_VARIABLES]]
+
+    def _load(self):
+        try:
+            with open(self.filename) as f:
+                data = json.load(f)
+            if data['environment'] == self._environment():
+                return data['results']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return {}
+
+    def get(self, package):
+        if self.filename is None:
+            return None
+        if self._results is None:
+            self._results = self._load()
+        return self._results.get(package)
+
+    def set(self, package, version):
+        if self.filename is None or not isinstance(version, (bool, int, float, str, list)):
+            return
+        results = self._load()
+        results[package] = version
+        self._results = results
+        tmp_filename = '{}.{}.tmp'.format(self.filename, os.getpid())
+        try:
+            with open(tmp_filename, 'w') as f:
+                json.dump({'environment': self._environment(), 'results': results}, f)
+            os.replace(tmp_filename, self.filename)
+        except OSError:
+            pass
+
+
 class Config:
 
     def __init__(self):
         self.PY2 = sys.version_info.major == 2
         self.PY3 = sys.version_info.major == 3
         self.PYTHON_VERSION = '{}.{}.{}'.format(sys.version_info.major, sys.version_info.minor, sys.version_info.micro)
+        self._probe_cache = _ProbeCache()
 
     @property
     def version(self):
@@ -96,10 +169,13 @@ class Config:
             raise AttributeError
 
         if package in _PACKAGES:
-            try:
-                version = _PACKAGES[package]()
-            except ImportError:
-                version = False
+            version = self._probe_cache.get(package)
+            if version is None:
+                try:
+                    version = _PACKAGES[package]()
+                except ImportError:
+                    version = False
+                self._probe_cache.set(package, version)
 
             if version is not None and version is not False:
                 setattr(self, 'HAVE_' + package, True)
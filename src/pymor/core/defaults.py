@@ -72,6 +72,7 @@ import pkgutil
 import textwrap
 
 from pymor.core.config import config
+from pymor.tools import startup_profiler
 from pymor.tools.table import format_table
 
 
@@ -95,6 +96,8 @@ class DefaultContainer(object):
         self._data = defaultdict(dict)
         self.registered_functions = set()
 
+    @startup_profiler.timed('defaults', lambda self, func, args, sid_ignore, qualname:
+                            qualname or func.__module__ + '.' + func.__name__)
     def _add_defaults_for_function(self, func, args, sid_ignore, qualname):
 
         if func.__doc__ is not None:
@@ -309,6 +312,7 @@ def defaults(*args, sid_ignore=(), qualname=None):
     return the_decorator
 
 
+@startup_profiler.timed('import_all', lambda package_name='pymor': package_name)
 def _import_all(package_name='pymor'):
 
     package = importlib.import_module(package_name)
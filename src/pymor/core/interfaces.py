@@ -42,7 +42,9 @@ functionality:
        :meth:`~ImmutableInterface.generate_sid` and is then stored as the object's 
        `sid` attribute.
        The state id is obtained by deterministically serializing the object's state
-       and then computing a checksum of the resulting byte stream.
+       and then computing a checksum of the resulting byte stream. The data
+       buffers of |NumPy arrays| contained in the state are not serialized,
+       but are directly fed into an incremental hash (see :func:`hash_array`).
     3. :attr:`ImmutableInterface.sid_ignore` can be set to a set of attribute names
        which should be excluded from state id calculation.
     4. :meth:`ImmutableInterface.with_` can be used to create a copy of an instance with
@@ -81,7 +83,9 @@ import numpy as np
 
 from pymor.core import backports, logger
 from pymor.core.config import config
+from pymor.core.defaults import defaults
 from pymor.core.exceptions import ConstError, SIDGenerationError
+from pymor.tools import startup_profiler
 
 DONT_COPY_DOCSTRINGS = int(os.environ.get('PYMOR_WITH_SPHINX', 0)) == 1
 NoneType = type(None)
@@ -109,6 +113,7 @@ class UID(object):
 
 class UberMeta(abc.ABCMeta):
 
+    @startup_profiler.timed('metaclass', lambda cls, name, bases, namespace: name)
     def __init__(cls, name, bases, namespace):
         """Metaclass of :class:`BasicInterface`.
 
@@ -128,6 +133,7 @@ class UberMeta(abc.ABCMeta):
         cls._logger = logger.getLogger('{}.{}'.format(cls.__module__.replace('__main__', 'pymor'), name))
         abc.ABCMeta.__init__(cls, name, bases, namespace)
 
+    @startup_profiler.timed('metaclass', lambda cls, classname, bases, classdict: classname)
     def __new__(cls, classname, bases, classdict):
         """I copy docstrings from base class methods to deriving classes.
 
@@ -299,6 +305,7 @@ class classinstancemethod:
 class ImmutableMeta(UberMeta):
     """Metaclass for :class:`ImmutableInterface`."""
 
+    @startup_profiler.timed('metaclass', lambda cls, classname, bases, classdict: classname)
     def __new__(cls, classname, bases, classdict):
 
         # Ensure that '_sid_contains_cycles' and 'sid' are contained in sid_ignore.
@@ -489,6 +496,51 @@ def generate_sid(obj, debug=False):
     return sid_generator.generate(obj, debug, ())[0]
 
 
+@defaults('hash_function', sid_ignore=('hash_function',))
+def hash_array(array, hash_function='sha256', block_size=2 ** 24):
+    """Compute a digest of the contents of a |NumPy array|.
+
+    The array's data buffer is fed into an incremental hash without
+    creating a serialized copy of the array. Non-contiguous arrays are
+    processed in blocks of at most `block_size` bytes. The digest only
+    depends on the array's dtype, shape and contents, but not on its
+    memory layout.
+
+    Parameters
+    ----------
+    array
+        The |NumPy array| to hash. Arrays with `dtype` `object` are not supported.
+    hash_function
+        Name of the hash function to use. Either the name of a hash algorithm
+        provided by :mod:`hashlib` (e.g. `'sha256'`, `'blake2b'`) or, if the
+        `xxhash` package is installed, the name of one of its (much faster,
+        non-cryptographic) hash algorithms (e.g. `'xxh3_128'`).
+    block_size
+        Maximum size in bytes of the blocks into which non-contiguous
+        arrays are copied.
+
+    Returns
+    -------
+    The digest as a hex string.
+    """
+    assert array.dtype != object
+
+    if hash_function.startswith('xx'):
+        import xxhash
+        h = getattr(xxhash, hash_function)()
+    else:
+        h = hashlib.new(hash_function)
+
+    h.update('{}{}'.format(array.dtype.str, array.shape).encode())
+    if array.flags.c_contiguous:
+        h.update(array.reshape(-1).view(np.uint8))
+    elif array.ndim > 0 and array.shape[0] > 0:
+        rows = max(block_size // max(array[0].nbytes, 1), 1)
+        for i in range(0, array.shape[0], rows):
+            h.update(np.ascontiguousarray(array[i:i + rows]).reshape(-1).view(np.uint8))
+    return h.hexdigest()
+
+
 # Helper classes for generate_sid
 
 if config.PY2:
@@ -549,8 +601,8 @@ class _SIDGenerator(object):
         if t in STRING_TYPES:
             return obj
 
-        if t is np.ndarray and t.dtype != object:
-            return obj
+        if t is np.ndarray and obj.dtype != object:
+            return (np.ndarray, hash_array(obj))
 
         if t is tuple:
             return (tuple,) + tuple(self.deterministic_state(x) for x in obj)
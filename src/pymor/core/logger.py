@@ -8,6 +8,24 @@ pyMOR's logging facilities are based on the :mod:`logging` module of the
 Python standard library. To obtain a new logger object use :func:`getLogger`.
 Logging can be configured via the :func:`set_log_format` and
 :func:`set_log_levels` methods.
+
+Loggers obtained via :func:`getLogger` format messages lazily using
+:meth:`str.format` syntax: positional arguments passed to a logging
+call are only formatted into the message if the message is actually
+emitted, i.e. ::
+
+    logger.info('Solving {} for {} ...', name, mu)
+
+avoids calling `str(mu)` if the log level of `logger` is higher than
+`INFO`. This should be preferred over calling :meth:`str.format`
+explicitly in code which is executed frequently. If computing the
+arguments themselves is expensive, use a level check at the call site::
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info('Residual norm: {}', residual.l2_norm())
+
+Code blocks marked with `logger.block` can be recorded for performance
+analysis using :mod:`pymor.tools.tracing`.
 """
 
 import logging
@@ -16,7 +34,7 @@ import time
 from types import MethodType
 
 from pymor.core.defaults import defaults
-from pymor.tools import mpi
+from pymor.tools import mpi, tracing
 
 BLOCK = logging.INFO + 5
 BLOCK_TIME = BLOCK + 1
@@ -91,10 +109,10 @@ class ColoredFormatter(logging.Formatter):
             LAST_TIMESTAMP_LENGTH = len(timestamp)
 
         # handle special cases
-        if not record.msg:
+        if not msg:
             return ' ' * (LAST_TIMESTAMP_LENGTH+1) + '|   ' * INDENT
         if record.levelname == 'BLOCK_TIME':
-            return ' ' * (LAST_TIMESTAMP_LENGTH+1) + '|   ' * (INDENT - 1) + '\----------------- ' + record.msg
+            return ' ' * (LAST_TIMESTAMP_LENGTH+1) + '|   ' * (INDENT - 1) + '\----------------- ' + msg
 
         # handle length change of timestamp
         if len(timestamp) > LAST_TIMESTAMP_LENGTH:
@@ -133,6 +151,26 @@ class ColoredFormatter(logging.Formatter):
         return '{} {}{}{}: {}'.format(timestamp, indent, levelname, path, msg)
 
 
+class _BraceMessage(object):
+    """Log message which is formatted using :meth:`str.format` when converted to a string."""
+
+    __slots__ = ['fmt', 'args']
+
+    def __init__(self, fmt, args):
+        self.fmt = fmt
+        self.args = args
+
+    def __str__(self):
+        return str(self.fmt).format(*self.args)
+
+
+def _make_record(self, name, level, fn, lno, msg, args, *rest, **kwargs):
+    # only called for enabled log levels, so formatting is deferred until the record is emitted
+    if args:
+        msg, args = _BraceMessage(msg, args), ()
+    return logging.Logger.makeRecord(self, name, level, fn, lno, msg, args, *rest, **kwargs)
+
+
 @defaults('filename', sid_ignore='filename')
 def getLogger(module, level=None, filename=''):
     """Get the logger of the respective module for pyMOR's logging facility.
@@ -153,6 +191,7 @@ def getLogger(module, level=None, filename=''):
     logger.block = MethodType(_block, logger)
     logger.info2 = MethodType(_info2, logger)
     logger.info3 = MethodType(_info3, logger)
+    logger.makeRecord = MethodType(_make_record, logger)
     streamhandler = logging.StreamHandler()
     streamformatter = ColoredFormatter()
     streamhandler.setFormatter(streamformatter)
@@ -196,7 +235,7 @@ class DummyLogger(object):
         return self
 
     def block(self, msg, *args, **kwargs):
-        return LogIndenter(self, False)
+        return LogIndenter(self, False, msg, args)
 
     def info2(self, msg, *args, **kwargs):
         self.log(INFO2, msg, *args, **kwargs)
@@ -252,9 +291,11 @@ def set_log_format(max_hierarchy_level=1, indent_blocks=True, block_timings=Fals
 
 class LogIndenter(object):
 
-    def __init__(self, logger, doit):
+    def __init__(self, logger, doit, msg='', args=()):
         self.logger = logger
         self.doit = doit
+        self.msg = msg
+        self.args = args
 
     def __enter__(self):
         global INDENT
@@ -263,21 +304,28 @@ class LogIndenter(object):
             self.tic = time.time()
         if self.doit:
             INDENT += 1
+        if tracing.active:
+            name = str(self.msg).format(*self.args) if self.args else str(self.msg)
+            self.span = tracing._begin_span(name, getattr(self.logger, 'name', 'pymor'))
+        else:
+            self.span = None
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         global INDENT
         global BLOCK_TIMINGS
+        if self.span is not None:
+            self.span.finish()
         if self.doit:
             if BLOCK_TIMINGS:
                 duration = time.time() - self.tic
-                self.logger.log(BLOCK_TIME, 'duration: {}s'.format(duration))
+                self.logger.log(BLOCK_TIME, 'duration: {}s', duration)
             INDENT -= 1
 
 
 def _block(self, msg, *args, **kwargs):
     global INDENT_BLOCKS
     self.log(BLOCK, msg, *args, **kwargs)
-    return LogIndenter(self, self.isEnabledFor(BLOCK) and INDENT_BLOCKS)
+    return LogIndenter(self, self.isEnabledFor(BLOCK) and INDENT_BLOCKS, msg, args)
 
 
 def _info2(self, msg, *args, **kwargs):
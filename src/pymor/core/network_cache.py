@@ -0,0 +1,348 @@
+# This file is part of the pyMOR project (http://www.pymor.org).
+# Copyright 2013-2017 pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (http://opensource.org/licenses/BSD-2-Clause)
+
+"""This module provides a |CacheRegion| which is shared over the network.
+
+A :class:`NetworkCacheServer` stores cache entries in an :class:`~pymor.core.cache.SQLiteRegion` and
+serves them to any number of :class:`NetworkCacheRegion` clients, e.g. the
+workers of an MPI or IPython cluster which do not have access to a common
+file system. A server is started with::
+
+    from pymor.core.network_cache import NetworkCacheServer
+    NetworkCacheServer(('', 8573), '/path/to/cache', 10 * 1024 ** 3, secret='...').serve_forever()
+
+and the region is registered on the clients via::
+
+    from pymor.core.cache import cache_regions
+    from pymor.core.network_cache import NetworkCacheRegion
+    cache_regions['network'] = NetworkCacheRegion(('cacheserver', 8573), secret='...')
+
+Clients and server communicate over a TCP socket (when `address` is a
+`(host, port)` tuple) or a Unix domain socket (when `address` is a path)
+using a simple binary protocol. Each request consists of a header
+(operation code, length of the key, length of the payload) followed by the
+key and the payload, each response of a header (status code, length of the
+payload) followed by the payload. Values are pickled by the client, the
+server only stores the resulting bytes. Each client keeps a pool of open
+connections which are reused for subsequent requests, and the server handles
+each connection in a separate thread. Lookups of multiple keys via
+:meth:`~NetworkCacheRegion.get_many` are pipelined over a single connection.
+
+Note that values are transmitted unencrypted and that the server unpickles
+nothing, whereas clients unpickle whatever the server sends. Use a `secret`
+and only bind the server to trusted networks.
+"""
+
+import hmac
+import os
+import socket
+import socketserver
+import struct
+import threading
+
+from pymor.core.cache import CacheRegion, SQLiteRegion
+from pymor.core.interfaces import BasicInterface
+from pymor.core.pickle import dumps, loads
+
+
+_REQUEST = struct.Struct('!cIQ')   # operation, key length, payload length
+_RESPONSE = struct.Struct('!cQ')   # status, payload length
+
+_AUTH, _GET, _SET, _CLEAR, _STATS = b'A', b'G', b'S', b'C', b'T'
+_OPERATIONS = (_AUTH, _GET, _SET, _CLEAR, _STATS)
+_OK, _NOT_FOUND, _ERROR = b'+', b'-', b'!'
+
+_PIPELINE_DEPTH = 64
+
+
+class NetworkCacheError(Exception):
+    """Raised when the cache server reports an error."""
+
+
+def _recv_exactly(sock, size):
+    buf = bytearray(size)
+    view = memoryview(buf)
+    received = 0
+    while received < size:
+        n = sock.recv_into(view[received:])
+        if n == 0:
+            raise ConnectionError('connection closed by peer')
+        received += n
+    return bytes(buf)
+
+
+def _send_frame(sock, header, key, payload):
+    sock.sendall(header + key)
+    if payload:
+        sock.sendall(payload)
+
+
+def _socket_family(address):
+    return socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+
+
+class NetworkCacheRegion(CacheRegion):
+    """|CacheRegion| client for a :class:`NetworkCacheServer`.
+
+    The region is thread-safe. Idle connections are kept in a pool and are
+    reopened transparently after the process has been forked or when the
+    server has closed them.
+
+    Parameters
+    ----------
+    address
+        Address of the server, either a `(host, port)` tuple for TCP
+        or the path of a Unix domain socket.
+    secret
+        If not `None`, shared secret which has to match the `secret`
+        of the server.
+    max_connections
+        Maximum number of idle connections kept open.
+    timeout
+        Socket timeout in seconds (`None` to block indefinitely).
+    """
+
+    persistent = True
+
+    def __init__(self, address, secret=None, max_connections=4, timeout=60.):
+        self.address = address
+        self.secret = secret
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._pool = []
+        self._pool_pid = os.getpid()
+        self._pool_lock = threading.Lock()
+
+    def _connect(self):
+        sock = socket.socket(_socket_family(self.address), socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(self.address)
+            if sock.family == socket.AF_INET:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self.secret is not None:
+                secret = self.secret.encode()
+                _send_frame(sock, _REQUEST.pack(_AUTH, 0, len(secret)), b'', secret)
+                status, payload = self._read_response(sock)
+                if status == _ERROR:
+                    raise NetworkCacheError(payload.decode())
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    def _acquire(self):
+        with self._pool_lock:
+            if self._pool_pid != os.getpid():  # do not share sockets with the parent process
+                self._pool, self._pool_pid = [], os.getpid()
+            if self._pool:
+                return self._pool.pop(), True
+        return self._connect(), False
+
+    def _release(self, sock):
+        with self._pool_lock:
+            if self._pool_pid == os.getpid() and len(self._pool) < self.max_connections:
+                self._pool.append(sock)
+                return
+        sock.close()
+
+    def _request(self, requests):
+        # Retry once on a fresh connection if a pooled connection has gone stale.
+        # All operations are idempotent, so resending them is safe.
+        while True:
+            sock, reused = self._acquire()
+            try:
+                responses = []
+                # limit the number of requests in flight, such that neither side
+                # can block on a full socket buffer while the other one is sending
+                for i in range(0, len(requests), _PIPELINE_DEPTH):
+                    chunk = requests[i:i + _PIPELINE_DEPTH]
+                    for op, key, payload in chunk:
+                        _send_frame(sock, _REQUEST.pack(op, len(key), len(payload)), key, payload)
+                    responses.extend(self._read_response(sock) for _ in chunk)
+            except (ConnectionError, socket.timeout):
+                sock.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                sock.close()
+                raise
+            self._release(sock)
+            for status, payload in responses:
+                if status == _ERROR:
+                    raise NetworkCacheError(payload.decode())
+            return [(status == _OK, payload) for status, payload in responses]
+
+    @staticmethod
+    def _read_response(sock):
+        status, size = _RESPONSE.unpack(_recv_exactly(sock, _RESPONSE.size))
+        payload = _recv_exactly(sock, size) if size else b''
+        return status, payload
+
+    def get(self, key):
+        return self.get_many([key])[0]
+
+    def get_many(self, keys):
+        responses = self._request([(_GET, str(key).encode(), b'') for key in keys])
+        results = [(True, loads(payload)) if found else (False, None) for found, payload in responses]
+        hits = sum(1 for found, _ in results if found)
+        self.hits += hits
+        self.misses += len(keys) - hits
+        return results
+
+    def set(self, key, value):
+        self._request([(_SET, str(key).encode(), dumps(value))])
+
+    def clear(self):
+        self._request([(_CLEAR, b'', b'')])
+
+    def close(self):
+        """Close all idle connections."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+        for sock in pool:
+            sock.close()
+
+    def statistics(self):
+        stats = super().statistics()
+        try:
+            stats['server'] = loads(self._request([(_STATS, b'', b'')])[0][1])
+        except (OSError, NetworkCacheError):
+            stats['server'] = None
+        return stats
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+
+    def setup(self):
+        if self.request.family == socket.AF_INET:
+            self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        cache_server = self.server.cache_server
+        sock = self.request
+        authenticated = cache_server.secret is None
+        while True:
+            try:
+                header = sock.recv(_REQUEST.size, socket.MSG_WAITALL)
+                if len(header) < _REQUEST.size:
+                    return
+                op, key_size, payload_size = _REQUEST.unpack(header)
+                key = _recv_exactly(sock, key_size).decode() if key_size else ''
+                payload = _recv_exactly(sock, payload_size) if payload_size else b''
+            except (ConnectionError, socket.timeout):
+                return
+
+            if op == _AUTH:
+                authenticated = hmac.compare_digest(payload, cache_server.secret.encode()) \
+                    if cache_server.secret is not None else True
+            if not authenticated:
+                cache_server.logger.warn('Rejecting unauthenticated connection from {}'.format(self.client_address))
+                self._respond(_ERROR, b'authentication failed')
+                return
+
+            try:
+                status, response = self._process(cache_server, op, key, payload)
+            except Exception as e:
+                cache_server.logger.error('Error while processing request: {}'.format(e))
+                status, response = _ERROR, str(e).encode()
+            try:
+                self._respond(status, response)
+            except OSError:
+                return
+            if op not in _OPERATIONS:
+                return
+
+    @staticmethod
+    def _process(cache_server, op, key, payload):
+        if op == _AUTH:
+            return _OK, b''
+        elif op == _GET:
+            found, value = cache_server.region.get_raw(key)
+            return (_OK, value) if found else (_NOT_FOUND, b'')
+        elif op == _SET:
+            cache_server.region.set_raw(key, payload)
+            return _OK, b''
+        elif op == _CLEAR:
+            cache_server.region.clear()
+            return _OK, b''
+        elif op == _STATS:
+            return _OK, dumps(cache_server.region.statistics())
+        else:
+            return _ERROR, 'unknown operation {!r}'.format(op).encode()
+
+    def _respond(self, status, payload=b''):
+        _send_frame(self.request, _RESPONSE.pack(status, len(payload)), b'', payload)
+
+
+class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class _ThreadingUnixStreamServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class NetworkCacheServer(BasicInterface):
+    """Server for :class:`NetworkCacheRegion`.
+
+    Entries are stored in a persistent :class:`~pymor.core.cache.SQLiteRegion`, so all its
+    features (size limit, compression, concurrent access) are available.
+    Each client connection is handled in a separate thread.
+
+    Parameters
+    ----------
+    address
+        Address to bind to, either a `(host, port)` tuple for TCP or
+        the path of a Unix domain socket. If `port` is `0`, a free port
+        is chosen (see :attr:`address`).
+    path
+        Directory in which the cache entries are stored.
+    max_size
+        Maximum size of the stored entries in bytes.
+    secret
+        If not `None`, clients have to provide this secret before
+        issuing any other request.
+    codec
+        Compression codec used for stored entries (see :class:`~pymor.core.cache.SQLiteRegion`).
+
+    Attributes
+    ----------
+    address
+        The address the server is bound to.
+    region
+        The :class:`~pymor.core.cache.SQLiteRegion` holding the entries.
+    """
+
+    def __init__(self, address, path, max_size=1024 ** 3, secret=None, codec=None):
+        self.region = SQLiteRegion(path, max_size, persistent=True, codec=codec)
+        self.secret = secret
+        if isinstance(address, str):
+            if os.path.exists(address):
+                os.unlink(address)
+            self.server = _ThreadingUnixStreamServer(address, _RequestHandler)
+        else:
+            self.server = _ThreadingTCPServer(address, _RequestHandler)
+        self.server.cache_server = self
+        self.address = self.server.server_address
+
+    def serve_forever(self):
+        """Handle requests until :meth:`shutdown` is called."""
+        self.logger.info('Serving cache at {}'.format(self.address))
+        self.server.serve_forever()
+
+    def serve_in_thread(self):
+        """Start :meth:`serve_forever` in a daemon thread and return the thread."""
+        thread = threading.Thread(target=self.serve_forever, name='NetworkCacheServer', daemon=True)
+        thread.start()
+        return thread
+
+    def shutdown(self):
+        """Stop serving and close the listening socket."""
+        self.server.shutdown()
+        self.server.server_close()
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.unlink(self.address)
@@ -183,9 +183,8 @@ class StationaryDiscretization(DiscretizationBase):
     def _solve(self, mu=None):
         mu = self.parse_parameter(mu)
 
-        # explicitly checking if logging is disabled saves the str(mu) call
-        if not self.logging_disabled:
-            self.logger.info('Solving {} for {} ...'.format(self.name, mu))
+        # mu is only converted to a string if the message is actually logged
+        self.logger.info('Solving {} for {} ...', self.name, mu)
 
         return self.operator.apply_inverse(self.rhs.as_source_array(mu), mu=mu)
 
@@ -318,9 +317,8 @@ class InstationaryDiscretization(DiscretizationBase):
     def _solve(self, mu=None):
         mu = self.parse_parameter(mu).copy()
 
-        # explicitly checking if logging is disabled saves the expensive str(mu) call
-        if not self.logging_disabled:
-            self.logger.info('Solving {} for {} ...'.format(self.name, mu))
+        # mu is only converted to a string if the message is actually logged
+        self.logger.info('Solving {} for {} ...', self.name, mu)
 
         mu['_t'] = 0
         U0 = self.initial_data.as_range_array(mu)
@@ -59,6 +59,28 @@ class DiscretizationInterface(CacheableInterface, Parametric):
         mu = self.parse_parameter(mu)
         return self.cached_method_call(self._solve, mu=mu, **kwargs)
 
+    def solve_many(self, mus, pool=None, **kwargs):
+        """Solve the discrete problem for multiple |Parameters|.
+
+        When caching is activated, all cache lookups are performed at
+        once and only the solutions which are not found in the cache are
+        computed (see :meth:`~pymor.core.cache.CacheableInterface.cached_method_call_many`).
+
+        Parameters
+        ----------
+        mus
+            List of |Parameters| for which to solve.
+        pool
+            If not `None`, the |WorkerPool| used to compute the solutions
+            which are not cached.
+
+        Returns
+        -------
+        List of the solutions given as |VectorArrays|.
+        """
+        mus = [self.parse_parameter(mu) for mu in mus]
+        return self.cached_method_call_many(self._solve, [dict(mu=mu, **kwargs) for mu in mus], pool=pool)
+
     def estimate(self, U, mu=None):
         """Estimate the discretization error for a given solution.
 
@@ -132,10 +132,15 @@ class NumpyMatrixBasedOperator(OperatorBase):
         -------
         The assembled parameter independent |Operator|.
         """
-        return NumpyMatrixOperator(self._assemble(self.parse_parameter(mu)),
-                                   source_id=self.source.id,
-                                   range_id=self.range.id,
-                                   solver_options=self.solver_options)
+        mu = self.parse_parameter(mu)
+        op = NumpyMatrixOperator(self._assemble(mu),
+                                 source_id=self.source.id,
+                                 range_id=self.range.id,
+                                 solver_options=self.solver_options,
+                                 dtype=self.source.dtype)
+        # allow reusing factorizations of matrices assembled for the same parameter
+        op._factorization_key = (self.uid, mu.sid if self.parametric else None)
+        return op
 
     def apply(self, U, mu=None):
         return self.assemble(mu).apply(U)
@@ -149,6 +154,9 @@ class NumpyMatrixBasedOperator(OperatorBase):
     def as_source_array(self, mu=None):
         return self.assemble(mu).as_source_array()
 
+    def apply2(self, V, U, mu=None):
+        return self.assemble(mu).apply2(V, U)
+
     def apply_inverse(self, V, mu=None, least_squares=False):
         return self.assemble(mu).apply_inverse(V, least_squares=least_squares)
 
@@ -186,27 +194,36 @@ class NumpyMatrixOperator(NumpyMatrixBasedOperator):
         The |NumPy array| which is to be wrapped.
     name
         Name of the operator.
+    dtype
+        The :attr:`~pymor.vectorarrays.numpy.NumpyVectorSpace.dtype` of
+        :attr:`~pymor.operators.interfaces.OperatorInterface.source` and
+        :attr:`~pymor.operators.interfaces.OperatorInterface.range`. Set it
+        to, e.g., `np.float32` to apply the operator to single precision arrays.
+        The precision of `matrix` is not changed.
     """
 
-    def __init__(self, matrix, source_id=None, range_id=None, solver_options=None, name=None):
+    _factorization_key = None
+
+    def __init__(self, matrix, source_id=None, range_id=None, solver_options=None, name=None, dtype=None):
         assert matrix.ndim <= 2
         if matrix.ndim == 1:
             matrix = np.reshape(matrix, (1, -1))
-        self.source = NumpyVectorSpace(matrix.shape[1], source_id)
-        self.range = NumpyVectorSpace(matrix.shape[0], range_id)
+        self.source = NumpyVectorSpace(matrix.shape[1], source_id, dtype)
+        self.range = NumpyVectorSpace(matrix.shape[0], range_id, dtype)
         self.solver_options = solver_options
         self.name = name
         self._matrix = matrix
         self.source_id = source_id
         self.range_id = range_id
+        self.dtype = dtype
         self.sparse = issparse(matrix)
 
     @classmethod
-    def from_file(cls, path, key=None, source_id=None, range_id=None, solver_options=None, name=None):
+    def from_file(cls, path, key=None, source_id=None, range_id=None, solver_options=None, name=None, dtype=None):
         from pymor.tools.io import load_matrix
         matrix = load_matrix(path, key=key)
         return cls(matrix, solver_options=solver_options, source_id=source_id, range_id=range_id,
-                   name=name or key or path)
+                   name=name or key or path, dtype=dtype)
 
     @property
     def T(self):
@@ -235,6 +252,24 @@ class NumpyMatrixOperator(NumpyMatrixBasedOperator):
         assert V in self.range
         return self.source.make_array(self._matrix.T.dot(V.data.T).T)
 
+    @defaults('block_size', qualname='pymor.operators.numpy.NumpyMatrixOperator.apply2')
+    def apply2(self, V, U, mu=None, block_size=64):
+        """Compute `V.dot(self.apply(U))` block-wise.
+
+        The operator is applied to at most `block_size` vectors of `U` at once,
+        such that the result of the application never has to be stored for all
+        vectors of `U`.
+        """
+        assert V in self.range
+        assert U in self.source
+        V_data, U_data = V.data, U.data
+        R = np.empty((len(V_data), len(U_data)),
+                     dtype=np.result_type(V_data.dtype, U_data.dtype, self._matrix.dtype))
+        for i in range(0, len(U_data), block_size):
+            AU = self._matrix.dot(U_data[i:i + block_size].T)
+            R[:, i:i + block_size] = V_data.dot(AU.conj() if np.iscomplexobj(AU) else AU)
+        return R
+
     @defaults('check_finite', 'default_sparse_solver_backend',
               qualname='pymor.operators.numpy.NumpyMatrixOperator.apply_inverse')
     def apply_inverse(self, V, mu=None, least_squares=False, check_finite=True,
@@ -328,7 +363,8 @@ class NumpyMatrixOperator(NumpyMatrixBasedOperator):
     def apply_inverse_transpose(self, U, mu=None, least_squares=False):
         options = {'inverse': self.solver_options.get('inverse_transpose') if self.solver_options else None}
         transpose_op = NumpyMatrixOperator(self._matrix.T, source_id=self.range.id, range_id=self.source.id,
-                                           solver_options=options)
+                                           solver_options=options, dtype=self.dtype)
+        transpose_op._factorization_key = ('transpose', _factorization_key(self))
         return transpose_op.apply_inverse(U, mu=mu, least_squares=least_squares)
 
     def assemble_lincomb(self, operators, coefficients, solver_options=None, name=None):
@@ -373,12 +409,94 @@ class NumpyMatrixOperator(NumpyMatrixBasedOperator):
                     matrix += (op._matrix * c)
                 except NotImplementedError:
                     matrix = matrix + (op._matrix * c)
-        return NumpyMatrixOperator(matrix,
-                                   source_id=self.source.id,
-                                   range_id=self.range.id,
-                                   solver_options=solver_options)
+        op = NumpyMatrixOperator(matrix,
+                                 source_id=self.source.id,
+                                 range_id=self.range.id,
+                                 solver_options=solver_options,
+                                 dtype=self.dtype)
+        # the matrix only depends on the assembled operators and the coefficients
+        op._factorization_key = ('lincomb',
+                                 tuple(_factorization_key(o) if isinstance(o, NumpyMatrixOperator) else
+                                       (type(o).__name__, o.source.dim) for o in operators),
+                                 tuple(np.array(coefficients).tolist()))
+        return op
 
     def __getstate__(self):
-        if hasattr(self._matrix, 'factorization'):  # remove unplicklable SuperLU factorization
-            del self._matrix.factorization
+        # factorizations attached by cached_factorization are not picklable
+        if '_factorizations' in self.__dict__:
+            state = self.__dict__.copy()
+            del state['_factorizations']
+            return state
         return self.__dict__
+
+
+class _CachedFactorization(object):
+
+    __slots__ = ['factorization', 'nbytes']
+
+    def __init__(self, factorization, nbytes):
+        self.factorization = factorization
+        self.nbytes = nbytes
+
+
+def _factorization_key(op):
+    return op._factorization_key or op.uid
+
+
+def cached_factorization(op, kind, factorize, nbytes):
+    """Return a factorization of the matrix of a |NumpyMatrixOperator|, reusing cached factorizations.
+
+    Factorizations are stored in the `'factorizations'` cache region (see
+    :func:`~pymor.core.cache.default_regions`), which evicts the least recently used
+    factorizations when its size limit is exceeded. Factorizations are keyed by `kind`
+    and the operator. The matrices assembled by
+    :meth:`NumpyMatrixBasedOperator.assemble` or :meth:`~NumpyMatrixOperator.assemble_lincomb`
+    are identified by the assembled operators and the |Parameter| (resp. the
+    coefficients), such that repeated assembly for the same |Parameter|, e.g. in
+    subsequent calls of :meth:`~pymor.discretizations.interfaces.DiscretizationInterface.solve`,
+    reuses the same factorization.
+
+    Factorizations which are too large for the region, or all factorizations if
+    no `'factorizations'` region exists, are attached to `op` instead and are freed
+    together with it. Reusing factorizations is independent of
+    :func:`~pymor.core.cache.disable_caching`, which only affects the caching of
+    results; it is controlled by the solver options of the operator (e.g.
+    `keep_factorization` for the `scipy_spsolve` solver).
+
+    Parameters
+    ----------
+    op
+        The |NumpyMatrixOperator| whose matrix is factorized.
+    kind
+        Hashable description of the factorization (e.g. the solver, its options and the dtype).
+    factorize
+        Function without arguments computing the factorization.
+    nbytes
+        Function estimating the memory footprint of a factorization in bytes.
+
+    Returns
+    -------
+    The factorization.
+    """
+    from pymor.core import cache
+    attached = op.__dict__.get('_factorizations')
+    if attached is not None and kind in attached:
+        return attached[kind]
+    if not cache.cache_regions:
+        cache.default_regions()
+    region = cache.cache_regions.get('factorizations')
+    key = (_factorization_key(op), kind)
+    if region is not None:
+        found, value = region.get(key)
+        if found:
+            return value.factorization
+    factorization = factorize()
+    value = _CachedFactorization(factorization, int(nbytes(factorization)))
+    max_bytes = getattr(region, 'max_bytes', None)
+    if region is not None and (max_bytes is None or value.nbytes <= max_bytes):
+        region.set(key, value)
+    else:
+        if attached is None:
+            attached = op._factorizations = {}
+        attached[kind] = factorization
+    return factorization
@@ -3,8 +3,10 @@
 # License: BSD 2-Clause License (http://opensource.org/licenses/BSD-2-Clause)
 
 from copy import deepcopy
+from itertools import count
 
 from pymor.core.interfaces import ImmutableInterface
+from pymor.parallel.basic import WorkerPoolBase
 from pymor.parallel.interfaces import WorkerPoolInterface, RemoteObjectInterface
 
 
@@ -58,3 +60,45 @@ class DummyRemoteObject(RemoteObjectInterface):
 
     def _remove(self):
         del self.obj
+
+
+class SequentialPool(WorkerPoolBase):
+    """|WorkerPool| simulating `num_workers` workers in the calling process.
+
+    Each simulated worker holds its own deep copies of the pushed objects.
+    This is mainly useful for testing algorithms for data distributed over
+    several workers without starting any worker processes.
+    """
+
+    _ids = count()
+
+    def __init__(self, num_workers):
+        super().__init__()
+        self.workers = [{} for _ in range(num_workers)]
+
+    def __len__(self):
+        return len(self.workers)
+
+    def _push_object(self, obj):
+        remote_id = ('remote', next(self._ids))
+        for objects in self.workers:
+            objects[remote_id] = deepcopy(obj)
+        return remote_id
+
+    def _resolve(self, worker, kwargs):
+        objects = self.workers[worker]
+        return {k: objects[v] if isinstance(v, tuple) and v in objects else v for k, v in kwargs.items()}
+
+    def _apply(self, function, *args, **kwargs):
+        return [function(*args, **self._resolve(i, kwargs)) for i in range(len(self))]
+
+    def _apply_only(self, function, worker, *args, **kwargs):
+        return function(*args, **self._resolve(worker, kwargs))
+
+    def _map(self, function, chunks, **kwargs):
+        return [function(*a, **self._resolve(i, kwargs))
+                for i in range(len(self)) for a in zip(*(c[i] for c in chunks))]
+
+    def _remove_object(self, remote_id):
+        for objects in self.workers:
+            del objects[remote_id]
@@ -4,7 +4,7 @@
 
 import numpy as np
 
-from pymor.algorithms.basic import almost_equal
+from pymor.algorithms.basic import almost_equal, project_out
 from pymor.algorithms.gram_schmidt import gram_schmidt
 from pymor.algorithms.pod import pod
 from pymor.algorithms.projection import project, project_to_subbasis
@@ -167,10 +167,7 @@ class GenericRBReductor(BasicInterface):
             self.RB.append(U, remove_from_other=(not copy_U))
             gram_schmidt(self.RB, offset=basis_length, product=self.product, copy=False)
         elif method == 'pod':
-            if self.product is None:
-                U_proj_err = U - self.RB.lincomb(U.dot(self.RB))
-            else:
-                U_proj_err = U - self.RB.lincomb(self.product.apply2(U, self.RB))
+            U_proj_err = project_out(U, self.RB, product=self.product)
 
             self.RB.append(pod(U_proj_err, modes=pod_modes, product=self.product, orthonormalize=False)[0])
 
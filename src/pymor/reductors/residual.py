@@ -92,7 +92,7 @@ class ResidualReductor(BasicInterface):
                                                     orthonormalize=True, product=self.product,
                                                     riesz_representatives=rhs_is_functional)
                 except ImageCollectionError as e:
-                    self.logger.warning('Cannot compute range of {}. Evaluation will be slow.'.format(e.op))
+                    self.logger.warning('Cannot compute range of {}. Evaluation will be slow.', e.op)
                     self.residual_range = False
 
         if self.residual_range is False:
@@ -247,7 +247,7 @@ class ImplicitEulerResidualReductor(BasicInterface):
                                                     orthonormalize=True, product=self.product,
                                                     riesz_representatives=True)
                 except ImageCollectionError as e:
-                    self.logger.warning('Cannot compute range of {}. Evaluation will be slow.'.format(e.op))
+                    self.logger.warning('Cannot compute range of {}. Evaluation will be slow.', e.op)
                     self.residual_range = False
 
         if self.residual_range is False:
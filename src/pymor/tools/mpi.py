@@ -51,38 +51,80 @@ the method named by the second argument on the object referred to by the
 first argument.
 """
 
+import os
 import sys
 
 from pymor.core.config import config
 from pymor.core.defaults import defaults
 from pymor.core.pickle import dumps, loads
 
-if config.HAVE_MPI:
-    import mpi4py
-    from mpi4py import MPI
-    comm = MPI.COMM_WORLD
-    rank = comm.Get_rank()
-    size = comm.Get_size()
-    finished = False
-    mpi4py_version = list(map(int, mpi4py.__version__.split('.')))
-    if mpi4py_version >= [2, 0]:
-        import pymor.core.pickle
-        MPI.pickle.PROTOCOL = pymor.core.pickle.PROTOCOL
-        MPI.pickle.loads = pymor.core.pickle.loads
-        MPI.pickle.dumps = pymor.core.pickle.dumps
-else:
-    mpi4py_version = []
-    rank = 0
-    size = 1
-    finished = True
+# Environment variables which are set by the launchers of Open MPI, MPICH,
+# Intel MPI, MVAPICH and PMIx-based launchers (e.g. srun) for the processes
+# they start.
+_LAUNCHER_VARIABLES = ('OMPI_COMM_WORLD_SIZE', 'PMI_SIZE', 'PMIX_RANK', 'MV2_COMM_WORLD_SIZE')
 
-rank0 = rank == 0
-parallel = (size > 1)
+rank = 0
+size = 1
+rank0 = True
+parallel = False
+_initialized = False
 
 _managed_objects = {}
 _object_counter = 0
 
 
+def _initialize():
+    """Initialize MPI on first use.
+
+    When the process has been started by an MPI launcher, this is done when
+    the module is imported. Otherwise, `petsc4py` and `mpi4py` are only
+    imported when MPI is actually used (e.g. by accessing `comm`), so that
+    serial processes do not pay for the initialization of MPI.
+    """
+    global _initialized, MPI, comm, rank, size, rank0, parallel, finished, mpi4py_version
+    if _initialized:
+        return
+    _initialized = True
+    if config.HAVE_MPI:
+        # this solves sporadic mpi calls happening after finalize
+        try:
+            import petsc4py
+            petsc4py.init()
+        except ImportError:
+            pass
+        import mpi4py
+        from mpi4py import MPI
+        comm = MPI.COMM_WORLD
+        rank = comm.Get_rank()
+        size = comm.Get_size()
+        finished = False
+        mpi4py_version = list(map(int, mpi4py.__version__.split('.')))
+        if mpi4py_version >= [2, 0]:
+            import pymor.core.pickle
+            MPI.pickle.PROTOCOL = pymor.core.pickle.PROTOCOL
+            MPI.pickle.loads = pymor.core.pickle.loads
+            MPI.pickle.dumps = pymor.core.pickle.dumps
+    else:
+        mpi4py_version = []
+        finished = True
+    rank0 = rank == 0
+    parallel = (size > 1)
+
+
+def __getattr__(name):
+    if name in ('MPI', 'comm', 'finished', 'mpi4py_version'):
+        _initialize()
+        try:
+            return globals()[name]
+        except KeyError:
+            pass
+    raise AttributeError('module {} has no attribute {}'.format(__name__, name))
+
+
+if any(v in os.environ for v in _LAUNCHER_VARIABLES):
+    _initialize()
+
+
 ################################################################################
 
 
@@ -99,125 +141,78 @@ def event_loop_settings(auto_launch=True):
     return {'auto_launch': auto_launch}
 
 
-if mpi4py_version >= [2, 0]:
-    def event_loop():
-        """Launches an MPI-based event loop.
+# for older mpi4py versions we have to pickle manually to ensure
+# that pymor.core.pickle is used which will correctly serialize
+# lambdas, etc.
 
-        Events can be sent by either calling :func:`call` on
-        rank 0 to execute an arbitrary method on all ranks or
-        by calling :func:`quit` to exit the loop.
-        """
-        assert not rank0
-        while True:
-            try:
-                method, args, kwargs = comm.bcast(None)
-                if method == 'QUIT':
-                    break
-                else:
-                    method(*args, **kwargs)
-            except:
-                import traceback
-                print("Caught exception on MPI rank {}:".format(rank))
-                traceback.print_exception(*sys.exc_info())
-
-    def call(method, *args, **kwargs):
-        """Execute method on all MPI ranks.
-
-        Assuming :func:`event_loop` is running on all MPI ranks
-        (except rank 0), this will execute `method` on all
-        ranks (including rank 0) with positional arguments
-        `args` and keyword arguments `kwargs`.
-
-        Parameters
-        ----------
-        method
-            The function to execute on all ranks (must be picklable).
-        args
-            The positional arguments for `method`.
-        kwargs
-            The keyword arguments for `method`.
-
-        Returns
-        -------
-        The return value of `method` on rank 0.
-        """
-        assert rank0
-        if finished:
-            return
-        comm.bcast((method, args, kwargs), root=0)
-        return method(*args, **kwargs)
-
-    def quit():
-        """Exit the event loop on all MPI ranks.
-
-        This will cause :func:`event_loop` to terminate on all
-        MPI ranks.
-        """
-        global finished
-        comm.bcast(('QUIT', None, None))
-        finished = True
+def _bcast(obj):
+    if mpi4py_version >= [2, 0]:
+        return comm.bcast(obj, root=0)
+    else:
+        return loads(comm.bcast(dumps(obj) if rank0 else None, root=0))
 
-else:
-    # for older mpi4py versions we have to pickle manually to ensure
-    # that pymor.core.pickle is used which will correctly serialize
-    # lambdas, etc.
 
-    def event_loop():
-        """Launches an MPI-based event loop.
+def event_loop():
+    """Launches an MPI-based event loop.
 
-        Events can be sent by either calling :func:`call` on
-        rank 0 to execute an arbitrary method on all ranks or
-        by calling :func:`quit` to exit the loop.
-        """
-        assert not rank0
-        while True:
-            try:
-                method, args, kwargs = loads(comm.bcast(None))
-                if method == 'QUIT':
-                    break
-                else:
-                    method(*args, **kwargs)
-            except:
-                import traceback
-                print("Caught exception on MPI rank {}:".format(rank))
-                traceback.print_exception(*sys.exc_info())
-
-    def call(method, *args, **kwargs):
-        """Execute method on all MPI ranks.
-
-        Assuming :func:`event_loop` is running on all MPI ranks
-        (except rank 0), this will execute `method` on all
-        ranks (including rank 0) with positional arguments
-        `args` and keyword arguments `kwargs`.
-
-        Parameters
-        ----------
-        method
-            The function to execute on all ranks (must be picklable).
-        args
-            The positional arguments for `method`.
-        kwargs
-            The keyword arguments for `method`.
-
-        Returns
-        -------
-        The return value of `method` on rank 0.
-        """
-        assert rank0
-        if finished:
-            return
-        comm.bcast(dumps((method, args, kwargs)), root=0)
-        return method(*args, **kwargs)
-
-    def quit():
-        """Exit the event loop on all MPI ranks.
-
-        This will cause :func:`event_loop` to terminate on all
-        MPI ranks.
-        """
-        global finished
-        comm.bcast(dumps(('QUIT', None, None)))
-        finished = True
+    Events can be sent by either calling :func:`call` on
+    rank 0 to execute an arbitrary method on all ranks or
+    by calling :func:`quit` to exit the loop.
+    """
+    _initialize()
+    assert not rank0
+    while True:
+        try:
+            method, args, kwargs = _bcast(None)
+            if method == 'QUIT':
+                break
+            else:
+                method(*args, **kwargs)
+        except BaseException:
+            import traceback
+            print("Caught exception on MPI rank {}:".format(rank))
+            traceback.print_exception(*sys.exc_info())
+
+
+def call(method, *args, **kwargs):
+    """Execute method on all MPI ranks.
+
+    Assuming :func:`event_loop` is running on all MPI ranks
+    (except rank 0), this will execute `method` on all
+    ranks (including rank 0) with positional arguments
+    `args` and keyword arguments `kwargs`.
+
+    Parameters
+    ----------
+    method
+        The function to execute on all ranks (must be picklable).
+    args
+        The positional arguments for `method`.
+    kwargs
+        The keyword arguments for `method`.
+
+    Returns
+    -------
+    The return value of `method` on rank 0.
+    """
+    _initialize()
+    assert rank0
+    if finished:
+        return
+    _bcast((method, args, kwargs))
+    return method(*args, **kwargs)
+
+
+def quit():
+    """Exit the event loop on all MPI ranks.
+
+    This will cause :func:`event_loop` to terminate on all
+    MPI ranks.
+    """
+    global finished
+    _initialize()
+    _bcast(('QUIT', None, None))
+    finished = True
 
 
 ################################################################################
@@ -228,6 +223,7 @@ def mpi_info():
 
     Intended to be used in conjunction with :func:`call`.
     """
+    _initialize()
     data = comm.gather((rank, MPI.Get_processor_name()), root=0)
     if rank0:
         print('\n'.join('{}: {}'.format(rank, processor) for rank, processor in data))
@@ -352,6 +348,7 @@ def remove_object(obj_id):
 
 if __name__ == '__main__':
     assert config.HAVE_MPI
+    _initialize()
     if rank0:
         if len(sys.argv) >= 2:
             filename = sys.argv[1]
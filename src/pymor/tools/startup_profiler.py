@@ -0,0 +1,188 @@
+# This file is part of the pyMOR project (http://www.pymor.org).
+# Copyright 2013-2017 pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (http://opensource.org/licenses/BSD-2-Clause)
+
+"""This module provides a profiler for the startup time of pyMOR.
+
+The profiler is enabled by setting the `PYMOR_PROFILE_STARTUP` environment
+variable. If set to `1`, a report is printed to `stderr` at program exit;
+any other non-empty value (except `0`) is interpreted as the name of a file
+the report is written to.
+
+The profiler measures
+
+    - the time needed for executing each imported module (including
+      modules outside of pyMOR),
+    - the time spent in the metaclasses of
+      :class:`~pymor.core.interfaces.BasicInterface` and
+      :class:`~pymor.core.interfaces.ImmutableInterface` for each class,
+    - the time needed for registering the |defaults| of each function,
+    - the time needed by :func:`~pymor.core.defaults._import_all`.
+
+For each entry, the total time and the time excluding nested entries
+(e.g. the imports triggered by an imported module or the creation of
+the classes defined in the module) is reported.
+
+The statistics can also be obtained programmatically via
+:func:`startup_statistics` and :func:`startup_report`. This module
+must not import any other parts of pyMOR at module level.
+"""
+
+import atexit
+from collections import defaultdict
+import functools
+import os
+import sys
+from time import perf_counter
+
+
+_setting = os.environ.get('PYMOR_PROFILE_STARTUP', '')
+enabled = _setting not in ('', '0')
+
+_CATEGORIES = ('import', 'metaclass', 'defaults', 'import_all')
+
+_records = {category: defaultdict(lambda: [0, 0., 0.]) for category in _CATEGORIES}
+_stack = []
+
+
+def _enter():
+    _stack.append(0.)
+    return perf_counter()
+
+
+def _exit(category, name, tic):
+    total = perf_counter() - tic
+    nested = _stack.pop()
+    if _stack:
+        _stack[-1] += total
+    record = _records[category][name]
+    record[0] += 1
+    record[1] += total
+    record[2] += total - nested
+
+
+def timed(category, name):
+    """Decorator recording the execution time of a function if the profiler is enabled.
+
+    If the profiler is disabled, the function is returned unchanged.
+
+    Parameters
+    ----------
+    category
+        The category of the entry in the report.
+    name
+        Function which computes the name of the entry from the arguments
+        of the decorated function.
+    """
+    assert category in _CATEGORIES
+
+    def decorator(func):
+        if not enabled:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tic = _enter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _exit(category, name(*args, **kwargs), tic)
+
+        return wrapper
+
+    return decorator
+
+
+class _ImportTimer(object):
+    """Meta path finder instrumenting the loaders of all subsequently imported modules."""
+
+    def find_spec(self, name, path=None, target=None):
+        meta_path = sys.meta_path
+        try:
+            finders = meta_path[meta_path.index(self) + 1:]
+        except ValueError:
+            return None
+        for finder in finders:
+            find_spec = getattr(finder, 'find_spec', None)
+            if find_spec is None:
+                continue
+            spec = find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        loader = spec.loader
+        exec_module = getattr(loader, 'exec_module', None)
+        if exec_module is None or isinstance(loader, type):  # do not modify builtin/frozen importers
+            return spec
+
+        def timed_exec_module(module):
+            tic = _enter()
+            try:
+                exec_module(module)
+            finally:
+                _exit('import', name, tic)
+
+        try:
+            loader.exec_module = timed_exec_module
+        except AttributeError:
+            pass
+        return spec
+
+
+def startup_statistics():
+    """Return the collected statistics.
+
+    Returns
+    -------
+    Dict mapping each category (`'import'`, `'metaclass'`, `'defaults'`,
+    `'import_all'`) to a dict mapping the name of each entry to a tuple
+    `(count, total time, time excluding nested entries)`.
+    """
+    return {category: {name: tuple(record) for name, record in records.items()}
+            for category, records in _records.items()}
+
+
+def startup_report(max_rows=30):
+    """Return a report of the collected statistics as a string.
+
+    Parameters
+    ----------
+    max_rows
+        Maximum number of entries listed for each category. Entries are
+        sorted by their time excluding nested entries.
+    """
+    from pymor.tools.table import format_table
+
+    titles = {'import': 'Module imports', 'metaclass': 'Class creation', 'defaults': 'Defaults registration',
+              'import_all': 'Import of all modules for defaults'}
+    stats = startup_statistics()
+    summary = [['category', 'entries', 'time (s)']]
+    summary.extend([titles[category], str(len(stats[category])),
+                    '{:.4f}'.format(sum(r[2] for r in stats[category].values()))]
+                   for category in _CATEGORIES)
+    tables = [format_table(summary, title='pyMOR startup profile (excluding nested entries)')]
+    for category in _CATEGORIES:
+        if not stats[category]:
+            continue
+        entries = sorted(stats[category].items(), key=lambda x: x[1][2], reverse=True)[:max_rows]
+        rows = [['name', 'count', 'total (s)', 'self (s)']]
+        rows.extend([name, str(count), '{:.4f}'.format(total), '{:.4f}'.format(self_time)]
+                    for name, (count, total, self_time) in entries)
+        tables.append(format_table(rows, title=titles[category]))
+    return '\n\n'.join(tables)
+
+
+def _write_report():
+    report = startup_report()
+    if _setting == '1':
+        print(report, file=sys.stderr)
+    else:
+        with open(_setting, 'wt') as f:
+            f.write(report + '\n')
+
+
+if enabled:
+    sys.meta_path.insert(0, _ImportTimer())
+    atexit.register(_write_report)
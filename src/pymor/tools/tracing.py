@@ -0,0 +1,231 @@
+# This file is part of the pyMOR project (http://www.pymor.org).
+# Copyright 2013-2017 pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (http://opensource.org/licenses/BSD-2-Clause)
+
+"""This module provides tracing of the code blocks marked with `logger.block`.
+
+While tracing is active (see :func:`start_tracing` or :func:`tracing`), each
+code block executed via ::
+
+    with logger.block('Computing Gramian ...'):
+        ...
+
+is recorded as a span, independent of the log levels. For each span, the
+wall time, the CPU time of the process and the increase of the peak resident
+set size of the process (if the :mod:`resource` module is available) are
+recorded. Spans of nested blocks are contained in the span of the enclosing
+block.
+
+When a |WorkerPool| is passed to :func:`start_tracing` and :func:`stop_tracing`,
+tracing is also enabled on the workers and the spans recorded by the workers
+are collected by :func:`stop_tracing`.
+
+The recorded spans can be written to a JSON file in the Chrome trace event
+format using :func:`write_chrome_trace`, which can be viewed with
+`chrome://tracing` or `https://ui.perfetto.dev`. Each worker is shown as a
+separate process. :func:`print_trace_summary` prints the accumulated times
+of all spans with the same name for each process.
+
+Example::
+
+    with tracing('offline.json', pool=pool) as spans:
+        greedy(d, reductor, samples, pool=pool)
+    print_trace_summary(spans)
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+try:
+    import resource
+    # ru_maxrss is given in kilobytes on Linux and in bytes on macOS
+    _RSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+    def _peak_rss():
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT
+except ImportError:
+    def _peak_rss():
+        return None
+
+
+active = False
+_spans = []
+_lock = threading.Lock()
+
+
+def _identity():
+    return socket.gethostname(), os.getpid()
+
+
+class _Span(object):
+
+    __slots__ = ['name', 'category', 'wall', 'cpu', 'rss']
+
+    def __init__(self, name, category):
+        self.name = name
+        self.category = category
+        self.wall = time.time()
+        self.cpu = time.process_time()
+        self.rss = _peak_rss()
+
+    def finish(self):
+        wall, cpu, rss = time.time(), time.process_time(), _peak_rss()
+        event = {'name': self.name, 'cat': self.category, 'ph': 'X',
+                 'ts': self.wall * 1e6, 'dur': (wall - self.wall) * 1e6,
+                 'pid': 0, 'tid': threading.get_ident(),
+                 'args': {'cpu_time': cpu - self.cpu,
+                          'peak_rss_delta': None if rss is None else rss - self.rss}}
+        with _lock:
+            _spans.append(event)
+
+
+def _begin_span(name, category):
+    """Called by :class:`~pymor.core.logger.LogIndenter` when entering a block."""
+    return _Span(name, category) if active else None
+
+
+def start_tracing(pool=None):
+    """Start recording spans.
+
+    Parameters
+    ----------
+    pool
+        If not `None`, a |WorkerPool| on whose workers tracing is
+        started as well.
+    """
+    global active
+    active = True
+    if pool is not None:
+        pool.apply(_start_worker_tracing, _identity())
+
+
+def stop_tracing(pool=None):
+    """Stop recording spans and return all recorded spans.
+
+    Parameters
+    ----------
+    pool
+        If not `None`, a |WorkerPool| on whose workers tracing is
+        stopped as well. The spans recorded by the workers are added
+        to the returned list, the `pid` of each span is set to the index
+        of the worker plus one.
+
+    Returns
+    -------
+    List of the recorded spans as Chrome trace events (complete events
+    with `'ph': 'X'`). The `pid` of the spans recorded by the calling
+    process is `0`.
+    """
+    global active, _spans
+    active = False
+    with _lock:
+        spans, _spans = _spans, []
+    if pool is not None:
+        for i, worker_spans in enumerate(pool.apply(_stop_worker_tracing, _identity())):
+            if worker_spans is None:  # worker runs in this process
+                continue
+            for span in worker_spans:
+                span['pid'] = i + 1
+            spans.extend(worker_spans)
+    return spans
+
+
+def _start_worker_tracing(master):
+    global active
+    if _identity() != master:
+        active = True
+
+
+def _stop_worker_tracing(master):
+    if _identity() == master:
+        return None
+    return stop_tracing()
+
+
+@contextmanager
+def tracing(filename=None, pool=None):
+    """Context manager for tracing a code block.
+
+    Yields a list to which the recorded spans (see :func:`stop_tracing`)
+    are added when the block is left.
+
+    Parameters
+    ----------
+    filename
+        If not `None`, the spans are written to a file with this name
+        using :func:`write_chrome_trace`.
+    pool
+        See :func:`start_tracing`.
+    """
+    spans = []
+    start_tracing(pool)
+    try:
+        yield spans
+    finally:
+        spans.extend(stop_tracing(pool))
+        if filename is not None:
+            write_chrome_trace(filename, spans)
+
+
+def write_chrome_trace(filename, spans):
+    """Write spans to a JSON file in the Chrome trace event format.
+
+    Parameters
+    ----------
+    filename
+        Name of the file to write.
+    spans
+        List of spans as returned by :func:`stop_tracing`.
+    """
+    pids = sorted({span['pid'] for span in spans})
+    metadata = [{'name': 'process_name', 'ph': 'M', 'pid': pid,
+                 'args': {'name': 'main' if pid == 0 else 'worker {}'.format(pid - 1)}}
+                for pid in pids]
+    with open(filename, 'wt') as f:
+        json.dump({'traceEvents': metadata + list(spans), 'displayTimeUnit': 'ms'}, f)
+
+
+def trace_summary(spans):
+    """Accumulate spans with the same name for each process.
+
+    Parameters
+    ----------
+    spans
+        List of spans as returned by :func:`stop_tracing`.
+
+    Returns
+    -------
+    Ordered dict mapping `(pid, name)` to a dict with the number of spans
+    (`'count'`), the accumulated wall time (`'wall_time'`) and CPU time
+    (`'cpu_time'`) in seconds and the maximum increase of the peak resident set
+    size in bytes (`'peak_rss_delta'`).
+    """
+    summary = OrderedDict()
+    for span in sorted(spans, key=lambda s: (s['pid'], s['ts'])):
+        entry = summary.setdefault((span['pid'], span['name']),
+                                   {'count': 0, 'wall_time': 0., 'cpu_time': 0., 'peak_rss_delta': None})
+        entry['count'] += 1
+        entry['wall_time'] += span['dur'] * 1e-6
+        entry['cpu_time'] += span['args']['cpu_time']
+        rss = span['args']['peak_rss_delta']
+        if rss is not None:
+            entry['peak_rss_delta'] = max(rss, entry['peak_rss_delta'] or 0)
+    return summary
+
+
+def print_trace_summary(spans):
+    """Print a table of the accumulated spans computed by :func:`trace_summary`."""
+    from pymor.tools.table import format_table
+    rows = [['process', 'block', 'count', 'wall time (s)', 'cpu time (s)', 'peak RSS delta (MB)']]
+    for (pid, name), entry in trace_summary(spans).items():
+        rss = entry['peak_rss_delta']
+        rows.append(['main' if pid == 0 else 'worker {}'.format(pid - 1), name, str(entry['count']),
+                     '{:.3f}'.format(entry['wall_time']), '{:.3f}'.format(entry['cpu_time']),
+                     '-' if rss is None else '{:.1f}'.format(rss / 1024 ** 2)])
+    print(format_table(rows))
@@ -218,6 +218,12 @@ class ListVectorArray(VectorArrayInterface):
     For an example, see :class:`NumpyVector`, :class:`NumpyListVectorSpace`
     or :class:`~pymor.bindings.fenics.FenicsVector`,
     :class:`~pymor.bindings.fenics.FenicsVectorSpace`.
+
+    :meth:`axpy`, :meth:`dot`, :meth:`gramian` and :meth:`lincomb` are
+    forwarded to the corresponding bulk methods of :class:`ListVectorSpace`
+    (:meth:`~ListVectorSpace.axpy_vectors`, :meth:`~ListVectorSpace.dot_vectors`,
+    :meth:`~ListVectorSpace.gramian_vectors`, :meth:`~ListVectorSpace.lincomb_vectors`),
+    which can be overridden to operate on all vectors at once.
     """
 
     _NONE = ()
@@ -291,29 +297,11 @@ class ListVectorArray(VectorArrayInterface):
         if self is x or x.is_view and self is x.base:
             x = x.copy()
 
-        if len(x) == 1:
-            xx = x._list[0]
-            if type(alpha) is np.ndarray:
-                for a, y in zip(alpha, self._list):
-                    y.axpy(a, xx)
-            else:
-                for y in self._list:
-                    y.axpy(alpha, xx)
-        else:
-            if type(alpha) is np.ndarray:
-                for a, xx, y in zip(alpha, x._list, self._list):
-                    y.axpy(a, xx)
-            else:
-                for xx, y in zip(x._list, self._list):
-                    y.axpy(alpha, xx)
+        self.space.axpy_vectors(alpha, x._list, self._list)
 
     def dot(self, other):
         assert self.space == other.space
-        R = np.empty((len(self._list), len(other)))
-        for i, a in enumerate(self._list):
-            for j, b in enumerate(other._list):
-                R[i, j] = a.dot(b)
-        return R
+        return self.space.dot_vectors(self._list, other._list)
 
     def pairwise_dot(self, other):
         assert self.space == other.space
@@ -321,13 +309,7 @@ class ListVectorArray(VectorArrayInterface):
         return np.array([a.dot(b) for a, b in zip(self._list, other._list)])
 
     def gramian(self):
-        l = len(self._list)
-        R = np.empty((l, l))
-        for i in range(l):
-            for j in range(i, l):
-                R[i, j] = self._list[i].dot(self._list[j])
-                R[j, i] = R[i, j]
-        return R
+        return self.space.gramian_vectors(self._list)
 
     def lincomb(self, coefficients):
         assert 1 <= coefficients.ndim <= 2
@@ -336,14 +318,7 @@ class ListVectorArray(VectorArrayInterface):
 
         assert coefficients.shape[1] == len(self)
 
-        RL = []
-        for coeffs in coefficients:
-            R = self.space.zero_vector()
-            for v, c in zip(self._list, coeffs):
-                R.axpy(c, v)
-            RL.append(R)
-
-        return ListVectorArray(RL, self.space)
+        return ListVectorArray(self.space.lincomb_vectors(self._list, coefficients), self.space)
 
     def l1_norm(self):
         return np.array([v.l1_norm() for v in self._list])
@@ -390,7 +365,15 @@ class ListVectorArray(VectorArrayInterface):
 
 
 class ListVectorSpace(VectorSpaceInterface):
-    """|VectorSpace| of |ListVectorArrays|."""
+    """|VectorSpace| of |ListVectorArrays|.
+
+    The methods :meth:`axpy_vectors`, :meth:`dot_vectors`, :meth:`gramian_vectors`
+    and :meth:`lincomb_vectors` implement the corresponding |VectorArray|
+    operations on lists of vectors. The default implementations loop over
+    the individual vectors. Wrappers for external solvers which support
+    multi-vector operations should override these methods to avoid the
+    quadratic number of calls of :meth:`VectorInterface.dot`.
+    """
 
     dim = None
 
@@ -413,6 +396,76 @@ class ListVectorSpace(VectorSpaceInterface):
     def space_from_dim(cls, dim, id_):
         raise NotImplementedError
 
+    def axpy_vectors(self, alpha, x, y):
+        """In-place `y[i] += alpha[i] * x[i]` for lists of vectors `x`, `y`.
+
+        Parameters
+        ----------
+        alpha
+            Scalar or one-dimensional |NumPy array| of length `len(y)`.
+        x
+            List of vectors of length `len(y)` or `1`. In the latter case,
+            the single vector is added to each vector of `y`.
+        y
+            List of vectors to which `x` is added.
+        """
+        if len(x) == 1:
+            xx = x[0]
+            if type(alpha) is np.ndarray:
+                for a, yy in zip(alpha, y):
+                    yy.axpy(a, xx)
+            else:
+                for yy in y:
+                    yy.axpy(alpha, xx)
+        else:
+            if type(alpha) is np.ndarray:
+                for a, xx, yy in zip(alpha, x, y):
+                    yy.axpy(a, xx)
+            else:
+                for xx, yy in zip(x, y):
+                    yy.axpy(alpha, xx)
+
+    def dot_vectors(self, left, right):
+        """Matrix of the inner products of the vectors in the lists `left` and `right`."""
+        R = np.empty((len(left), len(right)))
+        for i, a in enumerate(left):
+            for j, b in enumerate(right):
+                R[i, j] = a.dot(b)
+        return R
+
+    def gramian_vectors(self, vectors):
+        """Gramian of the vectors in the list `vectors`."""
+        l = len(vectors)
+        R = np.empty((l, l))
+        for i in range(l):
+            for j in range(i, l):
+                R[i, j] = vectors[i].dot(vectors[j])
+                R[j, i] = R[i, j]
+        return R
+
+    def lincomb_vectors(self, vectors, coefficients):
+        """Linear combinations of the vectors in the list `vectors`.
+
+        Parameters
+        ----------
+        vectors
+            List of vectors.
+        coefficients
+            Two-dimensional |NumPy array| of shape `(k, len(vectors))`.
+
+        Returns
+        -------
+        List of `k` new vectors, where the `i`-th vector is the linear
+        combination of `vectors` with coefficients `coefficients[i]`.
+        """
+        RL = []
+        for coeffs in coefficients:
+            R = self.zero_vector()
+            for v, c in zip(vectors, coeffs):
+                R.axpy(c, v)
+            RL.append(R)
+        return RL
+
     def zeros(self, count=1, reserve=0):
         assert count >= 0 and reserve >= 0
         return ListVectorArray([self.zero_vector() for _ in range(count)], self)
@@ -464,6 +517,20 @@ class NumpyListVectorSpace(ListVectorSpace):
     def vector_from_data(self, data):
         return self.make_vector(data)
 
+    def _stack(self, vectors):
+        return np.array([v._array for v in vectors]) if vectors else np.empty((0, self.dim))
+
+    def dot_vectors(self, left, right):
+        return self._stack(left).dot(self._stack(right).T)
+
+    def gramian_vectors(self, vectors):
+        A = self._stack(vectors)
+        return A.dot(A.T)
+
+    def lincomb_vectors(self, vectors, coefficients):
+        R = coefficients.dot(self._stack(vectors))
+        return [NumpyVector(v) for v in R.astype(np.promote_types(R.dtype, np.float64), copy=False)]
+
 
 class ListVectorArrayView(ListVectorArray):
 
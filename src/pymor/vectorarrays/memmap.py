@@ -0,0 +1,530 @@
+# This file is part of the pyMOR project (http://www.pymor.org).
+# Copyright 2013-2017 pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (http://opensource.org/licenses/BSD-2-Clause)
+
+"""Out-of-core |VectorArray| implementation based on memory-mapped files.
+
+:class:`MemmapVectorArray` stores its vectors as the rows of a memory-mapped
+file (see :class:`numpy.memmap`), such that the size of the array is only
+limited by the available disk space. All operations process the vectors in
+blocks of at most :attr:`MemmapVectorSpace.block_size` bytes:
+:meth:`~MemmapVectorArray.dot`, :meth:`~MemmapVectorArray.gramian` and
+:meth:`~MemmapVectorArray.lincomb` iterate over blocks of components of all
+vectors, such that the file is read only once, whereas all other operations
+iterate over blocks of vectors.
+
+For instance, the POD of a snapshot set which does not fit into main memory
+can be computed via::
+
+    space = MemmapVectorSpace(d.solution_space.dim, directory='/scratch')
+    snapshots = space.empty()
+    for mu in parameter_samples:
+        snapshots.append(d.solve(mu))
+    modes, svals = pod(snapshots)
+
+Vectors stored in a `.npy` file (e.g. written by :meth:`MemmapVectorArray.save`)
+can be mapped without loading them via :meth:`MemmapVectorSpace.from_file`.
+"""
+
+import os
+import tempfile
+import weakref
+
+import numpy as np
+
+from pymor.vectorarrays.interfaces import VectorArrayInterface, VectorSpaceInterface, _INDEXTYPES
+
+
+def _remove_file(filename):
+    try:
+        os.remove(filename)
+    except OSError:
+        pass
+
+
+def _normalize(ind):
+    """Convert an index normalized by `normalize_ind` to a slice with positive step or an index array."""
+    if type(ind) is slice:
+        step = 1 if ind.step is None else ind.step
+        if step > 0:
+            return slice(ind.start, ind.stop, step)
+        return np.arange(ind.start, ind.stop, step)
+    return np.asarray(ind, dtype=int)
+
+
+def _length(rows):
+    return len(range(rows.start, rows.stop, rows.step)) if type(rows) is slice else len(rows)
+
+
+def _index_blocks(rows, size):
+    """Split `rows` into blocks of at most `size` indices.
+
+    Yields tuples `(start, stop, block)`, where `block` indexes the rows
+    `start:stop` of `rows`.
+    """
+    if type(rows) is slice:
+        r = range(rows.start, rows.stop, rows.step)
+        for i in range(0, len(r), size):
+            b = r[i:i + size]
+            yield i, i + len(b), slice(b.start, b.stop, b.step)
+    else:
+        for i in range(0, len(rows), size):
+            b = rows[i:i + size]
+            yield i, i + len(b), b
+
+
+def _source(va):
+    """Return `(array, rows)` such that `array[rows]` contains the vectors of `va`."""
+    if isinstance(va, MemmapVectorArray):
+        if va.is_view:
+            return va.base._array, _normalize(va.ind)
+        return va._array, slice(0, va._len, 1)
+    data = va.data
+    return data, slice(0, len(data), 1)
+
+
+class MemmapVectorArray(VectorArrayInterface):
+    """|VectorArray| implementation via memory-mapped |NumPy arrays|.
+
+    The vectors are stored as the rows of a :class:`numpy.memmap` in a
+    temporary file in :attr:`MemmapVectorSpace.directory`, which is
+    removed as soon as it is no longer used. As for |NumpyVectorArray|,
+    copies share the file until one of them is modified, and appending
+    vectors increases the capacity of the file geometrically.
+
+    Operations with other |VectorArrays| of the same dimension are supported,
+    in which case the data of the other array is accessed via its `data`
+    attribute.
+
+    The associated |VectorSpace| is :class:`MemmapVectorSpace`.
+    """
+
+    def __init__(self, array, space, length=None):
+        self._array = array
+        self.space = space
+        self._refcount = [1]
+        self._len = len(array) if length is None else length
+
+    @property
+    def data(self):
+        if self._refcount[0] > 1:
+            self._reallocate(self._array.shape[0])
+        return np.asarray(self._array[:self._len])
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, ind):
+        return MemmapVectorArrayView(self, ind)
+
+    def __delitem__(self, ind):
+        assert self.check_ind(ind)
+        length = self._len
+        if type(ind) is slice:
+            ind = set(range(*ind.indices(length)))
+        elif not hasattr(ind, '__len__'):
+            ind = {ind if 0 <= ind else length + ind}
+        else:
+            ind = set(i if 0 <= i else length + i for i in ind)
+        remaining = np.array(sorted(set(range(length)) - ind), dtype=int)
+
+        if self._refcount[0] > 1 or not self._array.flags.writeable:
+            self._reallocate(self._array.shape[0], rows=remaining)
+            return
+
+        # each remaining vector is moved towards the front of the array, so
+        # no vector is overwritten before it has been moved
+        for start, stop, block in _index_blocks(remaining, self._block_rows()):
+            self._array[start:stop] = self._array[block]
+        self._len = len(remaining)
+
+    def copy(self, deep=False, *, _ind=None):
+        if _ind is None and not deep:
+            C = MemmapVectorArray(self._array, self.space, self._len)
+            C._refcount = self._refcount
+            self._refcount[0] += 1
+            return C
+        rows = self._rows(_ind)
+        array = self.space._allocate(_length(rows), self._array.dtype)
+        for start, stop, block in _index_blocks(rows, self._block_rows()):
+            array[start:stop] = self._array[block]
+        return MemmapVectorArray(array, self.space)
+
+    def append(self, other, remove_from_other=False):
+        assert self.dim == other.dim
+        assert not remove_from_other or (other is not self and getattr(other, 'base', None) is not self)
+
+        source, rows = _source(other)
+        len_other = _length(rows)
+        if len_other == 0:
+            return
+
+        # if `other` shares the file with `self`, `source` keeps referring to
+        # the old file after reallocation, which still holds the same data
+        capacity = self._array.shape[0]
+        if self._len + len_other > capacity:
+            capacity = max(self._len + len_other, int(capacity * 1.5))
+        self._prepare_write(source.dtype, capacity)
+
+        for start, stop, block in _index_blocks(rows, self._block_rows()):
+            self._array[self._len + start:self._len + stop] = source[block]
+        self._len += len_other
+
+        if remove_from_other:
+            if other.is_view:
+                del other.base[other.ind]
+            else:
+                del other[:]
+
+    def save(self, path):
+        """Save the vectors to the `.npy` file `path`.
+
+        The file can be mapped again via :meth:`MemmapVectorSpace.from_file`.
+        """
+        source, rows = _source(self)
+        shape = (_length(rows), self.dim)
+        if shape[0] * shape[1] == 0:
+            np.save(path, np.empty(shape, dtype=source.dtype))
+            return
+        array = np.lib.format.open_memmap(path, mode='w+', dtype=source.dtype, shape=shape)
+        size = max(1, self.space.block_size // (self.dim * source.dtype.itemsize))
+        for start, stop, block in _index_blocks(rows, size):
+            array[start:stop] = source[block]
+        array.flush()
+
+    def scal(self, alpha, *, _ind=None):
+        rows = self._rows(_ind)
+        assert isinstance(alpha, _INDEXTYPES) \
+            or isinstance(alpha, np.ndarray) and alpha.shape == (_length(rows),)
+
+        self._prepare_write(alpha.dtype if type(alpha) is np.ndarray else type(alpha))
+        for start, stop, block in _index_blocks(rows, self._block_rows()):
+            self._array[block] *= alpha[start:stop, np.newaxis] if type(alpha) is np.ndarray else alpha
+
+    def axpy(self, alpha, x, *, _ind=None):
+        rows = self._rows(_ind)
+        assert self.dim == x.dim
+        assert isinstance(alpha, _INDEXTYPES) \
+            or isinstance(alpha, np.ndarray) and alpha.shape == (_length(rows),)
+
+        source, x_rows = _source(x)
+        len_x = _length(x_rows)
+        assert _length(rows) == len_x or len_x == 1
+
+        alpha_dtype = alpha.dtype if type(alpha) is np.ndarray else type(alpha)
+        self._prepare_write(np.promote_types(alpha_dtype, source.dtype))
+
+        if len_x == 1:
+            B = np.array(source[x_rows])
+            for start, stop, block in _index_blocks(rows, self._block_rows()):
+                self._array[block] += B * (alpha[start:stop, np.newaxis] if type(alpha) is np.ndarray else alpha)
+        else:
+            if source is self._array:
+                # x is a view of self: blocks of x could be modified before they are read
+                source, x_rows = _source(x.copy(deep=True))
+            size = self._block_rows()
+            for (start, stop, block), (_, _, x_block) in zip(_index_blocks(rows, size),
+                                                             _index_blocks(x_rows, size)):
+                self._array[block] += \
+                    source[x_block] * (alpha[start:stop, np.newaxis] if type(alpha) is np.ndarray else alpha)
+
+    def dot(self, other, *, _ind=None):
+        rows = self._rows(_ind)
+        assert self.dim == other.dim
+
+        source, other_rows = _source(other)
+        complex_other = np.iscomplexobj(source)
+        n, m = _length(rows), _length(other_rows)
+        R = np.zeros((n, m), dtype=np.promote_types(self._array.dtype, source.dtype))
+        for cols in self._column_blocks(n + m):
+            B = source[other_rows, cols]
+            R += self._array[rows, cols].dot(B.conj().T if complex_other else B.T)
+        return R
+
+    def pairwise_dot(self, other, *, _ind=None):
+        rows = self._rows(_ind)
+        assert self.dim == other.dim
+
+        source, other_rows = _source(other)
+        assert _length(rows) == _length(other_rows)
+
+        complex_other = np.iscomplexobj(source)
+        R = np.empty(_length(rows), dtype=np.promote_types(self._array.dtype, source.dtype))
+        size = self._block_rows()
+        for (start, stop, block), (_, _, other_block) in zip(_index_blocks(rows, size),
+                                                             _index_blocks(other_rows, size)):
+            B = source[other_block]
+            R[start:stop] = np.sum(self._array[block] * (B.conj() if complex_other else B), axis=1)
+        return R
+
+    def gramian(self, *, _ind=None):
+        rows = self._rows(_ind)
+        n = _length(rows)
+        R = np.zeros((n, n), dtype=self._array.dtype)
+        for cols in self._column_blocks(n):
+            A = self._array[rows, cols]
+            R += A.dot(A.conj().T)
+        return R
+
+    def lincomb(self, coefficients, *, _ind=None):
+        rows = self._rows(_ind)
+        assert 1 <= coefficients.ndim <= 2
+
+        if coefficients.ndim == 1:
+            coefficients = coefficients[np.newaxis, ...]
+        assert coefficients.shape[1] == _length(rows)
+
+        array = self.space._allocate(len(coefficients), np.promote_types(coefficients.dtype, self._array.dtype))
+        for cols in self._column_blocks(len(coefficients) + _length(rows)):
+            array[:, cols] = coefficients.dot(self._array[rows, cols])
+        return MemmapVectorArray(array, self.space)
+
+    def l1_norm(self, *, _ind=None):
+        return self._reduce(lambda A: np.linalg.norm(A, ord=1, axis=1), _ind)
+
+    def l2_norm(self, *, _ind=None):
+        return self._reduce(lambda A: np.linalg.norm(A, axis=1), _ind)
+
+    def l2_norm2(self, *, _ind=None):
+        return self._reduce(lambda A: np.sum((A * A.conj()).real, axis=1), _ind)
+
+    def sup_norm(self, *, _ind=None):
+        if self.dim == 0:
+            return np.zeros(_length(self._rows(_ind)))
+        else:
+            _, max_val = self.amax(_ind=_ind)
+            return max_val
+
+    def components(self, component_indices, *, _ind=None):
+        rows = self._rows(_ind)
+        assert isinstance(component_indices, list) and (len(component_indices) == 0 or min(component_indices) >= 0) \
+            or (isinstance(component_indices, np.ndarray) and component_indices.ndim == 1
+                and (len(component_indices) == 0 or np.min(component_indices) >= 0))
+        assert len(component_indices) == 0 or np.max(component_indices) < self.dim
+
+        component_indices = np.asarray(component_indices, dtype=int)
+        R = np.empty((_length(rows), len(component_indices)), dtype=self._array.dtype)
+        for start, stop, block in _index_blocks(rows, self._block_rows()):
+            R[start:stop] = self._array[block][:, component_indices]
+        return R
+
+    def amax(self, *, _ind=None):
+        rows = self._rows(_ind)
+        assert self.dim > 0
+
+        MI = np.empty(_length(rows), dtype=int)
+        MV = np.empty(_length(rows))
+        for start, stop, block in _index_blocks(rows, self._block_rows()):
+            A = np.abs(self._array[block])
+            MI[start:stop] = np.argmax(A, axis=1)
+            MV[start:stop] = A[np.arange(len(A)), MI[start:stop]]
+        return MI, MV
+
+    def __str__(self):
+        return 'MemmapVectorArray of {} vectors of dimension {}'.format(self._len, self.dim)
+
+    def __del__(self):
+        self._refcount[0] -= 1
+
+    def _rows(self, _ind):
+        return slice(0, self._len, 1) if _ind is None else _normalize(_ind)
+
+    def _block_rows(self):
+        """Number of vectors processed at once by row-wise operations."""
+        return max(1, self.space.block_size // max(1, self.dim * self._array.dtype.itemsize))
+
+    def _column_blocks(self, count):
+        """Slices of components processed at once by operations involving `count` vectors."""
+        step = max(1, self.space.block_size // max(1, count * self._array.dtype.itemsize))
+        return (slice(c, c + step) for c in range(0, self.dim, step))
+
+    def _reduce(self, func, _ind):
+        rows = self._rows(_ind)
+        R = np.empty(_length(rows))
+        for start, stop, block in _index_blocks(rows, self._block_rows()):
+            R[start:stop] = func(self._array[block])
+        return R
+
+    def _prepare_write(self, dtype=None, capacity=None):
+        """Ensure that the array owns a writable file of the given capacity which can hold `dtype`."""
+        dtype = self._array.dtype if dtype is None else np.promote_types(self._array.dtype, dtype)
+        capacity = self._array.shape[0] if capacity is None else capacity
+        if (self._refcount[0] > 1 or not self._array.flags.writeable
+                or dtype != self._array.dtype or capacity != self._array.shape[0]):
+            self._reallocate(capacity, dtype)
+
+    def _reallocate(self, capacity, dtype=None, rows=None):
+        """Copy the vectors given by `rows` to a new file with the given capacity."""
+        rows = slice(0, self._len, 1) if rows is None else rows
+        array = self.space._allocate(capacity, self._array.dtype if dtype is None else dtype)
+        for start, stop, block in _index_blocks(rows, self._block_rows()):
+            array[start:stop] = self._array[block]
+        self._array = array
+        self._len = _length(rows)
+        self._refcount[0] -= 1
+        self._refcount = [1]
+
+
+class MemmapVectorSpace(VectorSpaceInterface):
+    """|VectorSpace| of :class:`MemmapVectorArrays <MemmapVectorArray>`.
+
+    Parameters
+    ----------
+    dim
+        The dimension of the vectors contained in the space.
+    directory
+        Directory in which the memory-mapped files are created. If `None`,
+        the default directory for temporary files is used.
+    block_size
+        Maximum size in bytes of the blocks of vector data which are
+        processed at once.
+    id_
+        See :attr:`~pymor.vectorarrays.interfaces.VectorSpaceInterface.id`.
+    """
+
+    def __init__(self, dim, directory=None, block_size=64 * 1024 ** 2, id_=None):
+        self.dim = dim
+        self.directory = directory
+        self.block_size = block_size
+        self.id = id_
+
+    def __eq__(self, other):
+        return type(other) is type(self) and self.dim == other.dim and self.id == other.id
+
+    def __hash__(self):
+        return hash(self.dim) + hash(self.id)
+
+    def zeros(self, count=1, reserve=0):
+        assert count >= 0
+        assert reserve >= 0
+        return MemmapVectorArray(self._allocate(max(count, reserve)), self, count)
+
+    def make_array(self, obj):
+        """Create a :class:`MemmapVectorArray` holding a copy of `obj`.
+
+        Parameters
+        ----------
+        obj
+            A one- or two-dimensional |NumPy array| or a |VectorArray| of
+            dimension :attr:`dim` with a `data` attribute.
+        """
+        if isinstance(obj, VectorArrayInterface):
+            assert obj.dim == self.dim
+            source, rows = _source(obj)
+        else:
+            source = np.asarray(obj)
+            if source.ndim == 1:
+                source = source.reshape((1, -1))
+            assert source.ndim == 2 and source.shape[1] == self.dim
+            rows = slice(0, len(source), 1)
+        U = MemmapVectorArray(self._allocate(_length(rows), source.dtype), self)
+        for start, stop, block in _index_blocks(rows, U._block_rows()):
+            U._array[start:stop] = source[block]
+        return U
+
+    def from_data(self, data):
+        return self.make_array(data)
+
+    def from_file(self, path):
+        """Memory-map the vectors stored in the `.npy` file `path`.
+
+        The file is opened read-only. When the returned array is modified,
+        its vectors are first copied to a new temporary file.
+        """
+        array = np.load(path, mmap_mode='r')
+        if array.ndim == 1:
+            array = array.reshape((1, -1))
+        assert array.ndim == 2 and array.shape[1] == self.dim
+        return MemmapVectorArray(array, self)
+
+    def _allocate(self, count, dtype=np.float64):
+        """Create a zero-initialized memory-mapped array of `count` vectors."""
+        if count * self.dim == 0:
+            return np.zeros((count, self.dim), dtype=dtype)  # empty files cannot be mapped
+        fd, filename = tempfile.mkstemp(prefix='pymor_vectors_', suffix='.dat', dir=self.directory)
+        os.close(fd)
+        array = np.memmap(filename, dtype=dtype, mode='w+', shape=(count, self.dim))
+        if os.name == 'posix':
+            # the mapping stays valid, and the disk space is freed when it is closed
+            _remove_file(filename)
+        else:
+            weakref.finalize(array, _remove_file, filename)
+        return array
+
+    def __repr__(self):
+        return 'MemmapVectorSpace({})'.format(self.dim) if self.id is None \
+            else 'MemmapVectorSpace({}, {})'.format(self.dim, self.id)
+
+
+class MemmapVectorArrayView(MemmapVectorArray):
+
+    is_view = True
+
+    def __init__(self, array, ind):
+        assert array.check_ind(ind)
+        self.base = array
+        self.ind = array.normalize_ind(ind)
+        self.space = array.space
+
+    @property
+    def data(self):
+        return self.base.data[_normalize(self.ind)]
+
+    def __len__(self):
+        return self.base.len_ind(self.ind)
+
+    def __getitem__(self, ind):
+        return self.base[self.base.sub_index(self.ind, ind)]
+
+    def __delitem__(self, ind):
+        raise ValueError('Cannot remove from MemmapVectorArrayView')
+
+    def append(self, other, remove_from_other=False):
+        raise ValueError('Cannot append to MemmapVectorArrayView')
+
+    def copy(self, deep=False):
+        return self.base.copy(_ind=self.ind, deep=deep)
+
+    def scal(self, alpha):
+        assert self.base.check_ind_unique(self.ind)
+        self.base.scal(alpha, _ind=self.ind)
+
+    def axpy(self, alpha, x):
+        assert self.base.check_ind_unique(self.ind)
+        self.base.axpy(alpha, x, _ind=self.ind)
+
+    def dot(self, other):
+        return self.base.dot(other, _ind=self.ind)
+
+    def pairwise_dot(self, other):
+        return self.base.pairwise_dot(other, _ind=self.ind)
+
+    def gramian(self):
+        return self.base.gramian(_ind=self.ind)
+
+    def lincomb(self, coefficients):
+        return self.base.lincomb(coefficients, _ind=self.ind)
+
+    def l1_norm(self):
+        return self.base.l1_norm(_ind=self.ind)
+
+    def l2_norm(self):
+        return self.base.l2_norm(_ind=self.ind)
+
+    def l2_norm2(self):
+        return self.base.l2_norm2(_ind=self.ind)
+
+    def sup_norm(self):
+        return self.base.sup_norm(_ind=self.ind)
+
+    def components(self, component_indices):
+        return self.base.components(component_indices, _ind=self.ind)
+
+    def amax(self):
+        return self.base.amax(_ind=self.ind)
+
+    def __str__(self):
+        return 'MemmapVectorArrayView of {} vectors of dimension {}'.format(len(self), self.dim)
+
+    def __del__(self):
+        pass
@@ -7,10 +7,25 @@ import numpy as np
 from scipy.sparse import issparse
 
 from pymor.core import NUMPY_INDEX_QUIRK
+from pymor.core.defaults import defaults
 from pymor.core.interfaces import classinstancemethod
 from pymor.vectorarrays.interfaces import VectorArrayInterface, VectorSpaceInterface, _INDEXTYPES
 
 
+@defaults('growth_factor')
+def append_settings(growth_factor=1.5):
+    """Settings for :meth:`NumpyVectorArray.append`.
+
+    Parameters
+    ----------
+    growth_factor
+        Factor by which the capacity of a |NumpyVectorArray| is at least
+        increased when appended vectors do not fit into it.
+    """
+    assert growth_factor >= 1
+    return {'growth_factor': growth_factor}
+
+
 class NumpyVectorArray(VectorArrayInterface):
     """|VectorArray| implementation via |NumPy arrays|.
 
@@ -22,13 +37,22 @@ class NumpyVectorArray(VectorArrayInterface):
     |NumPy array|. Thus, while operations like
     :meth:`~pymor.vectorarrays.interfaces.VectorArrayInterface.axpy` or
     :meth:`~pymor.vectorarrays.interfaces.VectorArrayInterface.dot`
-    will be quite efficient, removing or appending vectors will
-    be costly.
+    will be quite efficient, removing vectors will be costly.
 
-    The associated |VectorSpace| is |NumpyVectorSpace|.
+    When appending vectors exceeds the reserved capacity of the array,
+    the capacity is increased geometrically (see :meth:`append`), such
+    that building an array by repeated appends has linear complexity.
+    The unused capacity can be released via :meth:`shrink_to_fit`.
+
+    The associated |VectorSpace| is |NumpyVectorSpace|. If the space has a
+    :attr:`~NumpyVectorSpace.dtype`, the array is stored with this precision.
     """
 
     def __init__(self, array, space):
+        if space.dtype is not None:
+            dtype = space._storage_dtype(array.dtype)
+            if array.dtype != dtype:
+                array = array.astype(dtype)
         self._array = array
         self.space = space
         self._refcount = [1]
@@ -85,8 +109,17 @@ class NumpyVectorArray(VectorArrayInterface):
                 new_array = new_array.copy()
             return NumpyVectorArray(new_array, self.space)
 
-    def append(self, other, remove_from_other=False):
+    def append(self, other, remove_from_other=False, growth_factor=None):
+        """Append vectors to the array.
+
+        See :meth:`~pymor.vectorarrays.interfaces.VectorArrayInterface.append`.
+        If the appended vectors do not fit into the reserved capacity, the
+        capacity is increased to at least `growth_factor` times the current
+        capacity. If `growth_factor` is `None`, the value returned by
+        :func:`append_settings` is used.
+        """
         assert self.dim == other.dim
+        assert growth_factor is None or growth_factor >= 1
         assert not remove_from_other or (other is not self and getattr(other, 'base', None) is not self)
 
         if self._refcount[0] > 1:
@@ -97,12 +130,19 @@ class NumpyVectorArray(VectorArrayInterface):
         if len_other == 0:
             return
 
+        dtype = self.space._storage_dtype(np.promote_types(self._array.dtype, other_array.dtype))
         if len_other <= self._array.shape[0] - self._len:
-            if self._array.dtype != other_array.dtype:
-                self._array = self._array.astype(np.promote_types(self._array.dtype, other_array.dtype))
+            if self._array.dtype != dtype:
+                self._array = self._array.astype(dtype)
             self._array[self._len:self._len + len_other] = other_array
         else:
-            self._array = np.append(self._array[:self._len], other_array, axis=0)
+            if growth_factor is None:  # only look up the default when reallocating
+                growth_factor = append_settings()['growth_factor']
+            capacity = max(self._len + len_other, int(self._array.shape[0] * growth_factor))
+            new_array = np.empty((capacity, self._array.shape[1]), dtype=dtype)
+            new_array[:self._len] = self._array[:self._len]
+            new_array[self._len:self._len + len_other] = other_array
+            self._array = new_array
         self._len += len_other
 
         if remove_from_other:
@@ -111,6 +151,21 @@ class NumpyVectorArray(VectorArrayInterface):
             else:
                 del other[:]
 
+    def __getstate__(self):
+        # the capacity reserved for appending is uninitialized and not pickled
+        if '_array' in self.__dict__ and self._array.shape[0] > self._len:
+            state = self.__dict__.copy()
+            state['_array'] = self._array[:self._len]
+            return state
+        return self.__dict__
+
+    def shrink_to_fit(self):
+        """Release the capacity reserved for appending further vectors."""
+        if self._array.shape[0] > self._len:
+            self._array = self._array[:self._len].copy()
+            self._refcount[0] -= 1
+            self._refcount = [1]
+
     def scal(self, alpha, *, _ind=None):
         if _ind is None:
             _ind = slice(0, self._len)
@@ -125,8 +180,9 @@ class NumpyVectorArray(VectorArrayInterface):
 
         alpha_type = type(alpha)
         alpha_dtype = alpha.dtype if alpha_type is np.ndarray else alpha_type
-        if self._array.dtype != alpha_dtype:
-            self._array = self._array.astype(np.promote_types(self._array.dtype, alpha_dtype))
+        dtype = self.space._storage_dtype(np.promote_types(self._array.dtype, alpha_dtype))
+        if self._array.dtype != dtype:
+            self._array = self._array.astype(dtype)
         self._array[_ind] *= alpha
 
     def axpy(self, alpha, x, *, _ind=None):
@@ -146,8 +202,9 @@ class NumpyVectorArray(VectorArrayInterface):
         alpha_dtype = alpha.dtype if alpha_type is np.ndarray else alpha_type
         if self._array.dtype != alpha_dtype or self._array.dtype != B.dtype:
             dtype = np.promote_types(self._array.dtype, alpha_dtype)
-            dtype = np.promote_types(dtype, B.dtype)
-            self._array = self._array.astype(dtype)
+            dtype = self.space._storage_dtype(np.promote_types(dtype, B.dtype))
+            if self._array.dtype != dtype:
+                self._array = self._array.astype(dtype)
 
         if type(alpha) is np.ndarray:
             alpha = alpha[:, np.newaxis]
@@ -177,9 +234,22 @@ class NumpyVectorArray(VectorArrayInterface):
         assert len(A) == len(B)
 
         if B.dtype in _complex_dtypes:
-            return np.sum(A * B.conj(), axis=1)
+            return _sum_rows(A * B.conj())
+        else:
+            return _sum_rows(A * B)
+
+    def gramian(self, *, _ind=None):
+        if _ind is None:
+            _ind = slice(0, self._len)
+        # index the array only once and multiply it with its own transpose; for
+        # real arrays, NumPy then computes only one triangle of the product (BLAS
+        # syrk), whereas for complex arrays the conjugate is a new array and a
+        # general matrix product is computed
+        A = self._array[_ind]
+        if A.dtype in _complex_dtypes:
+            return A.dot(A.conj().T)
         else:
-            return np.sum(A * B, axis=1)
+            return A.dot(A.T)
 
     def lincomb(self, coefficients, *, _ind=None):
         if _ind is None:
@@ -188,6 +258,9 @@ class NumpyVectorArray(VectorArrayInterface):
 
         if coefficients.ndim == 1:
             coefficients = coefficients[np.newaxis, ...]
+        if self.space.dtype is not None:
+            # avoid converting the vectors to the precision of the coefficients
+            coefficients = coefficients.astype(self.space._storage_dtype(coefficients.dtype), copy=False)
 
         return NumpyVectorArray(coefficients.dot(self._array[_ind]), self.space)
 
@@ -205,7 +278,7 @@ class NumpyVectorArray(VectorArrayInterface):
         if _ind is None:
             _ind = slice(0, self._len)
         A = self._array[_ind]
-        return np.sum((A * A.conj()).real, axis=1)
+        return _sum_rows((A * A.conj()).real)
 
     def sup_norm(self, *, _ind=None):
         if self.dim == 0:
@@ -282,7 +355,7 @@ class NumpyVectorArray(VectorArrayInterface):
         if self._refcount[0] > 1:
             self._deep_copy()
         other_dtype = other.base._array.dtype if other.is_view else other._array.dtype
-        common_dtype = np.promote_types(self._array.dtype, other_dtype)
+        common_dtype = self.space._storage_dtype(np.promote_types(self._array.dtype, other_dtype))
         if self._array.dtype != common_dtype:
             self._array = self._array.astype(common_dtype)
         self._array[:self._len] += other.base._array[other.ind] if other.is_view else other._array[:other._len]
@@ -301,7 +374,7 @@ class NumpyVectorArray(VectorArrayInterface):
         if self._refcount[0] > 1:
             self._deep_copy()
         other_dtype = other.base._array.dtype if other.is_view else other._array.dtype
-        common_dtype = np.promote_types(self._array.dtype, other_dtype)
+        common_dtype = self.space._storage_dtype(np.promote_types(self._array.dtype, other_dtype))
         if self._array.dtype != common_dtype:
             self._array = self._array.astype(common_dtype)
         self._array[:self._len] -= other.base._array[other.ind] if other.is_view else other._array[:other._len]
@@ -318,7 +391,7 @@ class NumpyVectorArray(VectorArrayInterface):
         if self._refcount[0] > 1:
             self._deep_copy()
         other_dtype = other.dtype if isinstance(other, np.ndarray) else type(other)
-        common_dtype = np.promote_types(self._array.dtype, other_dtype)
+        common_dtype = self.space._storage_dtype(np.promote_types(self._array.dtype, other_dtype))
         if self._array.dtype != common_dtype:
             self._array = self._array.astype(common_dtype)
         self._array[:self._len] *= other
@@ -337,23 +410,41 @@ class NumpyVectorSpace(VectorSpaceInterface):
         The dimension of the vectors contained in the space.
     id
         See :attr:`~pymor.vectorarrays.interfaces.VectorSpaceInterface.id`.
+    dtype
+        If not `None`, the floating point type (e.g. `np.float32`) with which
+        the vectors of all arrays in the space are stored, regardless of the
+        precision of the data they are created from or combined with.
+        Complex vectors are stored with the corresponding complex type. If
+        `None`, the type of the data is kept and new arrays are `np.float64`.
+        Spaces with different `dtype` are considered different spaces, so
+        arrays of different precision have to be converted explicitly, e.g.
+        using :meth:`~NumpyVectorSpace.from_data`.
+
+        For single precision spaces, :meth:`~NumpyVectorArray.dot` and
+        :meth:`~NumpyVectorArray.gramian` are computed in single precision,
+        whereas :meth:`~NumpyVectorArray.pairwise_dot` and
+        :meth:`~NumpyVectorArray.l2_norm2` accumulate in double precision
+        before rounding the result to single precision.
     """
 
-    def __init__(self, dim, id_=None):
+    def __init__(self, dim, id_=None, dtype=None):
+        assert dtype is None or np.dtype(dtype).kind in 'fc'
         self.dim = dim
         self.id = id_
+        self.dtype = None if dtype is None else np.dtype(dtype)
 
     def __eq__(self, other):
-        return type(other) is type(self) and self.dim == other.dim and self.id == other.id
+        return (type(other) is type(self) and self.dim == other.dim and self.id == other.id
+                and self.dtype == other.dtype)
 
     def __hash__(self):
-        return hash(self.dim) + hash(self.id)
+        return hash(self.dim) + hash(self.id) + hash(self.dtype)
 
     def zeros(self, count=1, reserve=0):
         assert count >= 0
         assert reserve >= 0
         va = NumpyVectorArray(np.empty((0, 0)), self)
-        va._array = np.zeros((max(count, reserve), self.dim))
+        va._array = np.zeros((max(count, reserve), self.dim), dtype=self.dtype)
         va._len = count
         return va
 
@@ -416,9 +507,19 @@ class NumpyVectorSpace(VectorSpaceInterface):
     def is_scalar(self):
         return self.dim == 1
 
+    def _storage_dtype(self, dtype):
+        """Type with which vectors of type `dtype` are stored in this space."""
+        if self.dtype is None:
+            return dtype
+        return np.promote_types(self.dtype, np.complex64) if np.dtype(dtype).kind == 'c' else self.dtype
+
     def __repr__(self):
-        return 'NumpyVectorSpace({})'.format(self.dim) if self.id is None \
-            else 'NumpyVectorSpace({}, {})'.format(self.dim, self.id)
+        args = [str(self.dim)]
+        if self.id is not None:
+            args.append(str(self.id))
+        if self.dtype is not None:
+            args.append('dtype={}'.format(self.dtype))
+        return 'NumpyVectorSpace({})'.format(', '.join(args))
 
 
 class NumpyVectorArrayView(NumpyVectorArray):
@@ -464,6 +565,9 @@ class NumpyVectorArrayView(NumpyVectorArray):
     def pairwise_dot(self, other):
         return self.base.pairwise_dot(other, _ind=self.ind)
 
+    def gramian(self):
+        return self.base.gramian(_ind=self.ind)
+
     def lincomb(self, coefficients):
         return self.base.lincomb(coefficients, _ind=self.ind)
 
@@ -500,7 +604,7 @@ class NumpyVectorArrayView(NumpyVectorArray):
         if self.base._refcount[0] > 1:
             self._deep_copy()
         other_dtype = other.base._array.dtype if other.is_view else other._array.dtype
-        common_dtype = np.promote_types(self.base._array.dtype, other_dtype)
+        common_dtype = self.space._storage_dtype(np.promote_types(self.base._array.dtype, other_dtype))
         if self.base._array.dtype != common_dtype:
             self.base._array = self.base._array.astype(common_dtype)
         self.base.array[self.ind] += other.base._array[other.ind] if other.is_view else other._array[:other._len]
@@ -520,7 +624,7 @@ class NumpyVectorArrayView(NumpyVectorArray):
         if self.base._refcount[0] > 1:
             self._deep_copy()
         other_dtype = other.base._array.dtype if other.is_view else other._array.dtype
-        common_dtype = np.promote_types(self.base._array.dtype, other_dtype)
+        common_dtype = self.space._storage_dtype(np.promote_types(self.base._array.dtype, other_dtype))
         if self.base._array.dtype != common_dtype:
             self.base._array = self.base._array.astype(common_dtype)
         self.base._array[self.ind] -= other.base._array[other.ind] if other.is_view else other._array[:other._len]
@@ -538,7 +642,7 @@ class NumpyVectorArrayView(NumpyVectorArray):
         if self.base._refcount[0] > 1:
             self._deep_copy()
         other_dtype = other.dtype if isinstance(other, np.ndarray) else type(other)
-        common_dtype = np.promote_types(self.base._array.dtype, other_dtype)
+        common_dtype = self.space._storage_dtype(np.promote_types(self.base._array.dtype, other_dtype))
         if self.base._array.dtype != common_dtype:
             self.base._array = self.base._array.astype(common_dtype)
         self.base._array[self.ind] *= other
@@ -555,3 +659,10 @@ class NumpyVectorArrayView(NumpyVectorArray):
 
 
 _complex_dtypes = (np.complex64, np.complex128)
+
+
+def _sum_rows(A):
+    """Sum the rows of `A`, accumulating single precision values in double precision."""
+    if A.dtype.kind in 'fc':
+        return np.sum(A, axis=1, dtype=np.promote_types(A.dtype, np.float64)).astype(A.dtype, copy=False)
+    return np.sum(A, axis=1)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# This file is part of the pyMOR project (http://www.pymor.org).
+# Copyright 2013-2017 pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (http://opensource.org/licenses/BSD-2-Clause)
+
+"""Benchmark of the linear algebra kernels used by pod and extend_basis.
+
+Compares NumpyVectorArray.gramian, NumpyMatrixOperator.apply2 and
+project_out with the equivalent compositions of dot, apply and lincomb
+on random snapshot data, and times a complete pod. The snapshot matrix
+needs DIM * SNAPSHOTS * 8 bytes of memory (4 bytes with --dtype=float32),
+e.g. 8 GB for 10^6 degrees of freedom and 10^3 snapshots.
+
+Usage:
+    benchmark_pod.py [--product] [--dtype=TYPE] [--repeat=COUNT] DIM SNAPSHOTS MODES
+
+Arguments:
+    DIM        Dimension of the snapshot vectors.
+
+    SNAPSHOTS  Number of snapshot vectors.
+
+    MODES      Number of basis vectors projected out of the snapshots.
+
+Options:
+    -h, --help       Show this message.
+
+    --product        Use a sparse (tridiagonal) inner product matrix.
+
+    --dtype=TYPE     Precision of the snapshot data [default: float64].
+
+    --repeat=COUNT   Number of runs of each kernel, the best time is reported [default: 3].
+"""
+
+from time import perf_counter
+
+from docopt import docopt
+import numpy as np
+import scipy.sparse as sps
+
+from pymor.algorithms.basic import project_out
+from pymor.algorithms.gram_schmidt import gram_schmidt
+from pymor.algorithms.pod import pod
+from pymor.operators.numpy import NumpyMatrixOperator
+from pymor.vectorarrays.numpy import NumpyVectorSpace
+
+
+def _best_time(f, repeat):
+    times = []
+    for _ in range(repeat):
+        tic = perf_counter()
+        result = f()
+        times.append(perf_counter() - tic)
+    return min(times), result
+
+
+def _compare(name, kernel, reference, repeat):
+    t_kernel, R_kernel = _best_time(kernel, repeat)
+    t_reference, R_reference = _best_time(reference, repeat)
+    error = np.max(np.abs(R_kernel - R_reference)) if R_kernel.size else 0.
+    print('{:<12} {:10.4f}s {:10.4f}s {:8.2f}x   (max. deviation {:.2e})'
+          .format(name, t_kernel, t_reference, t_reference / t_kernel, error))
+
+
+def benchmark_pod_demo(args):
+    dim, snapshots, modes = int(args['DIM']), int(args['SNAPSHOTS']), int(args['MODES'])
+    repeat = int(args['--repeat'])
+    dtype = np.dtype(args['--dtype'])
+
+    np.random.seed(0)
+    if args['--product']:
+        matrix = sps.diags([np.full(dim - 1, -1.), np.full(dim, 4.), np.full(dim - 1, -1.)], [-1, 0, 1],
+                           format='csr')
+        product = NumpyMatrixOperator(matrix, dtype=dtype)
+        space = product.source
+    else:
+        product = None
+        space = NumpyVectorSpace(dim, dtype=dtype)
+    U = space.from_data(np.random.random((snapshots, dim)))
+    basis = gram_schmidt(space.from_data(np.random.random((modes, dim))), product=product)
+
+    print('{:<12} {:>11} {:>11} {:>9}'.format('kernel', 'time', 'reference', 'speedup'))
+    if product is None:
+        _compare('gramian', lambda: U.gramian(), lambda: U.dot(U), repeat)
+    else:
+        _compare('apply2', lambda: product.apply2(U, U), lambda: U.dot(product.apply(U)), repeat)
+
+    def project_out_reference():
+        coefficients = U.dot(basis) if product is None else product.apply2(U, basis)
+        return (U - basis.lincomb(coefficients)).data
+
+    _compare('project_out', lambda: project_out(U, basis, product=product).data, project_out_reference, repeat)
+
+    t_pod, (POD, SVALS) = _best_time(lambda: pod(U, modes=modes, product=product), repeat)
+    print('{:<12} {:10.4f}s   ({} modes)'.format('pod', t_pod, len(POD)))
+
+
+if __name__ == '__main__':
+    args = docopt(__doc__)
+    benchmark_pod_demo(args)
@@ -7,8 +7,11 @@ from numbers import Number
 import pytest
 import numpy as np
 
-from pymor.algorithms.basic import almost_equal
+from pymor.algorithms.basic import almost_equal, project_out
+from pymor.algorithms.gram_schmidt import gram_schmidt
 from pymor.operators.constructions import induced_norm
+from pymor.operators.numpy import NumpyMatrixOperator
+from pymor.vectorarrays.numpy import NumpyVectorSpace
 from pymortests.fixtures.vectorarray import \
     (vector_array_without_reserve, vector_array, compatible_vector_array_pair_without_reserve,
      compatible_vector_array_pair, incompatible_vector_array_pair)
@@ -169,3 +172,22 @@ def test_almost_equal_wrong_ind(compatible_vector_array_pair):
             c1, c2 = v1.copy(), v2.copy()
             with pytest.raises(Exception):
                 almost_equal(c1[ind], c2[ind], norm=n)
+
+
+def test_project_out():
+    np.random.seed(0)
+    space = NumpyVectorSpace(40)
+    product = NumpyMatrixOperator(np.diag(np.arange(1., 41.)))
+    for dtype in (np.float32, np.float64, np.complex128):
+        U = space.from_data(np.random.random((10, 40)).astype(dtype))
+        U_data = U.data.copy()
+        for prod in (None, product):
+            basis = gram_schmidt(space.from_data(np.random.random((5, 40)).astype(dtype)), product=prod)
+            coefficients = U.dot(basis) if prod is None else prod.apply2(U, basis)
+            for block_size in (3, 10, 64):
+                R = project_out(U, basis, product=prod, block_size=block_size)
+                assert np.allclose(R.data, (U - basis.lincomb(coefficients)).data, atol=1e-5)
+                assert np.all(U.data == U_data)
+            assert np.allclose(project_out(U[[2, 5]], basis[:2], product=prod).data,
+                               (U[[2, 5]] - basis[:2].lincomb(coefficients[[2, 5], :2])).data, atol=1e-5)
+    assert len(project_out(space.empty(), basis)) == 0
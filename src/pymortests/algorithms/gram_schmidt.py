@@ -6,6 +6,8 @@ import numpy as np
 
 from pymor.algorithms.basic import almost_equal
 from pymor.algorithms.gram_schmidt import gram_schmidt, gram_schmidt_biorth
+from pymor.operators.numpy import NumpyMatrixOperator
+from pymor.vectorarrays.numpy import NumpyVectorSpace
 from pymortests.fixtures.operator import operator_with_arrays_and_products
 from pymortests.fixtures.vectorarray import vector_array, vector_array_without_reserve
 
@@ -38,6 +40,26 @@ def test_gram_schmidt_with_product(operator_with_arrays_and_products):
     assert np.all(almost_equal(onb, U))
 
 
+def test_gram_schmidt_block_sizes():
+    np.random.seed(0)
+    space = NumpyVectorSpace(50)
+    U = space.from_data(np.random.random((30, 50)))
+    U.append(U[[3, 17]])               # linear dependent vectors in later blocks
+    U.append(U[5] + U[12])
+    U.append(space.zeros())
+    U.append(space.from_data(np.random.random((5, 50))))
+    p = NumpyMatrixOperator(np.diag(np.arange(1., 51.)))
+    for product in (None, p):
+        onb = gram_schmidt(U, product=product, block_size=len(U))
+        assert len(onb) == 35
+        for block_size in (1, 4, 16):
+            assert np.all(almost_equal(gram_schmidt(U, product=product, block_size=block_size), onb, rtol=1e-10))
+        onb2 = gram_schmidt(U[:10], product=product, block_size=4)
+        onb2.append(U[10:])
+        gram_schmidt(onb2, product=product, offset=10, block_size=4, copy=False)
+        assert np.all(almost_equal(onb2, onb, rtol=1e-10))
+
+
 def test_gram_schmidt_biorth(vector_array):
     U = vector_array
     if U.dim < 2:
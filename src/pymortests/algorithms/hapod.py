@@ -0,0 +1,47 @@
+# This file is part of the pyMOR project (http://www.pymor.org).
+# Copyright 2013-2017 pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (http://opensource.org/licenses/BSD-2-Clause)
+
+import numpy as np
+import pytest
+
+from pymor.algorithms.hapod import dist_hapod
+from pymor.operators.numpy import NumpyMatrixOperator
+from pymor.parallel.dummy import SequentialPool, dummy_pool
+from pymor.vectorarrays.numpy import NumpyVectorSpace
+
+
+def _snapshots(dim=100, count=90, rank=40):
+    random_state = np.random.RandomState(0)
+    L = np.linalg.qr(random_state.randn(dim, rank))[0]
+    R = np.linalg.qr(random_state.randn(count, rank))[0]
+    return NumpyVectorSpace.from_data((L * 0.6 ** np.arange(rank)).dot(R.T).T)
+
+
+@pytest.mark.parametrize('num_workers,arity', [(1, 2), (3, 2), (7, 2), (7, 3)])
+@pytest.mark.parametrize('with_product', [False, True])
+def test_dist_hapod(num_workers, arity, with_product):
+    U = _snapshots()
+    product = NumpyMatrixOperator(np.diag(np.random.RandomState(1).rand(U.dim) + 1.)) if with_product else None
+    pool = dummy_pool if num_workers == 1 else SequentialPool(num_workers)
+    with pool.scatter_array(U) as remote_U:
+        for l2_err in (1e-2, 1e-5):
+            POD, SVALS = dist_hapod(remote_U, pool, product=product, l2_err=l2_err, arity=arity)
+            assert len(POD) == len(SVALS)
+            G = POD.dot(POD) if product is None else product.apply2(POD, POD)
+            assert np.allclose(G, np.eye(len(POD)))
+            err = U - POD.lincomb(U.dot(POD) if product is None else product.apply2(U, POD))
+            err_norm = np.sqrt(np.sum(err.l2_norm2() if product is None else product.pairwise_apply2(err, err)))
+            assert err_norm <= l2_err
+
+
+@pytest.mark.parametrize('num_workers', [1, 4])
+def test_dist_hapod_degenerate(num_workers):
+    U = _snapshots()
+    pool = dummy_pool if num_workers == 1 else SequentialPool(num_workers)
+    with pool.scatter_array(U) as remote_U:
+        POD, SVALS = dist_hapod(remote_U, pool, modes=60)
+        assert len(POD) == len(SVALS) <= 60
+        POD, SVALS = dist_hapod(remote_U, pool, l2_err=1e3)
+        assert len(POD) == len(SVALS) == 0
+        assert POD in U.space
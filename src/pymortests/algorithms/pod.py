@@ -0,0 +1,103 @@
+# This file is part of the pyMOR project (http://www.pymor.org).
+# Copyright 2013-2017 pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (http://opensource.org/licenses/BSD-2-Clause)
+
+import numpy as np
+import pytest
+
+from pymor.algorithms.pod import StreamingPOD, randomized_pod
+from pymor.core.exceptions import AccuracyError
+from pymor.operators.numpy import NumpyMatrixOperator
+from pymor.vectorarrays.numpy import NumpyVectorSpace
+
+
+def _snapshots(dim=120, count=80, rank=40, dtype=np.float64):
+    random_state = np.random.RandomState(0)
+    L = np.linalg.qr(random_state.randn(dim, rank))[0]
+    R = np.linalg.qr(random_state.randn(count, rank))[0]
+    X = (L * 0.7 ** np.arange(rank)).dot(R.T).T
+    if dtype is np.complex128:
+        X = X + 1e-3j * random_state.randn(count, dim)
+    return NumpyVectorSpace.from_data(X)
+
+
+def _product(dim=120):
+    return NumpyMatrixOperator(np.diag(np.random.RandomState(1).rand(dim) + 1.))
+
+
+def _svals(A, product=None):
+    X = A.data if product is None else A.data * np.sqrt(np.diag(product._matrix))
+    return np.linalg.svd(X, compute_uv=False)
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.complex128])
+@pytest.mark.parametrize('with_product', [False, True])
+def test_randomized_pod(dtype, with_product):
+    A = _snapshots(dtype=dtype)
+    product = _product() if with_product else None
+    svals = _svals(A, product)
+
+    POD, SVALS = randomized_pod(A, 10, product=product)
+    assert len(POD) == 10
+    assert np.allclose(SVALS, svals[:10], rtol=1e-4)
+    G = POD.dot(POD) if product is None else product.apply2(POD, POD)
+    assert np.allclose(G, np.eye(10))
+
+
+def test_randomized_pod_tolerances():
+    A = _snapshots()
+    svals = _svals(A)
+
+    POD, SVALS = randomized_pod(A, 30, l2_err=1e-3)
+    assert np.sqrt(np.sum(svals[len(POD):] ** 2)) <= 1e-3
+    assert np.sqrt(np.sum(svals[len(POD) - 1:] ** 2)) > 1e-3
+
+    POD, SVALS = randomized_pod(A, 30, rtol=1e-2)
+    assert len(POD) == np.sum(svals >= 1e-2 * svals[0])
+
+    assert np.all(randomized_pod(A, 5, seed=3)[1] == randomized_pod(A, 5, seed=3)[1])
+
+
+def test_randomized_pod_removed_modes(monkeypatch):
+    import pymor.algorithms.pod as pod_module
+    gram_schmidt = pod_module.gram_schmidt
+    # simulate a linearly dependent mode being removed by the final re-orthonormalization
+    monkeypatch.setattr(pod_module, 'gram_schmidt', lambda A, **kwargs: gram_schmidt(A, **kwargs)[:-1])
+    A = _snapshots()
+    with pytest.raises(AccuracyError):
+        randomized_pod(A, 10)
+    POD, SVALS = randomized_pod(A, 10, check=False)
+    assert len(POD) == len(SVALS) - 1
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.complex128])
+@pytest.mark.parametrize('with_product', [False, True])
+def test_streaming_pod(dtype, with_product):
+    A = _snapshots(dtype=dtype)
+    product = _product() if with_product else None
+    svals = _svals(A, product)
+
+    streaming_pod = StreamingPOD(A.space, modes=35, product=product)
+    for i in range(0, len(A), 13):
+        streaming_pod.update(A[i:i + 13])
+    POD = streaming_pod.pod_modes
+    assert len(POD) == 35
+    assert np.allclose(streaming_pod.svals[:10], svals[:10], rtol=1e-4)
+    assert np.sqrt(np.sum(svals[35:] ** 2)) <= streaming_pod.l2_err_estimate <= 2 * np.sqrt(np.sum(svals[35:] ** 2))
+    G = POD.dot(POD) if product is None else product.apply2(POD, POD)
+    assert np.allclose(G, np.eye(35))
+
+
+def test_streaming_pod_l2_err():
+    A = _snapshots()
+    streaming_pod = StreamingPOD(A.space, l2_err=1e-4)
+    for i in range(0, len(A), 10):
+        streaming_pod.update(A[i:i + 10])
+    streaming_pod.update(A.space.empty())
+    assert streaming_pod.l2_err_estimate <= 1e-4
+    assert len(streaming_pod.pod_modes) < 40
+
+    # the estimate bounds the projection error of all snapshots
+    POD = streaming_pod.pod_modes
+    err = A - POD.lincomb(A.dot(POD))
+    assert np.sqrt(np.sum(err.l2_norm2())) <= streaming_pod.l2_err_estimate
@@ -4,6 +4,8 @@
 
 import time
 import os
+import multiprocessing
+import threading
 from uuid import uuid4
 from datetime import datetime
 from tempfile import gettempdir
@@ -21,6 +23,13 @@ class IamMemoryCached(cache.CacheableInterface):
         time.sleep(SLEEP_SECONDS)
         return arg
 
+    @cache.cached
+    def no_time(self, arg):
+        return arg
+
+    def add_one(self, arg):
+        return arg + 1
+
 
 class IamDiskCached(cache.CacheableInterface):
 
@@ -90,6 +99,387 @@ class TestCache(TestInterface):
             backend.set('mykey', 1)
             assert backend.get('mykey') == (True, 1)
 
+    def test_statistics(self):
+        cache.reset_cache_statistics()
+        r = IamMemoryCached()
+        r.enable_caching('memory')
+        for val in [1, 1, 2, 1]:
+            r.no_time(val)
+        regions, methods = cache.cache_statistics()
+        s = methods[('memory', 'IamMemoryCached', 'no_time')]
+        assert s['hits'] == 2 and s['misses'] == 2
+        assert s['key_time'] > 0 and s['compute_time'] >= 0
+        assert regions['memory']['hits'] >= 2 and regions['memory']['misses'] >= 2
+        cache.print_cache_statistics()
+
+    def test_cached_method_call_many(self):
+        from pymor.parallel.dummy import dummy_pool
+        for region in ('memory', 'disk'):
+            r = IamMemoryCached()
+            r.enable_caching(region)
+            assert r.no_time(1) == 1
+            assert r.cached_method_call_many(r.add_one, [{'arg': i} for i in range(5)]) == list(range(1, 6))
+            cache.reset_cache_statistics()
+            assert r.cached_method_call_many(r.add_one, [{'arg': i} for i in range(7)], pool=dummy_pool) \
+                == list(range(1, 8))
+            s = cache.cache_statistics()[1][(region, 'IamMemoryCached', 'add_one')]
+            assert s['hits'] == 5 and s['misses'] == 2
+            assert r.cached_method_call(r.add_one, arg=6) == 7
+            cache.reset_cache_statistics()
+            assert r.cached_method_call_many(r.add_one, [{'arg': i} for i in (9, 8, 9, 1, 9)]) == [10, 9, 10, 2, 10]
+            s = cache.cache_statistics()[1][(region, 'IamMemoryCached', 'add_one')]
+            assert s['hits'] == 3 and s['misses'] == 2
+            r.disable_caching()
+            assert r.cached_method_call_many(r.add_one, [{'arg': 1}]) == [2]
+
+    def test_memory_region_lru(self):
+        region = cache.MemoryRegion(max_keys=3)
+        for i in range(3):
+            region.set(i, i)
+        assert region.get(0) == (True, 0)
+        region.set(3, 3)
+        assert region.get(0) == (True, 0)
+        assert not region.get(1)[0]
+        assert region.get(2) == (True, 2)
+
+    def test_memory_region_max_bytes(self):
+        import numpy as np
+        region = cache.MemoryRegion(max_keys=100, max_bytes=3 * 800)
+        for i in range(3):
+            region.set(i, np.ones(100))
+        assert region.bytes_stored == 3 * 800
+        region.get(0)
+        region.set(3, np.ones(200))
+        assert region.get(0)[0] and region.get(3)[0]
+        assert not region.get(1)[0] and not region.get(2)[0]
+        assert region.bytes_stored == 3 * 800
+        region.set(4, np.ones(1000))
+        assert not region.get(4)[0]
+        region.clear()
+        assert region.bytes_stored == 0
+
+    def test_sqlite_region_mmap(self):
+        import numpy as np
+        from scipy.sparse import diags
+        from pymor.operators.numpy import NumpyMatrixOperator
+        from pymor.vectorarrays.numpy import NumpyVectorSpace
+        region = cache.SQLiteRegion(path=os.path.join(gettempdir(), str(uuid4())), max_size=1024 ** 3,
+                                    persistent=False, mmap_threshold=1024)
+        U = NumpyVectorSpace.from_data(np.random.random((10, 1000)))
+        op = NumpyMatrixOperator(diags([np.arange(1000.)], [0], format='csr'))
+        region.set('U', (U, 'small'))
+        region.set('op', op)
+        V, small = region.get('U')[1]
+        assert small == 'small'
+        assert np.all(V.data == U.data)
+        assert isinstance(V._array.base, np.memmap)
+        V.scal(2.)
+        assert np.all(region.get('U')[1][0].data == U.data)
+        op2 = region.get('op')[1]
+        assert np.all(op2._matrix.toarray() == op._matrix.toarray())
+        region.set('scalar', 1.)
+        assert region.get('scalar') == (True, 1.)
+        filenames = dict(region.conn.execute('SELECT key, filename FROM entries'))
+        assert filenames['scalar'].endswith('.dat') and filenames['U'].endswith('.npd')
+        region.clear()
+        assert all(f.startswith('pymor_cache.db') or f == 'owner.pid' for f in os.listdir(region.path))
+
+    def test_sqlite_region_codecs(self):
+        import numpy as np
+        from pymor.core.config import config
+        codecs = ['zlib', 'lzma'] + (['lz4'] if config.HAVE_LZ4 else []) + (['zstd'] if config.HAVE_ZSTD else [])
+        value = np.zeros(10000)
+        for codec in codecs:
+            for mmap_threshold in (None, 1024):
+                region = cache.SQLiteRegion(path=os.path.join(gettempdir(), str(uuid4())), max_size=1024 ** 3,
+                                            persistent=False, mmap_threshold=mmap_threshold, codec=codec)
+                region.set('value', (value, 'value'))
+                found, (v, s) = region.get('value')
+                assert found and s == 'value' and np.all(v == value)
+                size, stored_codec = region.conn.execute('SELECT size, codec FROM entries').fetchone()
+                assert stored_codec == codec
+                if mmap_threshold is None:
+                    assert size < value.nbytes / 10
+
+    def test_tiered_region(self):
+        for write in ('through', 'behind'):
+            disk = cache.SQLiteRegion(path=os.path.join(gettempdir(), str(uuid4())), max_size=1024 ** 2,
+                                      persistent=False)
+            region = cache.TieredRegion(cache.MemoryRegion(max_keys=2), disk, write=write)
+            for i in range(4):
+                region.set(i, i)
+            assert disk.get(0) == (True, 0) and disk.get(1) == (True, 1)
+            assert disk.get(3)[0] == (write == 'through')
+            assert region.get(0) == (True, 0)
+            assert region.promotions == 1
+            assert region.get(0) == (True, 0)
+            assert region.promotions == 1
+            region.flush()
+            for i in range(4):
+                assert disk.get(i) == (True, i)
+            assert not region.get(4)[0]
+            region.clear()
+            assert not region.get(0)[0]
+
+    def test_sqlite_region_async_writes(self):
+        path = os.path.join(gettempdir(), str(uuid4()))
+        region = cache.SQLiteRegion(path=path, max_size=1024 ** 2, persistent=True, async_writes=True, max_pending=2)
+        for i in range(10):
+            region.set(i, i)
+            assert region.get(i) == (True, i)
+        region.flush()
+        assert not region._pending
+        other = cache.SQLiteRegion(path=path, max_size=1024 ** 2, persistent=True)
+        for i in range(10):
+            assert other.get(i) == (True, i)
+        region.clear()
+        assert not other.get(0)[0]
+
+    def test_sqlite_region_async_writes_concurrent_start(self):
+        from unittest import mock
+        Queue = cache.queue.Queue
+        region = cache.SQLiteRegion(path=os.path.join(gettempdir(), str(uuid4())), max_size=1024 ** 2,
+                                    persistent=False, async_writes=True)
+        queues = []
+        barrier = threading.Barrier(2, timeout=0.5)
+
+        def make_queue(maxsize):
+            q = Queue(maxsize)
+            queues.append(q)
+            try:
+                barrier.wait()  # let a concurrent set() race the start of the writer thread
+            except threading.BrokenBarrierError:
+                pass
+            return q
+
+        with mock.patch.object(cache.queue, 'Queue', make_queue):
+            threads = [threading.Thread(target=region.set, args=(str(n), n)) for n in range(2)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        region.flush()
+        assert len(queues) == 1
+        assert not region._pending
+        assert region.get('0') == (True, 0) and region.get('1') == (True, 1)
+
+    def test_sqlite_region_eviction(self):
+        for eviction, survivor in (('lru', 1), ('lfu', 0), ('fifo', 7)):
+            region = cache.SQLiteRegion(path=os.path.join(gettempdir(), str(uuid4())), max_size=1024 ** 3,
+                                        persistent=False, eviction=eviction)
+            for i in range(8):
+                region.set(i, bytes(10000))
+            for i in (0, 0, 0, 1):
+                assert region.get(i)[0]
+            assert region.bytes_stored == region.conn.execute('SELECT SUM(size) FROM entries').fetchone()[0]
+            region.max_size = region.bytes_stored * 7 // 8
+            region.housekeeping()
+            assert region.evictions == 7
+            assert [i for i in range(8) if region.get(i)[0]] == [survivor]
+            assert region.bytes_stored == region.conn.execute('SELECT SUM(size) FROM entries').fetchone()[0]
+            region.clear()
+            assert region.bytes_stored == 0
+
+    def test_sqlite_region_reads_do_not_block(self):
+        import sqlite3
+        path = os.path.join(gettempdir(), str(uuid4()))
+        region = cache.SQLiteRegion(path=path, max_size=1024 ** 3, persistent=False)
+        for i in range(100):
+            region.set(str(i), i)
+        writer = sqlite3.connect(os.path.join(path, 'pymor_cache.db'), isolation_level=None)
+        writer.execute('BEGIN IMMEDIATE')
+        tic = time.perf_counter()
+        assert all(region.get(str(i)) == (True, i) for i in range(100))
+        assert time.perf_counter() - tic < region.timeout
+        assert len(region._accesses) == 100
+        writer.execute('COMMIT')
+        region.flush()
+        assert not region._accesses
+        assert region.conn.execute('SELECT SUM(hits) FROM entries').fetchone()[0] == 100
+
+    def test_export_import_prewarm(self):
+        import numpy as np
+        path = os.path.join(gettempdir(), str(uuid4()))
+        source = cache.SQLiteRegion(path=path, max_size=1024 ** 3, persistent=False, mmap_threshold=1024)
+        cache.cache_regions['export_test'] = source
+        try:
+            x = IamMemoryCached()
+            x.enable_caching('export_test')
+            for i in range(5):
+                x.me_takey_long_time(i)
+                x.no_time(i)
+            source.set('other', np.ones(1000))
+            assert len(source.keys()) == 11
+
+            filename = os.path.join(gettempdir(), str(uuid4()) + '.tar')
+            assert cache.export_cache('export_test', filename, class_name='IamMemoryCached',
+                                      method_name='no_time') == 5
+            target = cache.SQLiteRegion(path=os.path.join(gettempdir(), str(uuid4())), max_size=1024 ** 3,
+                                        persistent=False)
+            assert cache.import_cache(filename, target) == 5
+            assert cache.import_cache(filename, target) == 0
+            assert target.hits == target.misses == 0
+            assert set(target.keys()) == {k for k in source.keys() if k.startswith('IamMemoryCached.no_time:')}
+
+            assert cache.export_cache(source, filename) == 11
+            memory = cache.MemoryRegion(max_keys=3)
+            assert cache.import_cache(filename, memory, prefix='other') == 1
+            assert np.all(memory.get('other')[1] == np.ones(1000))
+
+            memory = cache.MemoryRegion(max_keys=3)
+            assert cache.prewarm_cache(memory, source, method_name='me_takey_long_time') == 3
+            hits = source.hits
+            cache.cache_regions['export_test'] = memory
+            for i in (2, 3, 4):
+                x.me_takey_long_time(i)
+            assert memory.hits == 3 and source.hits == hits
+        finally:
+            del cache.cache_regions['export_test']
+
+    def test_sqlite_region_concurrent_threads(self):
+        path = os.path.join(gettempdir(), str(uuid4()))
+        region = cache.SQLiteRegion(path=path, max_size=1024 ** 2, persistent=False)
+
+        def worker(n):
+            for i in range(20):
+                key = 'key{}'.format(i)
+                region.set(key, i)
+                assert region.get(key) == (True, i)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for i in range(20):
+            assert region.get('key{}'.format(i)) == (True, i)
+        assert not any(f.endswith('.tmp') for f in os.listdir(path))
+
+    def test_sqlite_region_concurrent_processes(self):
+        path = os.path.join(gettempdir(), str(uuid4()))
+        region = cache.SQLiteRegion(path=path, max_size=1024 ** 2, persistent=True)
+        region.set('parent', -1)
+
+        processes = [multiprocessing.Process(target=_fill_sqlite_region, args=(path, n)) for n in range(4)]
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join()
+            assert p.exitcode == 0
+        for n in range(4):
+            for i in range(10):
+                assert region.get('{}-{}'.format(n, i)) == (True, i)
+        region.clear()
+
+    def test_sqlite_region_raw(self):
+        import numpy as np
+        from pymor.core.pickle import dumps
+        path = os.path.join(gettempdir(), str(uuid4()))
+        region = cache.SQLiteRegion(path=path, max_size=1024 ** 2, persistent=False, codec='zlib')
+        data = dumps(np.arange(10.))
+        region.set_raw('array', data)
+        assert region.get_raw('array') == (True, data)
+        assert np.all(region.get('array')[1] == np.arange(10.))
+        region.set('list', [1, 2])
+        assert region.get_raw('list') == (True, dumps([1, 2]))
+        assert region.get_raw('missing') == (False, None)
+        region.clear()
+
+    def test_sqlite_region_non_persistent_shared(self):
+        path = os.path.join(gettempdir(), str(uuid4()))
+        region = cache.SQLiteRegion(path=path, max_size=1024 ** 2, persistent=False)
+        assert region.owned
+        region.set('parent', -1)
+
+        processes = [multiprocessing.Process(target=_fill_default_disk_region, args=(path, n)) for n in range(4)]
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join()
+            assert p.exitcode == 0
+        assert region.get('parent') == (True, -1)
+        for n in range(4):
+            for i in range(10):
+                assert region.get('{}-{}'.format(n, i)) == (True, i)
+
+        # ownership is taken over when the owner has exited
+        p = multiprocessing.Process(target=int)
+        p.start()
+        p.join()
+        with open(os.path.join(path, 'owner.pid'), 'w') as f:
+            f.write(str(p.pid))
+        region2 = cache.SQLiteRegion(path=path, max_size=1024 ** 2, persistent=False)
+        assert region2.owned
+        assert region.get('parent') == (False, None)
+        region2.clear()
+        region2._release_ownership()
+        assert not os.path.exists(os.path.join(path, 'owner.pid'))
+
+    def test_network_cache_region(self):
+        import numpy as np
+        from pymor.core.network_cache import NetworkCacheError, NetworkCacheRegion, NetworkCacheServer
+        path = os.path.join(gettempdir(), str(uuid4()))
+        os.mkdir(path)
+        for address in (os.path.join(path, 'socket'), ('127.0.0.1', 0)):
+            server = NetworkCacheServer(address, os.path.join(path, 'entries'), secret='secret')
+            server.serve_in_thread()
+            try:
+                region = NetworkCacheRegion(server.address, secret='secret', max_connections=2)
+                region.clear()
+                value = np.arange(100000.)
+                region.set('array', value)
+                found, v = region.get('array')
+                assert found and np.all(v == value)
+                # the server stores the pickled value sent by the client without pickling it again
+                assert np.all(server.region.get('array')[1] == value)
+                assert region.get('missing') == (False, None)
+                for i in range(100):
+                    region.set(i, i)
+                assert region.get_many(list(range(100)) + ['missing']) == [(True, i) for i in range(100)] + \
+                    [(False, None)]
+                assert region.hits == 101 and region.misses == 2
+
+                def worker(n):
+                    for i in range(20):
+                        assert region.get(i) == (True, i)
+
+                threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+                assert len(region._pool) <= 2
+
+                try:
+                    NetworkCacheRegion(server.address, secret='wrong').get('array')
+                    assert False
+                except NetworkCacheError:
+                    pass
+
+                region.clear()
+                assert not region.get('array')[0]
+                assert region.statistics()['server']['hits'] > 0
+                region.close()
+            finally:
+                server.shutdown()
+
+
+def _fill_sqlite_region(path, n):
+    region = cache.SQLiteRegion(path=path, max_size=1024 ** 2, persistent=True)
+    assert region.get('parent') == (True, -1)
+    for i in range(10):
+        region.set('{}-{}'.format(n, i), i)
+
+
+def _fill_default_disk_region(path, n):
+    cache.default_regions(disk_path=path, persistent_path=os.path.join(path, 'persistent'))
+    region = cache.cache_regions['disk']
+    assert not region.owned
+    assert region.get('parent') == (True, -1)
+    for i in range(10):
+        region.set('{}-{}'.format(n, i), i)
+    cache.cleanup_non_persisten_regions()  # forked processes do not run atexit handlers
+
 
 if __name__ == "__main__":
     runmodule(filename=__file__)
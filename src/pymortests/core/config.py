@@ -22,3 +22,29 @@ def test_dir():
     for p in _PACKAGES:
         assert 'HAVE_' + p in d
         assert p + '_VERSION' in d
+
+
+def test_probe_cache(monkeypatch, tmpdir):
+    from pymor.core.config import _ProbeCache
+    filename = str(tmpdir.join('config.json'))
+    monkeypatch.setenv('PYMOR_CONFIG_CACHE', filename)
+    monkeypatch.delenv('QT_API', raising=False)
+    cache = _ProbeCache()
+    assert cache.get('NUMPY') is None
+    cache.set('NUMPY', '1.0')
+    cache.set('FENICS', [1, 6, 0])
+    cache.set('DEALII', object())
+    assert _ProbeCache().get('NUMPY') == '1.0'
+    assert _ProbeCache().get('FENICS') == [1, 6, 0]
+    assert _ProbeCache().get('DEALII') is None
+    monkeypatch.setenv('QT_API', 'pyside2')
+    assert _ProbeCache().get('NUMPY') is None
+    cache.set('NUMPY', '1.0')
+    monkeypatch.delenv('QT_API')
+    assert _ProbeCache().get('NUMPY') is None
+    monkeypatch.setattr('sys.path', ['/nonexistent'])
+    assert _ProbeCache().get('NUMPY') is None
+    monkeypatch.setenv('PYMOR_CONFIG_CACHE', 'NONE')
+    cache = _ProbeCache()
+    cache.set('NUMPY', '1.0')
+    assert cache.get('NUMPY') is None
@@ -3,9 +3,11 @@
 # License: BSD 2-Clause License (http://opensource.org/licenses/BSD-2-Clause)
 
 import importlib
+import numpy as np
 import pytest
 
-from pymor.core.interfaces import (ImmutableInterface, abstractstaticmethod, abstractclassmethod)
+from pymor.core.interfaces import (ImmutableInterface, abstractstaticmethod, abstractclassmethod, generate_sid,
+                                   hash_array)
 from pymor.core import exceptions
 from pymortests.base import TestInterface, runmodule, subclassForImplemetorsOf
 from pymortests.core.dummies import *   # NOQA
@@ -80,5 +82,28 @@ def test_withcopy_implementors():
     for TestType in subclassForImplemetorsOf(ImmutableInterface, WithcopyInterface):
         TestType().test_with_()
 
+
+def test_hash_array():
+    A = np.random.random((100, 20))
+    assert hash_array(A) == hash_array(A.copy())
+    assert hash_array(A) == hash_array(np.asfortranarray(A))
+    assert hash_array(A[:, ::3], block_size=100) == hash_array(A[:, ::3].copy())
+    assert hash_array(A) != hash_array(A.reshape((20, 100)))
+    assert hash_array(A) != hash_array(A.astype(np.float32))
+    assert hash_array(A, hash_function='blake2b') != hash_array(A)
+    assert generate_sid(A) == generate_sid(A.copy())
+    assert generate_sid(A) != generate_sid(A + 1)
+
+
+def test_hash_array_readonly_view():
+    A = np.random.random((100, 20))
+    B = A.view()
+    B.flags.writeable = False
+    digest = hash_array(B)
+    A[:] = 0
+    assert hash_array(B) != digest
+    assert hash_array(B) == hash_array(np.zeros((100, 20)))
+
+
 if __name__ == "__main__":
     runmodule(filename=__file__)
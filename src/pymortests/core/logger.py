@@ -23,5 +23,32 @@ def test_logclass(basicinterface_subclass):
     exercise_logger(logger)
 
 
+def test_lazy_formatting():
+    logger = core.logger.getLogger('pymortests.core.logger.lazy')
+    records = []
+
+    class Handler(logging.Handler):
+        def emit(self, record):
+            records.append(self.format(record))
+
+    class Formatted(object):
+        count = 0
+
+        def __str__(self):
+            Formatted.count += 1
+            return 'formatted'
+
+    logger.handlers = [Handler()]
+    logger.setLevel(logging.WARNING)
+    logger.info('not logged: {}', Formatted())
+    with logger.block('not logged: {}', Formatted()):
+        pass
+    assert Formatted.count == 0 and not records
+    logger.warning('logged: {} {:.1f}', Formatted(), 1.)
+    assert Formatted.count == 1 and records == ['logged: formatted 1.0']
+    logger.warning('no arguments: {}')
+    assert records[-1] == 'no arguments: {}'
+
+
 if __name__ == "__main__":
     runmodule(filename=__file__)
@@ -78,9 +78,14 @@ PARABOLIC_MOR_ARGS = (
     ('parabolic_mor', ['fenics', 'adaptive_greedy', 2, 3, 1]),
 )
 
+BENCHMARK_POD_ARGS = (
+    ('benchmark_pod', ['--repeat=1', 200, 20, 5]),
+    ('benchmark_pod', ['--repeat=1', '--product', '--dtype=float32', 200, 20, 5]),
+)
+
 DEMO_ARGS = (DISCRETIZATION_ARGS +
              THERMALBLOCK_ARGS + THERMALBLOCK_ADAPTIVE_ARGS + THERMALBLOCK_SIMPLE_ARGS + THERMALBLOCK_GUI_ARGS +
-             BURGERS_EI_ARGS + PARABOLIC_MOR_ARGS)
+             BURGERS_EI_ARGS + PARABOLIC_MOR_ARGS + BENCHMARK_POD_ARGS)
 DEMO_ARGS = [('pymordemos.{}'.format(a), b) for (a, b) in DEMO_ARGS]
 
 
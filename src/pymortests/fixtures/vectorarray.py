@@ -10,6 +10,7 @@ from pymor.core.config import config
 from pymor.vectorarrays.block import BlockVectorSpace
 from pymor.vectorarrays.numpy import NumpyVectorSpace
 from pymor.vectorarrays.list import NumpyListVectorSpace
+from pymor.vectorarrays.memmap import MemmapVectorSpace
 
 
 import os
@@ -31,6 +32,12 @@ def numpy_list_vector_array_factory(length, dim, seed):
     return NumpyListVectorSpace.from_data(np.random.random((length, dim)))
 
 
+def memmap_vector_array_factory(length, dim, seed):
+    np.random.seed(seed)
+    # use a small block size to test the blocked operations
+    return MemmapVectorSpace(dim, block_size=256).from_data(np.random.random((length, dim)))
+
+
 def block_vector_array_factory(length, dims, seed):
     return BlockVectorSpace([NumpyVectorSpace(dim) for dim in dims]).from_data(
         numpy_vector_array_factory(length, sum(dims), seed).data
@@ -172,6 +179,9 @@ numpy_vector_array_generators = \
 numpy_list_vector_array_generators = \
     [lambda args=args: numpy_list_vector_array_factory(*args) for args in numpy_vector_array_factory_arguments]
 
+memmap_vector_array_generators = \
+    [lambda args=args: memmap_vector_array_factory(*args) for args in numpy_vector_array_factory_arguments]
+
 block_vector_array_generators = \
     [lambda args=args: block_vector_array_factory(*args) for args in block_vector_array_factory_arguments]
 
@@ -197,6 +207,11 @@ numpy_list_vector_array_pair_with_same_dim_generators = \
                                             numpy_list_vector_array_factory(l2, d, s2))
      for l, l2, d, s1, s2 in numpy_vector_array_factory_arguments_pairs_with_same_dim]
 
+memmap_vector_array_pair_with_same_dim_generators = \
+    [lambda l=l, l2=l2, d=d, s1=s1, s2=s2: (memmap_vector_array_factory(l, d, s1),
+                                            memmap_vector_array_factory(l2, d, s2))
+     for l, l2, d, s1, s2 in numpy_vector_array_factory_arguments_pairs_with_same_dim]
+
 block_vector_array_pair_with_same_dim_generators = \
     [lambda l=l, l2=l2, d=d, s1=s1, s2=s2: (block_vector_array_factory(l, d, s1),
                                             block_vector_array_factory(l2, d, s2))
@@ -230,6 +245,11 @@ numpy_list_vector_array_pair_with_different_dim_generators = \
                                                      numpy_list_vector_array_factory(l2, d2, s2))
      for l, l2, d1, d2, s1, s2 in numpy_vector_array_factory_arguments_pairs_with_different_dim]
 
+memmap_vector_array_pair_with_different_dim_generators = \
+    [lambda l=l, l2=l2, d1=d1, d2=d2, s1=s1, s2=s2: (memmap_vector_array_factory(l, d1, s1),
+                                                     memmap_vector_array_factory(l2, d2, s2))
+     for l, l2, d1, d2, s1, s2 in numpy_vector_array_factory_arguments_pairs_with_different_dim]
+
 block_vector_array_pair_with_different_dim_generators = \
     [lambda l=l, l2=l2, d1=d1, d2=d2, s1=s1, s2=s2: (block_vector_array_factory(l, d1, s1),
                                                      block_vector_array_factory(l2, d2, s2))
@@ -255,6 +275,7 @@ dealii_vector_array_pair_with_different_dim_generators = \
 
 
 @pytest.fixture(params=numpy_vector_array_generators + numpy_list_vector_array_generators +
+                       memmap_vector_array_generators +
                        block_vector_array_generators + fenics_vector_array_generators +
                        ngsolve_vector_array_generators + dealii_vector_array_generators)
 def vector_array_without_reserve(request):
@@ -279,6 +300,7 @@ def picklable_vector_array(picklable_vector_array_without_reserve, request):
 
 @pytest.fixture(params=(numpy_vector_array_pair_with_same_dim_generators +
                         numpy_list_vector_array_pair_with_same_dim_generators +
+                        memmap_vector_array_pair_with_same_dim_generators +
                         block_vector_array_pair_with_same_dim_generators +
                         fenics_vector_array_pair_with_same_dim_generators +
                         ngsolve_vector_array_pair_with_same_dim_generators +
@@ -295,6 +317,7 @@ def compatible_vector_array_pair(compatible_vector_array_pair_without_reserve, r
 
 @pytest.fixture(params=(numpy_vector_array_pair_with_different_dim_generators +
                         numpy_list_vector_array_pair_with_different_dim_generators +
+                        memmap_vector_array_pair_with_different_dim_generators +
                         block_vector_array_pair_with_different_dim_generators +
                         fenics_vector_array_pair_with_different_dim_generators +
                         ngsolve_vector_array_pair_with_different_dim_generators +
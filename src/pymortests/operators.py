@@ -18,6 +18,7 @@ from pymortests.fixtures.operator import (operator, operator_with_arrays, operat
 from pymortests.pickling import assert_picklable, assert_picklable_without_dumps_function
 from pymortests.vectorarray import valid_inds, valid_inds_of_same_length, invalid_inds
 from pymor.core.config import is_windows_platform
+from pymor.core.pickle import dumps, loads
 
 def test_selection_op():
     p1 = MonomOperator(1)
@@ -341,3 +342,181 @@ def test_InverseTransposeOperator(operator_with_arrays):
                                    rtol=rtol, atol=atol))
     except (InversionError, NotImplementedError):
         pass
+
+
+def _factorization_region(monkeypatch, max_keys=100, max_bytes=None):
+    from pymor.core.cache import MemoryRegion, cache_regions, default_regions
+    if not cache_regions:
+        default_regions()
+    region = MemoryRegion(max_keys, max_bytes)
+    monkeypatch.setitem(cache_regions, 'factorizations', region)
+    return region
+
+
+def _parametric_sparse_operator(n=50):
+    import scipy.sparse as sps
+    from pymor.operators.constructions import LincombOperator
+    from pymor.operators.numpy import NumpyMatrixOperator
+    from pymor.parameters.functionals import ProjectionParameterFunctional
+    A = sps.diags([-np.ones(n - 1), 2 * np.ones(n), -np.ones(n - 1)], [-1, 0, 1], format='csc')
+    M = sps.identity(n, format='csc')
+    return LincombOperator([NumpyMatrixOperator(A), NumpyMatrixOperator(M)],
+                           [1., ProjectionParameterFunctional('mu', ())])
+
+
+def test_factorization_cache_reuse(monkeypatch):
+    region = _factorization_region(monkeypatch)
+    op = _parametric_sparse_operator()
+    V = op.range.from_data(np.random.RandomState(0).rand(3, op.range.dim))
+
+    U = op.assemble(mu=1.).apply_inverse(V)
+    assert len(region.keys()) == 1 and region.misses == 1 and region.hits == 0
+    U2 = op.assemble(mu=1.).apply_inverse(V)
+    assert len(region.keys()) == 1 and region.hits == 1
+    assert np.all(U.data == U2.data)
+    assert almost_equal(op.apply(U, mu=1.), V).all()
+
+    U3 = op.assemble(mu=2.).apply_inverse(V)
+    assert len(region.keys()) == 2 and region.misses == 2
+    assert almost_equal(op.apply(U3, mu=2.), V).all()
+
+    op.assemble(mu=1.).apply_inverse_transpose(V)
+    assert len(region.keys()) == 3
+
+
+def test_factorization_cache_eviction(monkeypatch):
+    op = _parametric_sparse_operator()
+    V = op.range.from_data(np.ones(op.range.dim))
+    region = _factorization_region(monkeypatch)
+    op.assemble(mu=1.).apply_inverse(V)
+    nbytes = region.bytes_stored
+    assert nbytes > 0
+
+    region = _factorization_region(monkeypatch, max_bytes=int(2.5 * nbytes))
+    for mu in (1., 2., 3.):
+        op.assemble(mu=mu).apply_inverse(V)
+    assert len(region.keys()) == 2 and region.evictions == 1
+    assert region.bytes_stored <= region.max_bytes
+    op.assemble(mu=1.).apply_inverse(V)
+    assert region.misses == 4 and region.hits == 0
+
+
+def _count_splu(monkeypatch):
+    import pymor.bindings.scipy as scipy_bindings
+    calls = []
+    splu = scipy_bindings.splu
+    monkeypatch.setattr(scipy_bindings, 'splu', lambda *args, **kwargs: calls.append(1) or splu(*args, **kwargs))
+    return calls
+
+
+def test_factorization_cache_without_region(monkeypatch):
+    import pymor.core.cache as cache
+    calls = _count_splu(monkeypatch)
+    op = _parametric_sparse_operator().assemble(mu=1.)
+    V = op.range.from_data(np.ones(op.range.dim))
+    monkeypatch.setattr(cache, 'cache_regions', {'mine': cache.MemoryRegion(10)})
+    for _ in range(2):
+        assert almost_equal(op.apply(op.apply_inverse(V)), V).all()
+    assert list(cache.cache_regions) == ['mine']
+    assert len(calls) == 1
+    assert almost_equal(loads(dumps(op)).apply_inverse(V), op.apply_inverse(V)).all()
+
+
+def test_factorization_cache_oversize(monkeypatch):
+    from pymor.operators.numpy import NumpyMatrixOperator
+    calls = _count_splu(monkeypatch)
+    region = _factorization_region(monkeypatch, max_bytes=1)
+    op = _parametric_sparse_operator().assemble(mu=1.)
+    V = op.range.from_data(np.ones(op.range.dim))
+    for _ in range(3):
+        assert almost_equal(op.apply(op.apply_inverse(V)), V).all()
+    assert len(calls) == 1
+    assert not region.keys()
+    NumpyMatrixOperator(op._matrix).apply_inverse(V)
+    assert len(calls) == 2
+
+
+def test_factorization_cache_caching_disabled(monkeypatch):
+    import pymor.core.cache as cache
+    calls = _count_splu(monkeypatch)
+    region = _factorization_region(monkeypatch)
+    monkeypatch.setattr(cache, '_caching_disabled', True)
+    op = _parametric_sparse_operator()
+    V = op.range.from_data(np.ones(op.range.dim))
+    for _ in range(2):
+        assert almost_equal(op.apply(op.assemble(mu=1.).apply_inverse(V), mu=1.), V).all()
+    assert len(calls) == 1 and region.hits == 1
+
+
+def _factorizing_solvers():
+    from pymor.core.config import config
+    solvers = ['scipy_spsolve']
+    if config.HAVE_SKSPARSE:
+        solvers.append('scipy_cholmod')
+    if config.HAVE_PYAMG:
+        solvers.extend(['pyamg_solve', 'pyamg_rs', 'pyamg_sa'])
+    return solvers
+
+
+@pytest.mark.parametrize('solver', _factorizing_solvers())
+def test_factorization_cache_solvers(monkeypatch, solver):
+    region = _factorization_region(monkeypatch)
+    op = _parametric_sparse_operator(n=200).with_(solver_options={'inverse': solver})
+    V = op.range.from_data(np.random.RandomState(0).rand(3, op.range.dim))
+    for i in range(2):
+        U = op.assemble(mu=1.).apply_inverse(V)
+        assert np.all((op.apply(U, mu=1.) - V).l2_norm() <= 1e-4 * V.l2_norm())
+        assert len(region.keys()) == 1 and region.misses == 1 and region.hits == i
+
+
+def test_factorization_cache_pickling(monkeypatch):
+    _factorization_region(monkeypatch)
+    op = _parametric_sparse_operator().assemble(mu=1.)
+    V = op.range.from_data(np.ones(op.range.dim))
+    U = op.apply_inverse(V)
+    assert_picklable(op)
+    assert_picklable_without_dumps_function(op)
+    assert almost_equal(loads(dumps(op)).apply_inverse(V), U).all()
+
+
+def test_numpy_matrix_operator_apply2_blocked():
+    import scipy.sparse as sps
+    from pymor.operators.numpy import NumpyMatrixOperator
+    from pymor.vectorarrays.numpy import NumpyVectorSpace
+    np.random.seed(0)
+    space = NumpyVectorSpace(30)
+    U = space.from_data(np.random.random((25, 30)))
+    V = space.from_data(np.random.random((4, 30)) + 1j * np.random.random((4, 30)))
+    for matrix in (np.random.random((30, 30)), sps.random(30, 30, density=0.2, format='csc', random_state=0)):
+        op = NumpyMatrixOperator(matrix)
+        for block_size in (1, 7, 25, 100):
+            assert np.allclose(op.apply2(V, U, block_size=block_size), V.dot(op.apply(U)))
+    assert op.apply2(V, space.empty()).shape == (4, 0)
+
+
+def test_numpy_matrix_operator_single_precision_product():
+    import scipy.sparse as sps
+    from pymor.algorithms.gram_schmidt import gram_schmidt
+    from pymor.algorithms.pod import pod
+    from pymor.operators.numpy import NumpyMatrixOperator
+    from pymor.vectorarrays.numpy import NumpyVectorSpace
+    np.random.seed(0)
+    n = 50
+    matrix = sps.diags([np.full(n - 1, -1.), np.full(n, 4.), np.full(n - 1, -1.)], [-1, 0, 1], format='csc')
+    product = NumpyMatrixOperator(matrix, dtype=np.float32)
+    assert product.source == product.range == NumpyVectorSpace(n, dtype=np.float32)
+    U = product.source.from_data(np.random.random((10, n)))
+    assert U.data.dtype == np.float32
+    assert np.allclose(product.apply2(U, U), U.dot(product.apply(U)), rtol=1e-5)
+    modes, svals = pod(U, product=product)
+    assert modes in product.source and modes.data.dtype == np.float32
+    assert np.allclose(product.apply2(modes, modes), np.eye(len(modes)), atol=1e-5)
+    basis = gram_schmidt(U, product=product)
+    assert basis in product.source and len(basis) == len(U)
+    assert np.allclose(product.apply2(basis, basis), np.eye(len(basis)), atol=1e-5)
+    V = product.apply_inverse(product.apply(U))
+    assert V in product.source and np.allclose(V.data, U.data, atol=1e-5)
+    assert product.T.source == product.source
+    assert product.assemble_lincomb([product, product], [1., 2.]).source == product.source
+    with pytest.raises(AssertionError):
+        NumpyMatrixOperator(matrix).apply(U)
@@ -12,13 +12,18 @@ from pymor.core.interfaces import BasicInterface
 from pymor.core.pickle import dumps, loads, dumps_function, PicklingError
 from pymor.grids.subgrid import SubGrid
 from pymor.operators.numpy import NumpyMatrixBasedOperator
+from pymor.vectorarrays.numpy import NumpyVectorArray
 
 is_equal_ignored_attributes = \
     ((SubGrid, {'_uid', '_CacheableInterface__cache_region', '_SubGrid__parent_grid'}),
      (NumpyMatrixBasedOperator, {'_uid', '_CacheableInterface__cache_region', '_assembled_operator'}),
      (BasicInterface, {'_name', '_uid', '_CacheableInterface__cache_region'}))
 
-is_equal_dispatch_table = {}
+is_equal_dispatch_table = {
+    # the capacity reserved for appending is uninitialized and not pickled
+    NumpyVectorArray: lambda first, second: (type(second) is NumpyVectorArray and first.space == second.space
+                                             and np.all(first.data == second.data)),
+}
 
 
 def func_with_closure_generator():
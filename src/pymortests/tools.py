@@ -3,6 +3,7 @@
 # License: BSD 2-Clause License (http://opensource.org/licenses/BSD-2-Clause)
 
 from math import sin, pi, exp
+import os
 import numpy as np
 import pytest
 import itertools
@@ -137,5 +138,50 @@ def testDeprecated():
         assert "DeprecationWarning" in str(w[-1].message)
 
 
+def test_startup_profiler(tmpdir):
+    import subprocess
+    import sys
+    filename = str(tmpdir.join('profile.txt'))
+    env = dict(os.environ, PYMOR_PROFILE_STARTUP=filename)
+    subprocess.check_call([sys.executable, '-c', 'import pymor.core.interfaces'], env=env)
+    report = open(filename).read()
+    for title in ('Module imports', 'Class creation', 'Defaults registration'):
+        assert title in report
+    assert 'pymor.core.interfaces' in report and 'ImmutableInterface' in report
+
+
+def test_import_does_not_initialize_mpi():
+    import subprocess
+    import sys
+    from pymor.tools.mpi import _LAUNCHER_VARIABLES
+    env = {k: v for k, v in os.environ.items() if k not in _LAUNCHER_VARIABLES}
+    subprocess.check_call([sys.executable, '-c',
+                           'import sys, pymor; from pymor.tools import mpi; '
+                           'assert not mpi._initialized and not mpi.parallel; '
+                           'assert "mpi4py" not in sys.modules and "petsc4py" not in sys.modules'], env=env)
+
+
+def test_tracing(tmpdir):
+    import json
+    from pymor.core.logger import getLogger
+    from pymor.parallel.dummy import dummy_pool
+    from pymor.tools.tracing import tracing, trace_summary
+    logger = getLogger('pymortests.tools.tracing')
+    filename = str(tmpdir.join('trace.json'))
+    with logger.block('not traced'):
+        pass
+    with tracing(filename, pool=dummy_pool) as spans:
+        for i in range(2):
+            with logger.block('outer {}', i):
+                with logger.block('inner'):
+                    np.ones(1000).sum()
+    assert [s['name'] for s in spans] == ['inner', 'outer 0', 'inner', 'outer 1']
+    outer, inner = spans[1], spans[0]
+    assert outer['ts'] <= inner['ts'] and inner['ts'] + inner['dur'] <= outer['ts'] + outer['dur']
+    assert trace_summary(spans)[(0, 'inner')]['count'] == 2
+    events = json.load(open(filename))['traceEvents']
+    assert [e['name'] for e in events if e['ph'] == 'X'] == [s['name'] for s in spans]
+
+
 if __name__ == "__main__":
     runmodule(filename=__file__)
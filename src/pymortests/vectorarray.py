@@ -998,3 +998,136 @@ def test_pairwise_dot_wrong_ind(compatible_vector_array_pair):
 
 def test_pickle(picklable_vector_array):
     assert_picklable_without_dumps_function(picklable_vector_array)
+
+
+def test_list_vector_space_bulk_operations():
+    from pymor.vectorarrays.list import ListVectorSpace, NumpyListVectorSpace
+    space = NumpyListVectorSpace(7)
+    np.random.seed(0)
+    U = space.from_data(np.random.random((5, 7)))
+    V = space.from_data(np.random.random((3, 7)))
+    coefficients = np.random.random((4, 5))
+    assert np.allclose(U.dot(V), ListVectorSpace.dot_vectors(space, U._list, V._list))
+    assert np.allclose(U.gramian(), ListVectorSpace.gramian_vectors(space, U._list))
+    assert np.allclose(U.lincomb(coefficients).data,
+                       [v.data for v in ListVectorSpace.lincomb_vectors(space, U._list, coefficients)])
+    assert np.allclose(U.lincomb(coefficients).data, coefficients.dot(U.data))
+    assert U[:0].dot(V).shape == (0, 3)
+    assert U[:0].lincomb(np.zeros((2, 0))).data.shape == (2, 7)
+
+
+def test_memmap_vector_array_file(tmpdir):
+    from pymor.vectorarrays.memmap import MemmapVectorSpace
+    np.random.seed(7)
+    data = np.random.random((20, 50))
+    space = MemmapVectorSpace(50, directory=str(tmpdir), block_size=512)
+    U = space.from_data(data)
+    filename = str(tmpdir.join('U.npy'))
+    U[::2].save(filename)
+
+    V = space.from_file(filename)
+    assert np.all(V.data == data[::2])
+    W = V.copy()
+    W.scal(2.)
+    assert np.all(V.data == data[::2])
+    assert np.all(np.load(filename) == data[::2])
+
+    coefficients = np.random.random((3, 20))
+    assert np.allclose(U.gramian(), data.dot(data.T))
+    assert np.allclose(U[1:].dot(U[:4]), data[1:].dot(data[:4].T))
+    assert np.allclose(U.lincomb(coefficients).data, coefficients.dot(data))
+    assert np.allclose(U.l2_norm(), np.linalg.norm(data, axis=1))
+
+
+def test_numpy_vector_space_dtype():
+    from pymor.vectorarrays.numpy import NumpyVectorSpace
+    from pymor.core.cache import estimate_size
+    space = NumpyVectorSpace(20, dtype=np.float32)
+    assert space == NumpyVectorSpace(20, dtype=np.float32)
+    assert space != NumpyVectorSpace(20)
+    assert hash(space) == hash(NumpyVectorSpace(20, dtype='float32'))
+    np.random.seed(3)
+    U = space.from_data(np.random.random((5, 20)))
+    V = space.from_data(np.random.random((5, 20)))
+    assert U.data.dtype == np.float32
+    assert U not in NumpyVectorSpace(20)
+    assert estimate_size(U) == U.data.nbytes
+    W = NumpyVectorSpace.from_data(np.ones((5, 20)) * 1j)
+    assert estimate_size(W) == estimate_size(W[[0, 1, 2, 3, 4]]) == W.data.nbytes == 5 * 20 * 16
+    assert space.zeros(2).data.dtype == np.float32
+    U.scal(np.float64(0.5))
+    U.axpy(2., V)
+    U.append(V)
+    assert U.data.dtype == np.float32
+    assert U.lincomb(np.ones(10)).data.dtype == np.float32
+    assert np.allclose(U.pairwise_dot(U), U.l2_norm2())
+    assert U.pairwise_dot(U).dtype == np.float32
+    assert space.from_data(np.ones((1, 20)) * 1j).data.dtype == np.complex64
+
+
+def test_numpy_gramian():
+    from pymor.vectorarrays.numpy import NumpyVectorSpace
+    np.random.seed(0)
+    for dtype in (np.float32, np.float64, np.complex128):
+        U = NumpyVectorSpace.from_data(np.random.random((20, 50)).astype(dtype))
+        for ind in (slice(None), [3, 1, 1, 7], slice(2, 17, 3)):
+            G = U[ind].gramian()
+            assert G.dtype == U.data.dtype
+            assert np.allclose(G, U[ind].dot(U[ind]), rtol=1e-5)
+            assert np.allclose(G, G.T.conj())
+
+
+def test_numpy_append_reallocations():
+    from pymor.vectorarrays.numpy import NumpyVectorSpace
+    from pymor.core.pickle import dumps, loads
+    space = NumpyVectorSpace(3)
+    U = space.empty()
+    v = space.from_data(np.ones(3))
+    reallocations = 0
+    for i in range(10000):
+        array = U._array
+        U.append(v * i)
+        reallocations += U._array is not array
+    assert reallocations < 30
+    assert np.all(U.data == np.arange(10000)[:, np.newaxis])
+
+    U.shrink_to_fit()
+    assert U._array.shape[0] == len(U) == 10000
+    assert np.all(U.data == np.arange(10000)[:, np.newaxis])
+
+    W = space.empty()
+    W.append(v)
+    W.append(v, growth_factor=4)
+    assert W._array.shape[0] == 4
+    assert np.all(loads(dumps(W)).data == W.data)
+    assert loads(dumps(W))._array.shape[0] == 2
+
+
+def test_numpy_append_shrink_to_fit_copy():
+    from pymor.vectorarrays.numpy import NumpyVectorSpace
+    space = NumpyVectorSpace(3)
+    U = space.zeros(2, reserve=10)
+    V = U.copy()
+    U.shrink_to_fit()
+    U.scal(2.)
+    V.append(space.from_data(np.ones(3)))
+    assert len(U) == 2 and len(V) == 3
+    assert U._array.shape[0] == 2 and V._array.shape[0] == 10
+
+
+def test_numpy_append_amortized_growth():
+    from pymor.vectorarrays.numpy import NumpyVectorSpace
+    space = NumpyVectorSpace(3)
+    U = space.empty()
+    v = space.from_data(np.ones(3))
+    copied = 0
+    for _ in range(10000):
+        capacity = len(U._array)
+        U.append(v)
+        if len(U._array) != capacity:
+            # the capacity grows geometrically ...
+            assert len(U._array) >= int(1.5 * capacity)
+            copied += len(U) - 1
+        assert len(U) <= len(U._array) <= 1.5 * len(U) + 1
+    # ... such that appending n vectors copies only O(n) vectors
+    assert copied < 3 * len(U)